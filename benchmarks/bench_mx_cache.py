@@ -0,0 +1,84 @@
+"""
+Benchmark: MXChecker lookup cost on cache hits, cache misses and snapshot hits.
+
+DNS is answered by an in-process fake DNS transport, so a miss measures the
+checker's own overhead (deadline, metrics, answer parsing) without network
+latency.
+
+Usage:
+    python -m benchmarks.bench_mx_cache [--size 200000]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from typing import Dict
+
+from benchmarks.fakes import FakeDNSTransport, domains
+from src.dns.mx_checker import MXChecker
+from src.dns.mx_snapshot import MXSnapshot
+
+# Distinct domains looked up repeatedly in the hit case
+HOT_DOMAINS = 1_000
+
+
+def run(size: int = 200_000) -> Dict[str, float]:
+    """
+    Run benchmark.
+
+    Args:
+        size: Number of lookups per case
+
+    Returns:
+        Mapping of metric name to lookups per second
+    """
+    hot = domains(HOT_DOMAINS)
+    cold = domains(size, prefix="cold")
+    snapshot = MXSnapshot({domain: ([f"mx1.{domain}"], float("inf")) for domain in hot})
+
+    metrics = {}
+    # Per-lookup debug/info lines would dominate the measurement
+    logging.disable(logging.CRITICAL)
+    try:
+        checker = MXChecker(enable_cache=True, transport=FakeDNSTransport())
+        start = time.perf_counter()
+        for domain in cold:
+            checker.get_mx_records(domain)
+        metrics["mx_cache_miss_per_sec"] = size / (time.perf_counter() - start)
+
+        for domain in hot:
+            checker.get_mx_records(domain)
+        start = time.perf_counter()
+        for i in range(size):
+            checker.get_mx_records(hot[i % HOT_DOMAINS])
+        metrics["mx_cache_hit_per_sec"] = size / (time.perf_counter() - start)
+
+        checker = MXChecker(enable_cache=True, snapshot=snapshot, transport=FakeDNSTransport())
+        start = time.perf_counter()
+        for i in range(size):
+            checker.get_mx_records(hot[i % HOT_DOMAINS])
+        metrics["mx_snapshot_hit_per_sec"] = size / (time.perf_counter() - start)
+    finally:
+        logging.disable(logging.NOTSET)
+    return metrics
+
+
+def main() -> int:
+    """
+    Run benchmark from the command line.
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(description="Benchmark MXChecker cache hit/miss cost")
+    parser.add_argument("--size", type=int, default=200_000, help="Lookups per case (default: 200000)")
+    args = parser.parse_args()
+
+    for name, value in run(args.size).items():
+        print(f"{name:40s} {value:>12,.0f}/s  {1_000_000 / value:>8.2f}us per lookup")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
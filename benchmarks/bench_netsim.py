@@ -0,0 +1,103 @@
+"""
+Benchmark: end-to-end verify_bulk against the local network simulator.
+
+Real DNS and SMTP traffic goes to the stub servers of src.netsim on
+localhost, so runs are repeatable without network access.
+
+Usage:
+    python -m benchmarks.bench_netsim [--size 100000] [--scenario scenario.json]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+from src.netsim.scenario import Scenario
+from src.netsim.simulator import NetworkSimulator
+
+# Address mix over DEFAULT_SCENARIO domains (tarpit/dnsdrop excluded: they
+# only measure timeouts)
+MIX = (
+    ("user{n}@ok.sim", 50),
+    ("nobody{n}@ok.sim", 15),
+    ("x{n}@reject.sim", 5),
+    ("x{n}@catchall.sim", 10),
+    ("user{n}@greylist.sim", 5),
+    ("x{n}@nx.sim", 5),
+    ("x{n}@nomx.sim", 5),
+    ("not-an-email-{n}", 5),
+)
+
+
+def generate_emails(size: int, seed: int = 42) -> List[str]:
+    """
+    Generate a repeatable address list for the default scenario.
+
+    Args:
+        size: Number of addresses
+        seed: RNG seed
+
+    Returns:
+        List of email addresses
+    """
+    rng = random.Random(seed)
+    patterns = [pattern for pattern, _ in MIX]
+    weights = [weight for _, weight in MIX]
+    return [pattern.format(n=n) for n, pattern in enumerate(rng.choices(patterns, weights, k=size))]
+
+
+def run(size: int = 10_000, scenario: Optional[Scenario] = None) -> Dict[str, float]:
+    """
+    Run benchmark.
+
+    Args:
+        size: Number of addresses
+        scenario: Simulator scenario (default: DEFAULT_SCENARIO)
+
+    Returns:
+        Mapping of metric name to addresses per second
+    """
+    from src.main import EmailVerificationService
+
+    emails = generate_emails(size)
+    # Per-address log lines would dominate the measurement
+    logging.disable(logging.CRITICAL)
+    try:
+        with NetworkSimulator(scenario) as sim:
+            sim.configure()
+            service = EmailVerificationService(mx_snapshot_path=None)
+            start = time.perf_counter()
+            results = service.verify_bulk(emails)
+            elapsed = time.perf_counter() - start
+    finally:
+        logging.disable(logging.NOTSET)
+
+    statuses = Counter(result.status.value for result in results)
+    print(", ".join(f"{status}={count}" for status, count in sorted(statuses.items())), file=sys.stderr)
+    return {"netsim_verify_bulk_per_sec": size / elapsed}
+
+
+def main() -> int:
+    """
+    Run benchmark from the command line.
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(description="Benchmark verify_bulk against the local network simulator")
+    parser.add_argument("--size", type=int, default=100_000, help="Number of addresses (default: 100000)")
+    parser.add_argument("--scenario", type=str, help="Scenario JSON file (default: built-in)")
+    args = parser.parse_args()
+
+    scenario = Scenario.load(args.scenario) if args.scenario else None
+    for name, value in run(args.size, scenario).items():
+        print(f"{name:40s} {value:>12,.0f}/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
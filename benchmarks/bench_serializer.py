@@ -0,0 +1,123 @@
+"""
+Benchmark: result serialization throughput (VerificationResult.to_dict,
+legacy json.dump vs streaming writer).
+
+Usage:
+    python -m benchmarks.bench_serializer [--size 1000000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from src.models.result import SMTPStatus, VerificationResult, VerificationStatus
+from src.output.json_writer import ResultJSONWriter, orjson
+
+
+def generate_results(size: int) -> List[VerificationResult]:
+    """
+    Generate a realistic mix of verification results.
+
+    Args:
+        size: Number of results
+
+    Returns:
+        List of VerificationResult objects
+    """
+    # One tuple per domain, as MXChecker hands out from its cache
+    gmail_mx = ("gmail-smtp-in.l.google.com", "alt1.gmail-smtp-in.l.google.com")
+    results = []
+    for i in range(size):
+        if i % 10 == 0:
+            results.append(
+                VerificationResult(
+                    email=f"user{i}@nonexistent-{i % 100}.com",
+                    status=VerificationStatus.DOMAIN_NOT_FOUND,
+                    domain=f"nonexistent-{i % 100}.com",
+                    error_message="Domain does not exist in DNS",
+                )
+            )
+        else:
+            results.append(
+                VerificationResult(
+                    email=f"user{i}@gmail.com",
+                    status=VerificationStatus.VALID,
+                    smtp_status=SMTPStatus.VERIFIED,
+                    domain="gmail.com",
+                    mx_records=gmail_mx,
+                    smtp_response="250 2.1.5 OK",
+                )
+            )
+    return results
+
+
+def _legacy_save(results: List[VerificationResult], path: str) -> None:
+    """Serialization path before the streaming writer (one document, indent=2)."""
+    output = {"total": len(results), "results": [result.to_dict() for result in results]}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+
+
+def _streaming_save(results: List[VerificationResult], path: str, fmt: str, backend: str) -> None:
+    """Serialize with ResultJSONWriter."""
+    with ResultJSONWriter(path, fmt=fmt, backend=backend) as writer:
+        writer.write_many(results)
+
+
+def run(size: int = 200_000) -> Dict[str, float]:
+    """
+    Run benchmark.
+
+    Args:
+        size: Number of results
+
+    Returns:
+        Mapping of metric name to results per second
+    """
+    results = generate_results(size)
+    cases = {
+        "serializer_legacy_json_per_sec": lambda path: _legacy_save(results, path),
+        "serializer_stream_json_per_sec": lambda path: _streaming_save(results, path, "json", "json"),
+        "serializer_stream_jsonl_per_sec": lambda path: _streaming_save(results, path, "jsonl", "json"),
+    }
+    if orjson is not None:
+        cases["serializer_stream_json_orjson_per_sec"] = lambda path: _streaming_save(results, path, "json", "orjson")
+        cases["serializer_stream_jsonl_orjson_per_sec"] = lambda path: _streaming_save(
+            results, path, "jsonl", "orjson"
+        )
+
+    start = time.perf_counter()
+    [result.to_dict() for result in results]
+    metrics = {"result_to_dict_per_sec": size / (time.perf_counter() - start)}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "results.out")
+        for name, case in cases.items():
+            start = time.perf_counter()
+            case(path)
+            metrics[name] = size / (time.perf_counter() - start)
+    return metrics
+
+
+def main() -> int:
+    """
+    Run benchmark from the command line.
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(description="Benchmark result serialization throughput")
+    parser.add_argument("--size", type=int, default=1_000_000, help="Number of results (default: 1000000)")
+    args = parser.parse_args()
+
+    for name, value in run(args.size).items():
+        print(f"{name:40s} {value:>12,.0f}/s  {1_000_000 / value:>7.2f}s per 1M")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
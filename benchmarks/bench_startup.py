@@ -0,0 +1,126 @@
+"""
+Benchmark: CLI startup time of trivial invocations.
+
+Each command is started `size` times in a fresh interpreter and the median
+wall time is reported; `--importtime` additionally prints the heaviest
+top-level imports (from `python -X importtime`) for each command.
+
+Usage:
+    python -m benchmarks.bench_startup [--size 20] [--importtime]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMMANDS = {
+    "startup_python_ms": ["-c", "pass"],
+    "startup_main_help_ms": ["-m", "src.main", "--help"],
+    "startup_telegram_help_ms": ["-m", "src.telegram.telegram_sender", "--help"],
+    "startup_telegram_no_token_ms": ["-m", "src.telegram.telegram_sender", "--test"],
+}
+
+
+def _env() -> Dict[str, str]:
+    """Environment for child interpreters (repo on path, no token)."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = ROOT_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    env.pop("TELEGRAM_BOT_TOKEN", None)
+    return env
+
+
+def time_command(args: List[str], repeat: int) -> float:
+    """
+    Measure median wall time of a command.
+
+    Args:
+        args: Interpreter arguments
+        repeat: Number of launches
+
+    Returns:
+        Median wall time in milliseconds
+    """
+    env = _env()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable] + args, cwd=ROOT_DIR, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def import_profile(args: List[str], limit: int = 10) -> List[Tuple[str, int]]:
+    """
+    Get the heaviest top-level imports of a command.
+
+    Args:
+        args: Interpreter arguments
+        limit: Number of modules to return
+
+    Returns:
+        (module, cumulative microseconds) pairs, heaviest first
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime"] + args, cwd=ROOT_DIR, env=_env(),
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    modules = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented below their importer
+        if name.startswith("  "):
+            continue
+        modules.append((name.strip(), int(cumulative)))
+    modules.sort(key=lambda item: item[1], reverse=True)
+    return modules[:limit]
+
+
+def run(size: int = 20) -> Dict[str, float]:
+    """
+    Run benchmark.
+
+    Args:
+        size: Launches per command
+
+    Returns:
+        Mapping of metric name to median milliseconds
+    """
+    return {name: time_command(args, size) for name, args in COMMANDS.items()}
+
+
+def main() -> int:
+    """
+    Run benchmark from the command line.
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup time")
+    parser.add_argument("--size", type=int, default=20, help="Launches per command (default: 20)")
+    parser.add_argument("--importtime", action="store_true", help="Show heaviest imports per command")
+    args = parser.parse_args()
+
+    for name, value in run(args.size).items():
+        print(f"{name:40s} {value:>8.1f} ms")
+
+    if args.importtime:
+        for name, command in COMMANDS.items():
+            print(f"\n{' '.join(command)}:")
+            for module, cumulative in import_profile(command):
+                print(f"   {module:40s} {cumulative / 1000:>8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
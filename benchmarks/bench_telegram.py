@@ -0,0 +1,87 @@
+"""
+Benchmark: TelegramClient request throughput against the local stub Bot API.
+
+Measures the client side of sendMessage (request building, session reuse,
+response parsing) over loopback HTTP, sequentially and as a concurrent
+broadcast to many chats through a stub that answers with a small latency.
+
+Usage:
+    python -m benchmarks.bench_telegram [--size 2000]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from typing import Dict
+
+from src.netsim.bot_api_server import StubBotAPIServer
+from src.netsim.scenario import Scenario
+
+TOKEN = "123456:bench"
+TEXT = "Email verification report\n" + "user@example.com: valid\n" * 40
+
+# Broadcast: per-request latency of the stub and chats served concurrently
+BROADCAST_LATENCY = 0.005  # seconds
+BROADCAST_WORKERS = 8
+
+
+def run(size: int = 1_000) -> Dict[str, float]:
+    """
+    Run benchmark.
+
+    Args:
+        size: Number of messages
+
+    Returns:
+        Mapping of metric name to messages per second
+    """
+    from src.telegram.telegram_client import TelegramClient
+
+    logging.disable(logging.CRITICAL)
+    try:
+        with StubBotAPIServer() as server, TelegramClient(TOKEN, api_url=server.url) as client:
+            client.send_message("1", "warm-up")
+            start = time.perf_counter()
+            for _ in range(size):
+                success, error = client.send_message("1", TEXT)
+                if not success:
+                    raise RuntimeError(f"Stub Bot API request failed: {error}")
+            sequential = time.perf_counter() - start
+
+        chats = [str(chat_id) for chat_id in range(1, size + 1)]
+        scenario = Scenario({"bot_api": {"latency": BROADCAST_LATENCY}})
+        with StubBotAPIServer(scenario) as server, TelegramClient(
+            TOKEN, api_url=server.url, pool_size=BROADCAST_WORKERS
+        ) as client:
+            start = time.perf_counter()
+            for chat_id, sent, error in client.broadcast(chats, [TEXT], workers=BROADCAST_WORKERS):
+                if error is not None:
+                    raise RuntimeError(f"Stub Bot API request failed: {error}")
+            broadcast = time.perf_counter() - start
+    finally:
+        logging.disable(logging.NOTSET)
+    return {
+        "telegram_send_message_per_sec": size / sequential,
+        "telegram_broadcast_per_sec": size / broadcast,
+    }
+
+
+def main() -> int:
+    """
+    Run benchmark from the command line.
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(description="Benchmark TelegramClient against the local stub Bot API")
+    parser.add_argument("--size", type=int, default=2_000, help="Number of messages (default: 2000)")
+    args = parser.parse_args()
+
+    for name, value in run(args.size).items():
+        print(f"{name:40s} {value:>12,.0f}/s  {1000 / value:>8.2f}ms per message")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+In-process fakes of the network layers used by the benchmarks.
+
+They answer instantly from fixed rules, so a benchmark measures the code
+around the network calls rather than the network.
+"""
+
+from typing import List, Optional, Tuple
+
+import dns.name
+import dns.resolver
+
+
+class FakeMX:
+    """MX rdata with the attributes MXChecker reads."""
+
+    __slots__ = ("preference", "exchange")
+
+    def __init__(self, preference: int, exchange: str):
+        self.preference = preference
+        self.exchange = dns.name.from_text(exchange)
+
+
+class FakeDNSTransport:
+    """
+    Stand-in for the DNS transport of MXChecker.
+
+    Domains starting with "nx" do not exist, domains starting with "nomx"
+    have an A record but no MX; every other domain has two MX hosts.
+    """
+
+    def __init__(self):
+        self.queries = 0
+
+    def resolve(self, domain: str, rdtype: str, lifetime: Optional[float] = None):
+        """Answer one query from the fixed rules."""
+        self.queries += 1
+        if domain.startswith("nx"):
+            raise dns.resolver.NXDOMAIN()
+        if rdtype == "MX":
+            if domain.startswith("nomx"):
+                raise dns.resolver.NoAnswer()
+            return [FakeMX(20, f"mx2.{domain}."), FakeMX(10, f"mx1.{domain}.")]
+        if rdtype == "A":
+            return ["127.0.0.1"]
+        raise dns.resolver.NoAnswer()
+
+
+class FakeSMTPVerifier:
+    """
+    Stand-in for SMTPVerifier.
+
+    Local parts starting with "user" are accepted, domains starting with
+    "catchall" accept everything, everything else is rejected with 550.
+    """
+
+    def verify_with_fallback(
+        self, email: str, mx_hosts: list, deadline=None
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Answer one RCPT from the fixed rules."""
+        local_part, _, domain = email.partition("@")
+        if local_part.startswith("user") or domain.startswith("catchall"):
+            return True, "250 2.1.5 OK", None
+        return False, "550 5.1.1 No such user", "Email rejected by server"
+
+    def is_catch_all(self, domain: str, mx_hosts: list, deadline=None) -> Optional[bool]:
+        """Catch-all verdict from the fixed rules."""
+        return domain.startswith("catchall")
+
+
+def domains(count: int, prefix: str = "domain") -> List[str]:
+    """
+    Generate distinct domain names.
+
+    Args:
+        count: Number of domains
+        prefix: Name prefix
+
+    Returns:
+        List of domain names
+    """
+    return [f"{prefix}{i}.com" for i in range(count)]
@@ -0,0 +1,215 @@
+"""
+Benchmark suite runner with baseline regression checks.
+
+Runs the benchmark modules, writes their metrics as JSON and compares them
+with a stored baseline. Metric names ending in "_ms" are lower-is-better,
+all others (throughput, "_per_sec") are higher-is-better. The run fails
+when any metric is worse than its baseline by more than --threshold percent.
+
+Usage:
+    python -m benchmarks.run [--only validator,pipeline] [--scale 0.1] [--repeat 3]
+                             [--output results.json] [--baseline baseline.json]
+                             [--threshold 15] [--save-baseline baseline.json]
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# name -> (module, size at scale 1.0)
+SUITE = {
+    "validator": ("benchmarks.bench_validator", 200_000),
+    "mx_cache": ("benchmarks.bench_mx_cache", 200_000),
+    "serializer": ("benchmarks.bench_serializer", 200_000),
+    "pipeline": ("benchmarks.bench_pipeline", 50_000),
+    "telegram": ("benchmarks.bench_telegram", 1_000),
+    "netsim": ("benchmarks.bench_netsim", 2_000),
+    "startup": ("benchmarks.bench_startup", 10),
+}
+
+DEFAULT_THRESHOLD = 15.0  # percent
+
+
+def lower_is_better(name: str) -> bool:
+    """
+    Tell the direction of a metric from its name.
+
+    Args:
+        name: Metric name
+
+    Returns:
+        True for latencies ("_ms"), False for throughputs
+    """
+    return name.endswith("_ms")
+
+
+def run_suite(names: List[str], scale: float = 1.0, repeat: int = 1) -> Dict[str, float]:
+    """
+    Run benchmark modules and keep the best value of each metric.
+
+    Args:
+        names: Keys of SUITE to run
+        scale: Multiplier for the default sizes
+        repeat: Runs per module (best value wins, which filters out noise)
+
+    Returns:
+        Mapping of metric name to value
+    """
+    metrics: Dict[str, float] = {}
+    for name in names:
+        module_name, size = SUITE[name]
+        module = importlib.import_module(module_name)
+        size = max(1, int(size * scale))
+        print(f"[{name}] size={size} repeat={repeat}", file=sys.stderr)
+        for _ in range(repeat):
+            for metric, value in module.run(size).items():
+                best = metrics.get(metric)
+                if best is None or (value < best if lower_is_better(metric) else value > best):
+                    metrics[metric] = value
+    return metrics
+
+
+def compare(
+    metrics: Dict[str, float], baseline: Dict[str, float], threshold: float
+) -> List[Tuple[str, float, float, float, bool]]:
+    """
+    Compare metrics with a baseline.
+
+    Args:
+        metrics: Current metric values
+        baseline: Baseline metric values
+        threshold: Allowed slowdown in percent
+
+    Returns:
+        List of (name, baseline, current, change in percent, regressed) for
+        metrics present in both; a positive change is an improvement
+    """
+    rows = []
+    for name in sorted(metrics.keys() & baseline.keys()):
+        base, current = baseline[name], metrics[name]
+        if base <= 0:
+            continue
+        change = (current - base) / base * 100
+        if lower_is_better(name):
+            change = -change
+        rows.append((name, base, current, change, change < -threshold))
+    return rows
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """
+    Load a results file written by this runner.
+
+    Args:
+        path: Path to JSON results file
+
+    Returns:
+        Results document ("metrics" maps metric name to value)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+    if not isinstance(document.get("metrics"), dict):
+        raise ValueError("no metrics in results file")
+    return document
+
+
+def write_results(path: str, metrics: Dict[str, float], scale: float, repeat: int) -> None:
+    """
+    Write metrics with run metadata as JSON.
+
+    Args:
+        path: Output file path
+        metrics: Metric values
+        scale: Size multiplier of the run
+        repeat: Runs per module
+    """
+    document = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "repeat": repeat,
+        "metrics": metrics,
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the suite from the command line.
+
+    Returns:
+        Exit code (1 if a metric regressed beyond the threshold)
+    """
+    parser = argparse.ArgumentParser(description="Run benchmarks and check them against a baseline")
+    parser.add_argument(
+        "--only", type=str, help=f"Comma-separated benchmarks to run (default: all of {', '.join(SUITE)})"
+    )
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier for benchmark sizes (default: 1.0)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark, best kept (default: 3)")
+    parser.add_argument("--output", type=str, help="Write results as JSON to this file")
+    parser.add_argument("--baseline", type=str, help="Compare with results stored in this file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Allowed slowdown against the baseline in percent (default: {DEFAULT_THRESHOLD:g})",
+    )
+    parser.add_argument("--save-baseline", type=str, help="Store results as the new baseline in this file")
+    args = parser.parse_args(argv)
+
+    names = [name.strip() for name in args.only.split(",")] if args.only else list(SUITE)
+    unknown = [name for name in names if name not in SUITE]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = load_results(args.baseline)
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"Cannot read baseline {args.baseline}: {e}", file=sys.stderr)
+            return 2
+
+    if baseline is not None and baseline.get("scale") != args.scale:
+        print(
+            f"Warning: baseline was recorded with --scale {baseline.get('scale')}, this run uses {args.scale:g}",
+            file=sys.stderr,
+        )
+
+    metrics = run_suite(names, args.scale, max(1, args.repeat))
+    for name, value in sorted(metrics.items()):
+        print(f"{name:40s} {value:>14,.2f}")
+
+    if args.output:
+        write_results(args.output, metrics, args.scale, args.repeat)
+    if args.save_baseline:
+        write_results(args.save_baseline, metrics, args.scale, args.repeat)
+        print(f"Baseline saved to {args.save_baseline}", file=sys.stderr)
+
+    if baseline is None:
+        return 0
+
+    rows = compare(metrics, baseline["metrics"], args.threshold)
+    print(f"\nAgainst baseline {args.baseline} (threshold {args.threshold:g}%):")
+    for name, base, current, change, regressed in rows:
+        mark = "REGRESSION" if regressed else "ok"
+        print(f"{name:40s} {base:>14,.2f} -> {current:>14,.2f}  {change:>+7.1f}%  {mark}")
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
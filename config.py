@@ -2,18 +2,66 @@
 Configuration module for email verification settings.
 """
 
+import os
+
 # SMTP Configuration
 SMTP_TIMEOUT = 10  # seconds
 SMTP_PORT = 25
 SMTP_FROM_EMAIL = "verify@example.com"  # Used for MAIL FROM command
+SMTP_IDENTITIES = None  # sending identities rotated across probes, None = one default identity, or list like
+# [{"source_address": "192.0.2.10", "helo": "mx1.example.com", "from_email": "verify@example.com", "rate": 2}]
+SMTP_IDENTITY_RATE = 0  # probes/s per identity that sets no "rate", 0 = unlimited
+SMTP_IDENTITY_MAX_FAILURES = 5  # identity refusals in a row (blocked, throttled) before a cooldown
+SMTP_IDENTITY_COOLDOWN = 300  # seconds a refused identity is skipped
+ENABLE_CATCH_ALL_DETECTION = True  # Probe each domain once with a random address
+CATCH_ALL_CACHE_TTL = 6 * 3600  # seconds a catch-all verdict is reused (inconclusive probes are not cached)
+CATCH_ALL_CACHE_SIZE = 100_000  # domains kept in memory, least recently used evicted first
 
 # DNS Configuration
 DNS_TIMEOUT = 5  # seconds
 DNS_NAMESERVERS = None  # None = use system default, or list like ['8.8.8.8', '8.8.4.4']
+DNS_PORT = 53  # port of DNS_NAMESERVERS (e.g. the local network simulator)
+MX_SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "mx_snapshot.json")  # None = disabled
+MX_SNAPSHOT_REFRESH_INTERVAL = 0  # seconds between background refreshes, 0 = never
+MX_SNAPSHOT_REFRESH_TTL = 7 * 24 * 3600  # seconds a refreshed snapshot entry stays valid
+
+# Deadline Configuration
+EMAIL_DEADLINE = None  # seconds per email (DNS + all SMTP attempts), None = unlimited
+BATCH_DEADLINE = None  # seconds per verify_bulk job, None = unlimited
+
+# Domain Index Configuration
+DOMAIN_INDEX_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "domains")  # None = disabled
+DOMAIN_INDEX_REJECT = ("disposable", "blocked")  # categories rejected before DNS, others only flagged
 
 # Logging Configuration
 LOG_LEVEL = "INFO"  # DEBUG, INFO, WARNING, ERROR, CRITICAL
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_ASYNC = True  # Format and write log records on a background thread
+LOG_JSON = False  # One JSON object per log line instead of LOG_FORMAT
+LOG_RATE_LIMIT = 0  # Max records/s per call site, 0 = unlimited (ERROR and above never dropped)
+LOG_RATE_BURST = 50  # Records allowed in a burst per call site
+
+# Metrics Configuration
+METRICS_FILE = None  # Prometheus text file written during runs, None = disabled
+METRICS_INTERVAL = 15  # seconds between metrics file writes
+
+# Telegram Report Configuration
+TELEGRAM_REPORT_CHAT = None  # chat ID for the live progress message, None = disabled
+TELEGRAM_REPORT_INTERVAL = 10  # seconds between edits of the progress message
 
 # Cache Configuration
 ENABLE_MX_CACHE = True  # Cache MX records by domain in memory
+
+# Result Cache Configuration
+RESULT_CACHE_PATH = None  # SQLite file for persistent verdicts, None = disabled
+RESULT_CACHE_TTL = {  # seconds to reuse a verdict, by status (0 = never cached)
+    "valid": 30 * 24 * 3600,
+    "catch_all": 3 * 24 * 3600,  # mailbox itself never checked
+    "smtp_rejected": 14 * 24 * 3600,
+    "domain_not_found": 7 * 24 * 3600,
+    "no_mx_records": 7 * 24 * 3600,
+    "smtp_unavailable": 6 * 3600,
+    "invalid_format": 0,  # format check is local and cheap
+    "deadline_exceeded": 0,  # incomplete verdict
+}
+RESULT_CACHE_BATCH_SIZE = 1000  # addresses looked up / stored per transaction in verify_bulk
@@ -2,54 +2,96 @@
 MX record resolution and caching.
 """
 
-from typing import List, Optional, Dict
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 import dns.resolver
 import dns.exception
 
 import config
+from src.dns.mx_snapshot import MXSnapshot
+from src.transport.dns_transport import LiveDNSTransport, ReplayDNSTransport
+from src.utils.deadline import Deadline, DeadlineExceeded
 from src.utils.logger import setup_logger
+from src.utils.metrics import CACHE_LOOKUPS, REGISTRY
 
 logger = setup_logger(__name__)
 
+DNS_QUERIES = REGISTRY.counter(
+    "email_verifier_dns_queries_total", "DNS queries by record type and outcome", ("type", "outcome")
+)
+DNS_QUERY_SECONDS = REGISTRY.histogram(
+    "email_verifier_dns_query_seconds", "DNS query latency by record type", ("type",)
+)
+
 
 class MXChecker:
     """
     Checks MX records for domains with in-memory caching.
+
+    Domains present in an optional MX snapshot are answered with zero DNS
+    traffic; the snapshot can be refreshed from live DNS in the background.
+    Refresh queries go through a live transport of their own, so they never
+    end up in a recorded transcript; during a replay the background refresh
+    does not run.
     """
 
-    def __init__(self, enable_cache: bool = True):
+    def __init__(self, enable_cache: bool = True, snapshot: Optional[MXSnapshot] = None, transport=None):
         """
         Initialize MX checker.
 
         Args:
             enable_cache: Whether to cache MX records by domain
+            snapshot: Optional pre-seeded MX answers for known provider domains
+            transport: DNS transport (default: LiveDNSTransport); see
+                src.transport.dns_transport for recording and replay
         """
         self.enable_cache = enable_cache
-        self._cache: Dict[str, Optional[List[str]]] = {}
-        self.resolver = dns.resolver.Resolver()
-        self.resolver.timeout = config.DNS_TIMEOUT
-        self.resolver.lifetime = config.DNS_TIMEOUT
+        self.snapshot = snapshot
+        self._cache: Dict[str, Optional[Tuple[str, ...]]] = {}
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_stop = threading.Event()
+        self.transport = transport if transport is not None else LiveDNSTransport()
+        self._refresh_transport = self.transport if transport is None else LiveDNSTransport()
 
-        if config.DNS_NAMESERVERS:
-            self.resolver.nameservers = config.DNS_NAMESERVERS
-
-    def get_mx_records(self, domain: str) -> Optional[List[str]]:
+    def get_mx_records(self, domain: str, deadline: Optional[Deadline] = None) -> Optional[Tuple[str, ...]]:
         """
         Get MX records for a domain.
 
+        Cached and snapshot answers are returned as the same tuple object
+        on every call, so results of one domain share it.
+
         Args:
             domain: Domain name to check
+            deadline: Optional budget the DNS query must fit into
 
         Returns:
-            List of MX server hostnames (sorted by priority) or None if not found
+            Tuple of MX server hostnames (sorted by priority) or None if not found
+
+        Raises:
+            DeadlineExceeded: If the budget runs out before an answer arrives
         """
+        # Check snapshot
+        if self.snapshot is not None:
+            mx_records = self.snapshot.get(domain)
+            if mx_records:
+                CACHE_LOOKUPS.inc("mx_snapshot", "hit")
+                logger.debug("Using MX snapshot for domain: %s", domain)
+                return mx_records
+            CACHE_LOOKUPS.inc("mx_snapshot", "miss")
+
         # Check cache
-        if self.enable_cache and domain in self._cache:
-            logger.debug(f"Using cached MX records for domain: {domain}")
-            return self._cache[domain]
+        if self.enable_cache:
+            if domain in self._cache:
+                CACHE_LOOKUPS.inc("mx", "hit")
+                logger.debug("Using cached MX records for domain: %s", domain)
+                return self._cache[domain]
+            CACHE_LOOKUPS.inc("mx", "miss")
 
         # Query MX records
-        mx_records = self._query_mx_records(domain)
+        mx_records = self._query_mx_records(domain, deadline)
+        if mx_records is not None:
+            mx_records = tuple(mx_records)
 
         # Cache result
         if self.enable_cache:
@@ -57,84 +99,224 @@ class MXChecker:
 
         return mx_records
 
-    def _query_mx_records(self, domain: str) -> Optional[List[str]]:
+    def _lifetime(self, deadline: Optional[Deadline]) -> float:
+        """
+        Get DNS query lifetime clamped to the remaining budget.
+
+        Args:
+            deadline: Optional budget for the query
+
+        Returns:
+            Lifetime in seconds to pass to the transport
+        """
+        if deadline is None:
+            return config.DNS_TIMEOUT
+        return deadline.clamp(config.DNS_TIMEOUT)
+
+    def _resolve(self, domain: str, rdtype: str, deadline: Optional[Deadline] = None, transport=None):
+        """
+        Send one DNS query, recording its latency and outcome.
+
+        Args:
+            domain: Domain name to query
+            rdtype: Record type (MX, A, AAAA)
+            deadline: Optional budget for the query
+            transport: DNS transport to use (default: self.transport)
+
+        Returns:
+            Answer rdata
+
+        Raises:
+            dns.exception.DNSException: As raised by the transport
+        """
+        started_at = time.perf_counter()
+        outcome = "error"
+        try:
+            answer = (transport or self.transport).resolve(domain, rdtype, lifetime=self._lifetime(deadline))
+            outcome = "ok"
+            return answer
+        except dns.resolver.NXDOMAIN:
+            outcome = "nxdomain"
+            raise
+        except dns.resolver.NoAnswer:
+            outcome = "no_answer"
+            raise
+        except dns.resolver.Timeout:
+            outcome = "timeout"
+            raise
+        finally:
+            DNS_QUERY_SECONDS.observe(time.perf_counter() - started_at, rdtype)
+            DNS_QUERIES.inc(rdtype, outcome)
+
+    def _query_mx_records(
+        self, domain: str, deadline: Optional[Deadline] = None, transport=None
+    ) -> Optional[List[str]]:
         """
         Query MX records from DNS.
 
         Args:
             domain: Domain name to query
+            deadline: Optional budget for the query
+            transport: DNS transport to use (default: self.transport)
 
         Returns:
             List of MX server hostnames or None if not found
+
+        Raises:
+            DeadlineExceeded: If the budget runs out before an answer arrives
         """
+        if deadline:
+            deadline.check(f"MX lookup for {domain}")
+
         try:
-            logger.debug(f"Querying MX records for domain: {domain}")
-            answers = self.resolver.resolve(domain, "MX")
+            logger.debug("Querying MX records for domain: %s", domain)
+            answers = self._resolve(domain, "MX", deadline, transport)
 
             # Sort by priority (lower is better) and extract hostnames
             mx_records = sorted(answers, key=lambda x: x.preference)
             mx_hosts = [str(mx.exchange).rstrip(".") for mx in mx_records]
 
             if mx_hosts:
-                logger.info(f"Found {len(mx_hosts)} MX record(s) for {domain}: {mx_hosts}")
+                logger.debug("Found %s MX record(s) for %s: %s", len(mx_hosts), domain, mx_hosts)
                 return mx_hosts
             else:
-                logger.warning(f"No MX records found for domain: {domain}")
+                logger.warning("No MX records found for domain: %s", domain)
                 return None
 
         except dns.resolver.NoAnswer:
-            logger.warning(f"No MX records in DNS response for domain: {domain}")
+            logger.warning("No MX records in DNS response for domain: %s", domain)
             return None
 
         except dns.resolver.NXDOMAIN:
-            logger.warning(f"Domain does not exist: {domain}")
+            logger.warning("Domain does not exist: %s", domain)
             return None
 
         except dns.resolver.Timeout:
-            logger.error(f"DNS timeout while querying MX records for domain: {domain}")
+            if deadline and deadline.expired():
+                # Budget ran out, not the domain - do not cache a negative answer
+                raise DeadlineExceeded(f"Deadline exceeded during MX lookup for {domain}")
+            logger.error("DNS timeout while querying MX records for domain: %s", domain)
             return None
 
         except dns.exception.DNSException as e:
-            logger.error(f"DNS error while querying MX records for {domain}: {e}")
+            logger.error("DNS error while querying MX records for %s: %s", domain, e)
             return None
 
         except Exception as e:
-            logger.error(f"Unexpected error while querying MX records for {domain}: {e}")
+            logger.error("Unexpected error while querying MX records for %s: %s", domain, e)
             return None
 
-    def domain_exists(self, domain: str) -> bool:
+    def domain_exists(self, domain: str, deadline: Optional[Deadline] = None) -> bool:
         """
         Check if domain exists (has any DNS records).
 
         Args:
             domain: Domain name to check
+            deadline: Optional budget the DNS queries must fit into
 
         Returns:
             True if domain exists, False otherwise
+
+        Raises:
+            DeadlineExceeded: If the budget runs out before an answer arrives
         """
+        if self.snapshot is not None and domain in self.snapshot:
+            # Snapshot domains are known to accept mail
+            return True
+
+        if deadline:
+            deadline.check(f"domain lookup for {domain}")
+
         try:
             # Try A record first
-            self.resolver.resolve(domain, "A")
+            self._resolve(domain, "A", deadline)
             return True
         except dns.resolver.NoAnswer:
             # Try AAAA record
             try:
-                self.resolver.resolve(domain, "AAAA")
+                if deadline:
+                    deadline.check(f"AAAA lookup for {domain}")
+                self._resolve(domain, "AAAA", deadline)
                 return True
             except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN, dns.exception.DNSException):
-                pass
+                if deadline and deadline.expired():
+                    raise DeadlineExceeded(f"Deadline exceeded during AAAA lookup for {domain}")
         except dns.resolver.NXDOMAIN:
-            logger.warning(f"Domain does not exist: {domain}")
+            logger.warning("Domain does not exist: %s", domain)
             return False
         except dns.exception.DNSException as e:
-            logger.error(f"DNS error while checking domain existence for {domain}: {e}")
+            if deadline and deadline.expired():
+                raise DeadlineExceeded(f"Deadline exceeded during domain lookup for {domain}")
+            logger.error("DNS error while checking domain existence for %s: %s", domain, e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error while checking domain {domain}: {e}")
+            logger.error("Unexpected error while checking domain %s: %s", domain, e)
             return False
 
         return False
 
+    def refresh_snapshot(self) -> int:
+        """
+        Re-resolve all snapshot domains and update their entries.
+
+        Domains that fail to resolve keep their current entry.
+
+        Returns:
+            Number of refreshed domains
+        """
+        if self.snapshot is None:
+            return 0
+
+        refreshed = 0
+        for domain in self.snapshot.domains():
+            if self._refresh_stop.is_set():
+                break
+            mx_records = self._query_mx_records(domain, transport=self._refresh_transport)
+            if mx_records:
+                self.snapshot.update(domain, mx_records)
+                refreshed += 1
+
+        logger.info(f"MX snapshot refreshed: {refreshed}/{len(self.snapshot)} domain(s)")
+        return refreshed
+
+    def start_snapshot_refresh(self, interval: float) -> None:
+        """
+        Refresh the snapshot periodically in a background daemon thread.
+
+        The first refresh runs immediately, so an expired bundled snapshot
+        becomes usable again as soon as DNS answers. Does nothing when the
+        checker replays a transcript: a replay must not depend on live DNS
+        answers.
+
+        Args:
+            interval: Seconds between refreshes
+        """
+        if self.snapshot is None or self._refresh_thread is not None:
+            return
+        if isinstance(self.transport, ReplayDNSTransport):
+            logger.debug("MX snapshot refresh disabled while replaying DNS")
+            return
+
+        def _run() -> None:
+            while not self._refresh_stop.is_set():
+                try:
+                    self.refresh_snapshot()
+                except Exception as e:
+                    logger.error(f"MX snapshot refresh failed: {e}")
+                self._refresh_stop.wait(interval)
+
+        self._refresh_thread = threading.Thread(target=_run, name="mx-snapshot-refresh", daemon=True)
+        self._refresh_thread.start()
+        logger.debug(f"MX snapshot refresh started (every {interval}s)")
+
+    def stop_snapshot_refresh(self) -> None:
+        """Stop the background snapshot refresh thread."""
+        self._refresh_stop.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout=1)
+            self._refresh_thread = None
+        self._refresh_stop.clear()
+
     def clear_cache(self) -> None:
         """Clear the MX records cache."""
         self._cache.clear()
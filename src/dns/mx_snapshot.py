@@ -0,0 +1,119 @@
+"""
+Pre-seeded MX answers for top mail providers.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class MXSnapshot:
+    """
+    Snapshot of MX answers for known provider domains with an expiry date.
+
+    Snapshot file format (JSON):
+        {"expires": "2027-04-18", "domains": {"gmail.com": ["gmail-smtp-in.l.google.com", ...]}}
+
+    Entries loaded from the file are valid until the file expiry date;
+    entries refreshed from live DNS are valid for refresh_ttl seconds.
+    """
+
+    def __init__(self, entries: Optional[Dict[str, Tuple[Tuple[str, ...], float]]] = None, refresh_ttl: float = 0):
+        """
+        Initialize snapshot.
+
+        Args:
+            entries: Mapping of domain to (MX hosts, expiry Unix time)
+            refresh_ttl: Seconds a refreshed entry stays valid
+        """
+        self._entries = entries or {}
+        self.refresh_ttl = refresh_ttl
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, file_path: str, refresh_ttl: float = 0) -> "MXSnapshot":
+        """
+        Load snapshot from JSON file.
+
+        Args:
+            file_path: Path to snapshot file
+            refresh_ttl: Seconds a refreshed entry stays valid
+
+        Returns:
+            MXSnapshot instance (empty if the file is missing or invalid)
+        """
+        path = Path(file_path)
+        if not path.is_file():
+            logger.warning(f"MX snapshot not found: {file_path}")
+            return cls(refresh_ttl=refresh_ttl)
+
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            expires_at = datetime.fromisoformat(data["expires"]).replace(tzinfo=timezone.utc).timestamp()
+            entries = {
+                domain.lower(): (tuple(hosts), expires_at)
+                for domain, hosts in data.get("domains", {}).items()
+                if hosts
+            }
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.error(f"Invalid MX snapshot {file_path}: {e}")
+            return cls(refresh_ttl=refresh_ttl)
+
+        if expires_at <= time.time():
+            logger.warning(f"MX snapshot {file_path} expired on {data['expires']}; waiting for refresh")
+
+        logger.debug(f"Loaded MX snapshot: {len(entries)} domain(s) from {file_path}")
+        return cls(entries, refresh_ttl=refresh_ttl)
+
+    def get(self, domain: str) -> Optional[Tuple[str, ...]]:
+        """
+        Get MX hosts for a domain if the snapshot has a valid entry.
+
+        Args:
+            domain: Domain name
+
+        Returns:
+            Tuple of MX hostnames (the same object on every call), or None
+            if missing or expired
+        """
+        entry = self._entries.get(domain)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+
+    def update(self, domain: str, mx_hosts: List[str]) -> None:
+        """
+        Replace entry with a fresh answer from DNS.
+
+        Args:
+            domain: Domain name
+            mx_hosts: MX hostnames from live DNS
+        """
+        with self._lock:
+            self._entries[domain] = (tuple(mx_hosts), time.time() + self.refresh_ttl)
+
+    def domains(self) -> List[str]:
+        """
+        Get all snapshot domains (valid or expired).
+
+        Returns:
+            List of domain names
+        """
+        with self._lock:
+            return list(self._entries)
+
+    def __contains__(self, domain: str) -> bool:
+        """Check whether the snapshot has a valid entry for a domain."""
+        return self.get(domain) is not None
+
+    def __len__(self) -> int:
+        """Get number of snapshot domains."""
+        return len(self._entries)
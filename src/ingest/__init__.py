@@ -0,0 +1,3 @@
+"""
+Input ingestion modules (streaming readers for large email lists).
+"""
@@ -0,0 +1,355 @@
+"""
+Memory-mapped, streaming reader for large line-oriented files.
+
+Files are memory-mapped and decoded in line-aligned chunks, so memory use
+stays bounded by the chunk size regardless of file size or line length
+(LF, CRLF and CR-only line endings are all recognised). A file can be
+split into byte ranges for parallel workers: a range owns every line that
+starts inside it, so any set of adjacent ranges covers each line exactly
+once, whatever the byte offsets.
+"""
+
+import csv
+import mmap
+import os
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple, Union
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+UTF8_BOM = b"\xef\xbb\xbf"
+CHUNK_SIZE = 4 * 1024 * 1024  # bytes decoded at once
+
+
+def split_ranges(path: str, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into byte ranges of roughly equal size.
+
+    Ranges do not need to fall on line boundaries; readers align them.
+
+    Args:
+        path: File path
+        parts: Number of ranges
+
+    Returns:
+        List of (start, end) byte offsets covering the whole file
+    """
+    if parts < 1:
+        raise ValueError("parts must be at least 1")
+    size = os.path.getsize(path)
+    bounds = [size * i // parts for i in range(parts + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Parse a shard specification such as "2/4" (second of four shards).
+
+    Args:
+        spec: "K/N" with 1 <= K <= N
+
+    Returns:
+        Tuple of (zero-based shard index, shard count)
+
+    Raises:
+        ValueError: If the specification is malformed
+    """
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}', expected K/N (e.g. 2/4)")
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{spec}', K must be between 1 and N")
+    return index - 1, count
+
+
+def shard_range(path: str, spec: str) -> Tuple[int, int]:
+    """
+    Get the byte range of a "K/N" shard of a file.
+
+    Args:
+        path: File path
+        spec: Shard specification (see parse_shard)
+
+    Returns:
+        Tuple of (start, end) byte offsets
+    """
+    index, count = parse_shard(spec)
+    return split_ranges(path, count)[index]
+
+
+@contextmanager
+def _mapped(path: str) -> Iterator[Optional[mmap.mmap]]:
+    """Memory-map a file read-only (None for an empty file, which cannot be mapped)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield None
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _line_end(mm: mmap.mmap, offset: int, end: int) -> int:
+    """Get offset just past the first line break inside [offset, end) (-1 if none)."""
+    newline = mm.find(b"\n", offset, end)
+    cr = mm.find(b"\r", offset, end if newline == -1 else newline)
+    if cr == -1:
+        return -1 if newline == -1 else newline + 1
+    return cr + 2 if cr + 1 < len(mm) and mm[cr + 1] == ord("\n") else cr + 1
+
+
+def _last_line_end(mm: mmap.mmap, start: int, end: int, stop: int) -> int:
+    """Get offset just past the last line break inside [start, end) (-1 if none)."""
+    newline = mm.rfind(b"\n", start, end)
+    cr = mm.rfind(b"\r", newline + 1 if newline != -1 else start, end)
+    if cr == -1:
+        return -1 if newline == -1 else newline + 1
+    # Keep a CRLF pair in one chunk
+    return cr + 2 if cr + 1 < stop and mm[cr + 1] == ord("\n") else cr + 1
+
+
+def _line_start(mm: mmap.mmap, offset: int) -> int:
+    """Get offset of the first line starting at or after offset."""
+    if offset <= 0:
+        return 0
+    if offset >= len(mm):
+        return len(mm)
+    # Search window by window so a file without LF is not scanned to its end
+    for window in range(offset - 1, len(mm), CHUNK_SIZE):
+        line_end = _line_end(mm, window, min(window + CHUNK_SIZE, len(mm)))
+        if line_end != -1:
+            return line_end
+    return len(mm)
+
+
+def _char_start(mm: mmap.mmap, pos: int, offset: int) -> int:
+    """Move offset back to the start of a UTF-8 character (but not to pos)."""
+    for back in range(min(3, offset - pos - 1) + 1):
+        if mm[offset - back] & 0xC0 != 0x80:
+            return offset - back
+    return offset
+
+
+def _iter_spans(mm: mmap.mmap, pos: int, stop: int, chunk_size: int) -> Iterator[Tuple[int, int, bool]]:
+    """
+    Split [pos, stop) into spans of at most chunk_size bytes.
+
+    Spans end after a line break when the chunk holds one; a line longer than
+    chunk_size is cut into several spans instead of being read whole.
+
+    Yields:
+        Tuples of (start, end, ends_line)
+    """
+    while pos < stop:
+        chunk_end = pos + chunk_size
+        if chunk_end >= stop:
+            yield pos, stop, True
+            return
+        line_end = _last_line_end(mm, pos, chunk_end, stop)
+        if line_end == -1:
+            chunk_end = _char_start(mm, pos, chunk_end)
+            yield pos, chunk_end, False
+        else:
+            chunk_end = line_end
+            yield pos, chunk_end, True
+        pos = chunk_end
+
+
+def _decode(mm: mmap.mmap, start: int, end: int, errors: str) -> str:
+    """Decode a span, normalizing line endings to LF."""
+    text = mm[start:end].decode("utf-8", errors)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _iter_decoded(
+    path: str,
+    start: int,
+    end: Optional[int],
+    chunk_size: int,
+    errors: str,
+) -> Iterator[Tuple[str, bool]]:
+    """Yield (text, ends_line) for each span of a byte range."""
+    with _mapped(path) as mm:
+        if mm is None:
+            return
+        pos = _line_start(mm, start)
+        stop = len(mm) if end is None else _line_start(mm, end)
+        if pos == 0 and mm[:3] == UTF8_BOM:
+            pos = 3
+        for span_start, span_end, ends_line in _iter_spans(mm, pos, stop, chunk_size):
+            yield _decode(mm, span_start, span_end, errors), ends_line
+
+
+def iter_chunks(
+    path: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    errors: str = "replace",
+) -> Iterator[str]:
+    """
+    Yield decoded text of a byte range in chunks that end on line boundaries.
+
+    The UTF-8 BOM is dropped and CRLF / CR line endings become LF. A chunk
+    never exceeds chunk_size bytes: a longer line is yielded in several
+    consecutive chunks, cut between UTF-8 characters.
+
+    Args:
+        path: File path
+        start: First byte of the range (aligned to the next line start)
+        end: End of the range (None = end of file); the line running across
+            it belongs to this range
+        chunk_size: Maximum bytes per chunk
+        errors: UTF-8 decoding error handler ("replace" or "strict")
+
+    Yields:
+        Text chunks
+    """
+    for text, _ in _iter_decoded(path, start, end, chunk_size, errors):
+        yield text
+
+
+def iter_line_batches(
+    path: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[List[str]]:
+    """
+    Yield stripped, non-empty lines of a byte range in batches (one per chunk).
+
+    Lines longer than chunk_size are skipped with a warning rather than
+    buffered, since no address or CSV row is that long.
+
+    Args:
+        path: File path
+        start: First byte of the range
+        end: End of the range (None = end of file)
+        chunk_size: Approximate bytes per batch
+
+    Yields:
+        Lists of lines
+    """
+    overlong = False
+    for text, ends_line in _iter_decoded(path, start, end, chunk_size, "replace"):
+        if not ends_line:
+            overlong = True
+            continue
+        parts = text.split("\n")
+        if overlong:
+            # The first part is the tail of the skipped line
+            logger.warning("Skipping a line longer than %d bytes in %s", chunk_size, path)
+            parts = parts[1:]
+            overlong = False
+        lines = [line for line in map(str.strip, parts) if line]
+        if lines:
+            yield lines
+
+
+def iter_lines(path: str, start: int = 0, end: Optional[int] = None) -> Iterator[str]:
+    """
+    Yield stripped, non-empty lines of a byte range.
+
+    Args:
+        path: File path
+        start: First byte of the range
+        end: End of the range (None = end of file)
+
+    Yields:
+        Lines
+    """
+    for lines in iter_line_batches(path, start, end):
+        yield from lines
+
+
+def _column_index(path: str, column: Union[str, int], delimiter: str) -> int:
+    """Resolve a column name against the header row."""
+    if isinstance(column, int):
+        return column
+    for text in iter_chunks(path, chunk_size=64 * 1024):
+        header = next(csv.reader([text.split("\n", 1)[0]], delimiter=delimiter))
+        names = [name.strip().lower() for name in header]
+        if column.strip().lower() not in names:
+            raise ValueError(f"Column '{column}' not found in CSV header: {', '.join(header)}")
+        return names.index(column.strip().lower())
+    raise ValueError(f"CSV file is empty: {path}")
+
+
+def iter_csv_column(
+    path: str,
+    column: Union[str, int],
+    start: int = 0,
+    end: Optional[int] = None,
+    delimiter: str = ",",
+) -> Iterator[str]:
+    """
+    Yield stripped, non-empty values of one CSV column.
+
+    Quoted fields must not contain line breaks (ranges are split on lines).
+
+    Args:
+        path: File path
+        column: Header name (case-insensitive; the header row is skipped) or
+            zero-based index (every row is data)
+        start: First byte of the range
+        end: End of the range (None = end of file)
+        delimiter: Field delimiter
+
+    Yields:
+        Column values
+
+    Raises:
+        ValueError: If a named column is not in the header
+    """
+    index = _column_index(path, column, delimiter)
+    with _mapped(path) as mm:
+        skip_header = isinstance(column, str) and (mm is None or _line_start(mm, start) == 0)
+
+    for lines in iter_line_batches(path, start, end):
+        rows = csv.reader(lines, delimiter=delimiter)
+        if skip_header:
+            next(rows, None)
+            skip_header = False
+        for row in rows:
+            if index < len(row):
+                value = row[index].strip()
+                if value:
+                    yield value
+
+
+def count_lines(path: str, start: int = 0, end: Optional[int] = None) -> int:
+    """
+    Count lines of a byte range without decoding them.
+
+    Used to size progress output, so blank lines are counted too.
+
+    Args:
+        path: File path
+        start: First byte of the range
+        end: End of the range (None = end of file)
+
+    Returns:
+        Number of lines
+    """
+    with _mapped(path) as mm:
+        if mm is None:
+            return 0
+        pos = _line_start(mm, start)
+        stop = len(mm) if end is None else _line_start(mm, end)
+        count = 0
+        for offset in range(pos, stop, CHUNK_SIZE):
+            block_end = min(offset + CHUNK_SIZE, stop)
+            block = mm[offset:block_end]
+            count += block.count(b"\n")
+            if b"\r" in block:
+                # CR-only breaks count too; a CRLF pair counts once
+                count += block.count(b"\r") - block.count(b"\r\n")
+                if block.endswith(b"\r") and block_end < stop and mm[block_end] == ord("\n"):
+                    count -= 1
+        if pos < stop and mm[stop - 1] not in b"\r\n":
+            count += 1
+        return count
@@ -4,81 +4,203 @@ Main entry point for email verification CLI.
 
 import argparse
 import json
+import os
 import sys
-from pathlib import Path
-from typing import List
+from dataclasses import replace
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional
 
 import config
 from src.models.result import VerificationResult, VerificationStatus, SMTPStatus
-from src.validators.email_validator import EmailValidator
-from src.dns.mx_checker import MXChecker
-from src.smtp.smtp_verifier import SMTPVerifier
-from src.utils.logger import setup_logger
+from src.utils.deadline import Deadline, DeadlineExceeded, set_clock
+from src.utils.logger import setup_logger, time_logging
+from src.utils.metrics import CACHE_LOOKUPS, REGISTRY, STAGE_SECONDS, MetricsFileWriter, stage_table, timed
+
+# Components pulling in dnspython, smtplib, sqlite3 or orjson are imported
+# where they are used, so --help and argument errors return immediately.
+if TYPE_CHECKING:
+    from src.output.progress import ProgressReporter
+    from src.output.summary import ResultSummary
+    from src.storage.result_store import ResultStore
 
 logger = setup_logger(__name__)
 
+RESULTS = REGISTRY.counter("email_verifier_results_total", "Verification results by status", ("status",))
+
 
 class EmailVerificationService:
     """
     Orchestrates email verification process.
     """
 
-    def __init__(self):
-        """Initialize verification service with all components."""
-        self.validator = EmailValidator()
-        self.mx_checker = MXChecker(enable_cache=config.ENABLE_MX_CACHE)
-        self.smtp_verifier = SMTPVerifier()
+    def __init__(
+        self,
+        email_deadline: Optional[float] = config.EMAIL_DEADLINE,
+        batch_deadline: Optional[float] = config.BATCH_DEADLINE,
+        result_store: Optional["ResultStore"] = None,
+        mx_snapshot_path: Optional[str] = config.MX_SNAPSHOT_PATH,
+        dns_transport=None,
+        smtp_transport=None,
+    ):
+        """
+        Initialize verification service with all components.
 
-    def verify_email(self, email: str) -> VerificationResult:
+        Args:
+            email_deadline: Budget in seconds for a single email (None = unlimited)
+            batch_deadline: Budget in seconds for a whole verify_bulk call (None = unlimited)
+            result_store: Optional persistent verdict cache; fresh verdicts are
+                returned without re-verification
+            mx_snapshot_path: Optional MX snapshot file for known provider domains
+            dns_transport: DNS transport for MXChecker (default: live DNS)
+            smtp_transport: SMTP transport for SMTPVerifier (default: live SMTP)
+        """
+        from src.dns.mx_checker import MXChecker
+        from src.dns.mx_snapshot import MXSnapshot
+        from src.smtp.smtp_verifier import SMTPVerifier
+        from src.validators.domain_index import DomainIndex
+        from src.validators.email_validator import EmailValidator
+
+        self.validator = EmailValidator()
+        self.domain_index = DomainIndex.load(config.DOMAIN_INDEX_DIR) if config.DOMAIN_INDEX_DIR else None
+        snapshot = (
+            MXSnapshot.load(mx_snapshot_path, refresh_ttl=config.MX_SNAPSHOT_REFRESH_TTL)
+            if mx_snapshot_path
+            else None
+        )
+        self.mx_checker = MXChecker(enable_cache=config.ENABLE_MX_CACHE, snapshot=snapshot, transport=dns_transport)
+        if snapshot is not None and config.MX_SNAPSHOT_REFRESH_INTERVAL > 0:
+            self.mx_checker.start_snapshot_refresh(config.MX_SNAPSHOT_REFRESH_INTERVAL)
+        self.smtp_verifier = SMTPVerifier(transport=smtp_transport)
+        self.email_deadline = email_deadline
+        self.batch_deadline = batch_deadline
+        self.result_store = result_store
+
+    def verify_email(self, email: str, deadline: Optional[Deadline] = None) -> VerificationResult:
         """
         Verify a single email address.
 
         Args:
             email: Email address to verify
+            deadline: Optional enclosing budget (e.g. the batch deadline);
+                the per-email budget is applied on top of it
+
+        Returns:
+            VerificationResult with status and details
+        """
+        if self.result_store is not None:
+            cached = self.result_store.get(email)
+            CACHE_LOOKUPS.inc("result_store", "hit" if cached else "miss")
+            if cached:
+                logger.debug("Using cached verdict for: %s", email)
+                RESULTS.inc(cached.status.value)
+                return replace(cached, email=email)
+
+        result = self._verify_email(email, deadline)
+        RESULTS.inc(result.status.value)
+
+        if self.result_store is not None:
+            self.result_store.put(result)
+
+        return result
+
+    def _verify_email(self, email: str, deadline: Optional[Deadline] = None) -> VerificationResult:
+        """
+        Verify a single email address without consulting the result store.
+
+        Args:
+            email: Email address to verify
+            deadline: Optional enclosing budget
 
         Returns:
             VerificationResult with status and details
         """
-        logger.info(f"Starting verification for: {email}")
+        logger.debug("Starting verification for: %s", email)
+
+        deadline = Deadline(self.email_deadline, parent=deadline)
 
         # Step 1: Validate email format
-        is_valid_format, domain = self.validator.validate_and_extract(email)
+        with timed(STAGE_SECONDS, "validation"):
+            is_valid_format, domain = self.validator.validate_and_extract(email)
         if not is_valid_format:
-            logger.warning(f"Invalid email format: {email}")
+            logger.warning("Invalid email format: %s", email)
             return VerificationResult(
                 email=email,
                 status=VerificationStatus.INVALID_FORMAT,
                 error_message="Email format is invalid",
             )
 
-        # Step 2: Check if domain exists
-        if not self.mx_checker.domain_exists(domain):
-            logger.warning(f"Domain does not exist: {domain}")
-            return VerificationResult(
-                email=email,
-                status=VerificationStatus.DOMAIN_NOT_FOUND,
-                domain=domain,
-                error_message="Domain does not exist in DNS",
-            )
+        # Step 1b: Consult static domain index (no network I/O)
+        domain_category = None
+        if self.domain_index is not None:
+            with timed(STAGE_SECONDS, "domain_index"):
+                local_part = email.strip().lower().rsplit("@", 1)[0]
+                domain_category = self.domain_index.lookup(domain, local_part)
+            if domain_category in config.DOMAIN_INDEX_REJECT:
+                logger.warning("Domain is listed as %s: %s", domain_category, domain)
+                return VerificationResult(
+                    email=email,
+                    status=VerificationStatus.BLOCKED_DOMAIN,
+                    domain=domain,
+                    error_message=f"Domain is listed as {domain_category}",
+                    domain_category=domain_category,
+                )
+
+        try:
+            with timed(STAGE_SECONDS, "dns"):
+                # Step 2: Check if domain exists
+                if not self.mx_checker.domain_exists(domain, deadline):
+                    logger.warning("Domain does not exist: %s", domain)
+                    return VerificationResult(
+                        email=email,
+                        status=VerificationStatus.DOMAIN_NOT_FOUND,
+                        domain=domain,
+                        error_message="Domain does not exist in DNS",
+                        domain_category=domain_category,
+                    )
+
+                # Step 3: Get MX records
+                mx_records = self.mx_checker.get_mx_records(domain, deadline)
+        except DeadlineExceeded as e:
+            return self._deadline_result(email, domain, str(e), domain_category=domain_category)
 
-        # Step 3: Get MX records
-        mx_records = self.mx_checker.get_mx_records(domain)
         if not mx_records:
-            logger.warning(f"No MX records found for domain: {domain}")
+            logger.warning("No MX records found for domain: %s", domain)
             return VerificationResult(
                 email=email,
                 status=VerificationStatus.NO_MX_RECORDS,
                 domain=domain,
                 error_message="No MX records found for domain",
+                domain_category=domain_category,
             )
 
         # Step 4: SMTP handshake verification
-        is_valid, smtp_response, error_message = self.smtp_verifier.verify_with_fallback(
-            email, mx_records
-        )
+        catch_all = None
+        try:
+            with timed(STAGE_SECONDS, "smtp"):
+                if config.ENABLE_CATCH_ALL_DETECTION:
+                    catch_all = self.smtp_verifier.is_catch_all(domain, mx_records, deadline)
+                    if catch_all:
+                        # Any RCPT is accepted: a handshake for this address tells nothing new,
+                        # and whether the mailbox exists stays unknown
+                        logger.debug("Email accepted by catch-all domain: %s", email)
+                        return VerificationResult(
+                            email=email,
+                            status=VerificationStatus.CATCH_ALL,
+                            smtp_status=SMTPStatus.CATCH_ALL,
+                            domain=domain,
+                            mx_records=mx_records,
+                            catch_all=True,
+                            domain_category=domain_category,
+                        )
+
+                is_valid, smtp_response, error_message = self.smtp_verifier.verify_with_fallback(
+                    email, mx_records, deadline
+                )
+        except DeadlineExceeded as e:
+            return self._deadline_result(email, domain, str(e), mx_records, domain_category)
 
         if is_valid:
-            logger.info(f"Email verification successful: {email}")
+            logger.debug("Email verification successful: %s", email)
             return VerificationResult(
                 email=email,
                 status=VerificationStatus.VALID,
@@ -86,6 +208,8 @@ class EmailVerificationService:
                 domain=domain,
                 mx_records=mx_records,
                 smtp_response=smtp_response,
+                catch_all=catch_all,
+                domain_category=domain_category,
             )
         else:
             # Determine if SMTP was unavailable or rejected the email
@@ -96,7 +220,7 @@ class EmailVerificationService:
                 status = VerificationStatus.SMTP_UNAVAILABLE
                 smtp_status = SMTPStatus.UNAVAILABLE
 
-            logger.warning(f"Email verification failed: {email} - {error_message}")
+            logger.warning("Email verification failed: %s - %s", email, error_message)
             return VerificationResult(
                 email=email,
                 status=status,
@@ -105,57 +229,196 @@ class EmailVerificationService:
                 mx_records=mx_records,
                 smtp_response=smtp_response,
                 error_message=error_message,
+                catch_all=catch_all,
+                domain_category=domain_category,
             )
 
-    def verify_bulk(self, emails: List[str]) -> List[VerificationResult]:
+    def _deadline_result(
+        self,
+        email: str,
+        domain: Optional[str],
+        error_message: str,
+        mx_records: Optional[List[str]] = None,
+        domain_category: Optional[str] = None,
+    ) -> VerificationResult:
         """
-        Verify multiple email addresses.
+        Build result for an email whose budget ran out.
 
         Args:
-            emails: List of email addresses to verify
+            email: Email address
+            domain: Extracted domain (if known)
+            error_message: Where the budget ran out
+            mx_records: MX records obtained before the budget ran out
+            domain_category: Domain index category (if flagged)
 
         Returns:
-            List of VerificationResult objects
+            VerificationResult with DEADLINE_EXCEEDED status
         """
-        results = []
-        total = len(emails)
+        logger.warning("Verification deadline exceeded: %s - %s", email, error_message)
+        return VerificationResult(
+            email=email,
+            status=VerificationStatus.DEADLINE_EXCEEDED,
+            smtp_status=SMTPStatus.UNAVAILABLE if mx_records else SMTPStatus.NOT_CHECKED,
+            domain=domain,
+            mx_records=mx_records,
+            error_message=error_message,
+            domain_category=domain_category,
+        )
+
+    def iter_verify(
+        self, emails: Iterable[str], progress: Optional["ProgressReporter"] = None
+    ) -> Iterator[VerificationResult]:
+        """
+        Verify multiple email addresses, yielding results as they are ready.
+
+        Each email gets its own budget (email_deadline) nested in the budget
+        of the whole job (batch_deadline). Once the job budget runs out, the
+        remaining emails are not checked and get DEADLINE_EXCEEDED status.
+
+        Emails are consumed in windows of RESULT_CACHE_BATCH_SIZE, so any
+        iterable (e.g. a streaming file reader) works without being loaded
+        into memory. With a result store, cached verdicts are looked up and
+        new verdicts are written once per window.
 
-        logger.info(f"Starting bulk verification for {total} email(s)")
+        Args:
+            emails: Email addresses to verify (list or any iterable)
+            progress: Optional live progress line updated per result
 
-        for idx, email in enumerate(emails, 1):
-            logger.info(f"Processing {idx}/{total}: {email}")
-            result = self.verify_email(email)
-            results.append(result)
+        Yields:
+            VerificationResult objects in input order
+        """
+        batch_deadline = Deadline(self.batch_deadline)
+        emails = iter(emails)
+        processed = 0
+        pending = []
+
+        logger.info("Starting bulk verification")
+
+        try:
+            while True:
+                window = list(islice(emails, config.RESULT_CACHE_BATCH_SIZE))
+                if not window:
+                    break
+
+                cached = {}
+                if self.result_store is not None:
+                    # Flush verdicts of the previous window, prefetch this one
+                    with timed(STAGE_SECONDS, "result_store"):
+                        self.result_store.put_many(pending)
+                        pending = []
+                        cached = self.result_store.get_many(window)
+
+                for pos, email in enumerate(window):
+                    if batch_deadline.expired():
+                        logger.warning("Batch deadline exceeded: skipping remaining email(s)")
+                        for skipped in chain(window[pos:], emails):
+                            processed += 1
+                            if progress is not None:
+                                progress.update()
+                            RESULTS.inc(VerificationStatus.DEADLINE_EXCEEDED.value)
+                            yield VerificationResult(
+                                email=skipped,
+                                status=VerificationStatus.DEADLINE_EXCEEDED,
+                                error_message="Batch deadline exceeded before verification started",
+                            )
+                        return
+
+                    result = cached.get(self.result_store.normalize(email)) if cached else None
+                    if self.result_store is not None:
+                        CACHE_LOOKUPS.inc("result_store", "miss" if result is None else "hit")
+                    if result is None:
+                        result = self._verify_email(email, batch_deadline)
+                        pending.append(result)
+                    elif result.email != email:
+                        # Report the address as given, not as stored
+                        result = replace(result, email=email)
+                    RESULTS.inc(result.status.value)
+                    processed += 1
+                    if progress is not None:
+                        progress.update()
+                    yield result
+        finally:
+            # Persist what was verified even if the consumer stopped early
+            if self.result_store is not None:
+                with timed(STAGE_SECONDS, "result_store"):
+                    self.result_store.put_many(pending)
+            logger.info("Bulk verification completed: %s email(s) processed", processed)
+
+    def verify_bulk(
+        self, emails: Iterable[str], progress: Optional["ProgressReporter"] = None
+    ) -> List[VerificationResult]:
+        """
+        Verify multiple email addresses.
 
-        logger.info(f"Bulk verification completed: {total} email(s) processed")
-        return results
+        Args:
+            emails: List of email addresses to verify
+            progress: Optional live progress line updated per result
+
+        Returns:
+            List of VerificationResult objects
+        """
+        return list(self.iter_verify(emails, progress))
 
 
-def load_emails_from_file(file_path: str) -> List[str]:
+def iter_emails_from_file(
+    file_path: str, csv_column: Optional[str] = None, shard: Optional[str] = None
+) -> Iterator[str]:
     """
-    Load email addresses from a text file.
+    Stream email addresses from a text or CSV file without loading it.
+
+    The file is memory-mapped and read in chunks; CRLF line endings and a
+    UTF-8 BOM are handled.
 
     Args:
-        file_path: Path to file containing emails (one per line)
+        file_path: Path to file containing emails (one per line, or CSV)
+        csv_column: CSV column with addresses - header name or zero-based
+            index (None = plain text, one address per line)
+        shard: Optional "K/N" slice of the file (K-th of N byte ranges) for
+            parallel workers
 
     Returns:
-        List of email addresses
+        Iterator over email addresses
 
     Raises:
         FileNotFoundError: If file does not exist
         IOError: If file cannot be read
+        ValueError: If shard or CSV column is invalid
     """
-    path = Path(file_path)
+    from src.ingest.mmap_reader import iter_csv_column, iter_lines, shard_range
 
-    if not path.exists():
+    if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    if not path.is_file():
+    if not os.path.isfile(file_path):
         raise IOError(f"Path is not a file: {file_path}")
 
-    with path.open("r", encoding="utf-8") as f:
-        emails = [line.strip() for line in f if line.strip()]
+    start, end = shard_range(file_path, shard) if shard else (0, None)
+
+    if csv_column is None:
+        return iter_lines(file_path, start, end)
+    column = int(csv_column) if csv_column.isdigit() else csv_column
+    return iter_csv_column(file_path, column, start, end)
+
+
+def load_emails_from_file(
+    file_path: str, csv_column: Optional[str] = None, shard: Optional[str] = None
+) -> List[str]:
+    """
+    Load email addresses from a text file.
+
+    Args:
+        file_path: Path to file containing emails (one per line, or CSV)
+        csv_column: CSV column with addresses (see iter_emails_from_file)
+        shard: Optional "K/N" slice of the file
+
+    Returns:
+        List of email addresses
 
+    Raises:
+        FileNotFoundError: If file does not exist
+        IOError: If file cannot be read
+    """
+    emails = list(iter_emails_from_file(file_path, csv_column, shard))
     logger.info(f"Loaded {len(emails)} email(s) from file: {file_path}")
     return emails
 
@@ -180,61 +443,49 @@ def print_results_console(results: List[VerificationResult]) -> None:
     Print verification results to console in human-readable format.
 
     Console output follows TZ requirements:
-    - Status: only 3 values ("домен валиден", "домен отсутствует", "MX-записи отсутствуют или некорректны")
+    - Status: get_domain_status() (the 3 TZ values for checked domains)
     - SMTP: separate field (verified/rejected/unavailable)
 
+    Output is buffered: results are written in large chunks, not line by line.
+
     Args:
         results: List of verification results
     """
-    print("\n" + "=" * 80)
-    print("EMAIL VERIFICATION RESULTS")
-    print("=" * 80 + "\n")
-
-    for idx, result in enumerate(results, 1):
-        print(f"{idx}. Email: {result.email}")
-        print(f"   Status: {result.get_domain_status()}")
-
-        if result.domain:
-            print(f"   Domain: {result.domain}")
+    from src.output.console import ConsoleRenderer
 
-        if result.mx_records:
-            # Filter out empty MX records
-            valid_mx = [mx for mx in result.mx_records if mx]
-            if valid_mx:
-                print(f"   MX Records: {', '.join(valid_mx)}")
+    renderer = ConsoleRenderer()
+    renderer.header()
+    renderer.render_many(results)
+    renderer.footer()
 
-        # Show SMTP status separately
-        if result.smtp_status != SMTPStatus.NOT_CHECKED:
-            print(f"   SMTP: {result.get_smtp_status_text()}")
 
-        if result.smtp_response:
-            print(f"   SMTP Response: {result.smtp_response}")
-
-        if result.error_message:
-            print(f"   Error: {result.error_message}")
+def print_summary_console(summary: "ResultSummary", top: int = 10) -> None:
+    """
+    Print aggregate counts and top failing domains only.
 
-        print()
+    Args:
+        summary: Aggregated verification results
+        top: Number of failing domains to show
+    """
+    from src.output.console import ConsoleRenderer
 
-    print("=" * 80)
+    ConsoleRenderer().render_summary(summary, top)
 
 
-def save_results_json(results: List[VerificationResult], output_path: str) -> None:
+def save_results_json(results: List[VerificationResult], output_path: str, fmt: str = "json") -> None:
     """
     Save verification results to JSON file.
 
     Args:
         results: List of verification results
         output_path: Path to output JSON file
+        fmt: "json" (single document) or "jsonl" (JSON Lines)
     """
-    output = {
-        "total": len(results),
-        "results": [result.to_dict() for result in results],
-    }
+    from src.output.json_writer import ResultJSONWriter
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    with ResultJSONWriter(output_path, fmt=fmt) as writer:
+        writer.write_many(results)
 
-    logger.info(f"Results saved to JSON file: {output_path}")
     print(f"\nResults saved to: {output_path}")
 
 
@@ -253,6 +504,15 @@ Examples:
   python -m src.main --emails "test@example.com,user@domain.org"
   python -m src.main --file emails.txt
   python -m src.main --emails "test@gmail.com" --json output.json
+  python -m src.main --file emails.txt --jsonl results.jsonl
+  python -m src.main --file emails.txt --csv results.csv --summary-json summary.json
+  python -m src.main --file emails.txt --jsonl results.jsonl --summary
+  python -m src.main --file emails.txt --email-timeout 15 --batch-timeout 300
+  python -m src.main --file emails.txt --cache-db verdicts.sqlite
+  python -m src.main --file contacts.csv --csv-column email --shard 1/4 --jsonl part1.jsonl
+  python -m src.main --file emails.txt --profile run.pstats --metrics-file /var/lib/node_exporter/email.prom
+  python -m src.main --file emails.txt --record traffic.jsonl.gz
+  python -m src.main --file emails.txt --replay traffic.jsonl.gz --replay-speed 0 --profile replay.pstats
         """,
     )
 
@@ -266,7 +526,17 @@ Examples:
     input_group.add_argument(
         "--file",
         type=str,
-        help="Path to text file with email addresses (one per line)",
+        help="Path to text file with email addresses (one per line), streamed from disk",
+    )
+    parser.add_argument(
+        "--csv-column",
+        type=str,
+        help="Read --file as CSV and take addresses from this column (header name or zero-based index)",
+    )
+    parser.add_argument(
+        "--shard",
+        type=str,
+        help="Process only the K-th of N equal byte ranges of --file, e.g. 2/4 (for parallel workers)",
     )
 
     # Output options
@@ -275,31 +545,277 @@ Examples:
         type=str,
         help="Save results to JSON file",
     )
+    parser.add_argument(
+        "--jsonl",
+        type=str,
+        help="Save results to JSON Lines file (one result per line, written as they arrive)",
+    )
+    parser.add_argument(
+        "--csv",
+        type=str,
+        help="Save results to CSV file",
+    )
+    parser.add_argument(
+        "--columnar",
+        type=str,
+        help="Save results to compact columnar binary file (dictionary-encoded, with summary footer)",
+    )
+    parser.add_argument(
+        "--summary-json",
+        type=str,
+        help="Save counts per status and per domain to JSON file",
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="Print only aggregate counts and top failing domains instead of every result",
+    )
+    parser.add_argument(
+        "--no-progress",
+        action="store_true",
+        help="Do not show the live progress line (addresses/s, ETA) on stderr",
+    )
+    parser.add_argument(
+        "--telegram-chat",
+        type=str,
+        default=config.TELEGRAM_REPORT_CHAT,
+        help="Keep a live summary (counts per status, addresses/s, ETA) in one message of this "
+        "Telegram chat; the bot token is read from TELEGRAM_BOT_TOKEN",
+    )
+    parser.add_argument(
+        "--telegram-interval",
+        type=float,
+        default=config.TELEGRAM_REPORT_INTERVAL,
+        help=f"Seconds between edits of the Telegram summary (default: {config.TELEGRAM_REPORT_INTERVAL})",
+    )
+
+    # Deadline options
+    parser.add_argument(
+        "--email-timeout",
+        type=float,
+        default=config.EMAIL_DEADLINE,
+        help="Budget in seconds for a single email, DNS + SMTP (default: unlimited)",
+    )
+    parser.add_argument(
+        "--batch-timeout",
+        type=float,
+        default=config.BATCH_DEADLINE,
+        help="Budget in seconds for the whole run; remaining emails are marked deadline_exceeded",
+    )
+
+    # Cache options
+    parser.add_argument(
+        "--cache-db",
+        type=str,
+        default=config.RESULT_CACHE_PATH,
+        help="SQLite file with cached verdicts; only stale or new addresses are re-verified",
+    )
+
+    # DNS options
+    parser.add_argument(
+        "--mx-snapshot",
+        type=str,
+        default=config.MX_SNAPSHOT_PATH,
+        help="JSON snapshot of MX answers for known provider domains (default: bundled snapshot)",
+    )
+    parser.add_argument(
+        "--no-mx-snapshot",
+        action="store_true",
+        help="Always query DNS, ignore the MX snapshot",
+    )
+
+    # Diagnostics options
+    parser.add_argument(
+        "--profile",
+        type=str,
+        help="Write a cProfile dump to this file and print per-stage wall time to stderr",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=str,
+        default=config.METRICS_FILE,
+        help="Periodically write counters and latency histograms here in Prometheus text format",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=config.METRICS_INTERVAL,
+        help=f"Seconds between --metrics-file writes (default: {config.METRICS_INTERVAL})",
+    )
+
+    # Transport options
+    transport_group = parser.add_mutually_exclusive_group()
+    transport_group.add_argument(
+        "--record",
+        type=str,
+        help="Record every DNS answer and SMTP dialogue with timings to this transcript (*.gz = compressed)",
+    )
+    transport_group.add_argument(
+        "--replay",
+        type=str,
+        help="Answer DNS and SMTP from a recorded transcript instead of the network",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=1.0,
+        help="Replay latency multiplier: 1 = recorded speed, 2 = twice as fast, 0 = no waiting (default: 1)",
+    )
 
     args = parser.parse_args()
 
+    # Checked before any output file is opened (and truncated)
+    bot_token = os.getenv("TELEGRAM_BOT_TOKEN") if args.telegram_chat else None
+    if args.telegram_chat and not bot_token:
+        print("Error: --telegram-chat requires the TELEGRAM_BOT_TOKEN environment variable")
+        return 1
+
+    from src.output.columnar_writer import ResultColumnarWriter
+    from src.output.csv_writer import ResultCSVWriter
+    from src.output.json_writer import ResultJSONWriter
+    from src.output.progress import ProgressReporter
+    from src.output.summary import ResultSummary
+    from src.storage.result_store import ResultStore
+
+    result_store = None
+    writers = []
+    profiler = None
+    metrics_writer = None
+    transcript_writer = None
+    telegram_client = None
+    telegram_report = None
+
+    if args.profile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    if args.metrics_file:
+        metrics_writer = MetricsFileWriter(REGISTRY, args.metrics_file, args.metrics_interval)
+        metrics_writer.start()
+    if args.profile or args.metrics_file:
+        time_logging(STAGE_SECONDS, "logging")
+
     try:
-        # Load emails
-        if args.emails:
-            emails = parse_emails_from_string(args.emails)
-        else:
-            emails = load_emails_from_file(args.file)
+        # Load emails (files are streamed, not loaded into memory)
+        try:
+            if args.emails:
+                email_list = parse_emails_from_string(args.emails)
+                total = len(email_list)
+                emails = iter(email_list)
+            else:
+                from src.ingest.mmap_reader import count_lines, shard_range
+
+                file_range = shard_range(args.file, args.shard) if args.shard else (0, None)
+                emails = iter_emails_from_file(args.file, args.csv_column, args.shard)
+                # Line count is close enough for ETA (blank lines included)
+                total = None if args.no_progress and not args.telegram_chat else count_lines(args.file, *file_range)
+            first = next(emails, None)
+        except ValueError as e:
+            # Malformed --shard or unknown --csv-column
+            logger.error(f"Input error: {e}")
+            print(f"Error: {e}")
+            return 1
 
-        if not emails:
+        if first is None:
             logger.error("No email addresses provided")
             print("Error: No email addresses found")
             return 1
+        emails = chain([first], emails)
 
         # Verify emails
-        service = EmailVerificationService()
-        results = service.verify_bulk(emails)
+        if args.cache_db:
+            result_store = ResultStore(args.cache_db)
+
+        dns_transport = smtp_transport = None
+        if args.record:
+            from src.transport.dns_transport import LiveDNSTransport, RecordingDNSTransport
+            from src.transport.smtp_transport import LiveSMTPTransport, RecordingSMTPTransport
+            from src.transport.transcript import TranscriptWriter
+
+            transcript_writer = TranscriptWriter(args.record)
+            dns_transport = RecordingDNSTransport(LiveDNSTransport(), transcript_writer)
+            smtp_transport = RecordingSMTPTransport(LiveSMTPTransport(), transcript_writer)
+        elif args.replay:
+            from src.transport.dns_transport import ReplayDNSTransport
+            from src.transport.smtp_transport import ReplaySMTPTransport
+            from src.transport.transcript import Transcript
+
+            transcript = Transcript.load(args.replay)
+            logger.info(f"Replaying {len(transcript)} recorded exchange(s) from {args.replay}")
+            # Deadlines count the recorded time a fast replay skips
+            set_clock(transcript.clock)
+            dns_transport = ReplayDNSTransport(transcript, args.replay_speed)
+            smtp_transport = ReplaySMTPTransport(transcript, args.replay_speed)
+
+        service = EmailVerificationService(
+            email_deadline=args.email_timeout,
+            batch_deadline=args.batch_timeout,
+            result_store=result_store,
+            mx_snapshot_path=None if args.no_mx_snapshot else args.mx_snapshot,
+            dns_transport=dns_transport,
+            smtp_transport=smtp_transport,
+        )
+
+        # Stream results to JSON outputs as they arrive
+        if args.json:
+            writers.append(ResultJSONWriter(args.json, fmt="json"))
+        if args.jsonl:
+            writers.append(ResultJSONWriter(args.jsonl, fmt="jsonl"))
+        if args.csv:
+            writers.append(ResultCSVWriter(args.csv))
+        if args.columnar:
+            writers.append(ResultColumnarWriter(args.columnar))
+
+        if args.telegram_chat:
+            from src.output.telegram_report import TelegramReport
+            from src.telegram.telegram_client import TelegramClient
+
+            telegram_client = TelegramClient(bot_token)
+            telegram_report = TelegramReport(
+                telegram_client, args.telegram_chat, total=total, interval=args.telegram_interval
+            )
+            telegram_report.start()
+
+        # In summary mode results are not kept in memory
+        results = []
+        summary = ResultSummary()
+        progress = None if args.no_progress else ProgressReporter(total=total)
+        for result in service.iter_verify(emails, progress):
+            with timed(STAGE_SECONDS, "serialization"):
+                if not args.summary:
+                    results.append(result)
+                summary.add(result)
+                for writer in writers:
+                    writer.write(result)
+            if telegram_report is not None:
+                telegram_report.add(result)
+        if progress is not None:
+            progress.close()
+        if telegram_report is not None:
+            telegram_report.close()
+            telegram_report = None
+
+        with timed(STAGE_SECONDS, "serialization"):
+            for writer in writers:
+                writer.close()
+
+        if args.summary_json:
+            with open(args.summary_json, "w", encoding="utf-8") as f:
+                json.dump(summary.to_dict(), f, indent=2, ensure_ascii=False)
+            logger.info(f"Summary saved to JSON file: {args.summary_json}")
 
         # Print results to console
-        print_results_console(results)
+        with timed(STAGE_SECONDS, "console"):
+            if args.summary:
+                print_summary_console(summary)
+            else:
+                print_results_console(results)
 
-        # Save to JSON if requested
-        if args.json:
-            save_results_json(results, args.json)
+        for writer in writers:
+            print(f"\nResults saved to: {writer.output_path}")
+        if args.summary_json:
+            print(f"\nSummary saved to: {args.summary_json}")
 
         return 0
 
@@ -323,6 +839,28 @@ Examples:
         print(f"Unexpected error: {e}")
         return 1
 
+    finally:
+        if telegram_report is not None:
+            # Still open: the run did not complete
+            telegram_report.close(completed=False)
+        if telegram_client is not None:
+            telegram_client.close()
+        for writer in writers:
+            writer.close()
+        if result_store is not None:
+            result_store.close()
+        if args.replay:
+            set_clock(None)
+        if transcript_writer is not None:
+            transcript_writer.close()
+            logger.info(f"Recorded {transcript_writer.count} exchange(s) to {transcript_writer.path}")
+        if metrics_writer is not None:
+            metrics_writer.stop()
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            print(f"\n{stage_table()}\n\nProfile saved to: {args.profile}", file=sys.stderr)
+
 
 if __name__ == "__main__":
     sys.exit(main())
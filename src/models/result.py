@@ -2,20 +2,24 @@
 Data models for email verification results.
 """
 
-from dataclasses import dataclass, asdict
+import sys
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, List
+from typing import Optional, Sequence
 
 
 class VerificationStatus(Enum):
     """Email verification status enumeration."""
 
     VALID = "valid"  # Email passed all checks
+    CATCH_ALL = "catch_all"  # Domain accepts any recipient, mailbox existence unknown
     INVALID_FORMAT = "invalid_format"  # Email format is incorrect
     DOMAIN_NOT_FOUND = "domain_not_found"  # Domain does not exist
     NO_MX_RECORDS = "no_mx_records"  # MX records missing or incorrect
     SMTP_UNAVAILABLE = "smtp_unavailable"  # SMTP server unreachable or blocked
     SMTP_REJECTED = "smtp_rejected"  # SMTP server rejected the email
+    DEADLINE_EXCEEDED = "deadline_exceeded"  # Per-email or per-batch budget ran out
+    BLOCKED_DOMAIN = "blocked_domain"  # Domain is in a rejected domain index category
 
 
 class SMTPStatus(Enum):
@@ -25,30 +29,46 @@ class SMTPStatus(Enum):
     REJECTED = "rejected"  # SMTP rejected email (550)
     UNAVAILABLE = "unavailable"  # SMTP server unreachable/timeout
     NOT_CHECKED = "not_checked"  # SMTP check was not performed
+    CATCH_ALL = "catch_all"  # Domain accepts any recipient, address not checked individually
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     """
     Result of email verification process.
 
+    Memory-lean: uses __slots__, interns domain strings and stores MX hosts
+    as a tuple. MXChecker hands out one tuple per domain (from its cache or
+    the snapshot), which all results of that domain keep by reference.
+
     Attributes:
         email: The email address that was verified
         status: Verification status
         domain: Extracted domain from email
-        mx_records: List of MX servers (if found)
+        mx_records: MX servers (if found), as a tuple
         smtp_status: SMTP verification status
         smtp_response: SMTP server response message
         error_message: Error details (if any)
+        catch_all: Whether the domain accepts any recipient (None = unknown)
+        domain_category: Domain index category (disposable, blocked, role, ...)
     """
 
     email: str
     status: VerificationStatus
     smtp_status: SMTPStatus = SMTPStatus.NOT_CHECKED
     domain: Optional[str] = None
-    mx_records: Optional[List[str]] = None
+    mx_records: Optional[Sequence[str]] = None
     smtp_response: Optional[str] = None
     error_message: Optional[str] = None
+    catch_all: Optional[bool] = None
+    domain_category: Optional[str] = None
+
+    def __post_init__(self):
+        """Intern domain and store MX hosts as an (already shared) tuple."""
+        if self.domain is not None:
+            self.domain = sys.intern(self.domain)
+        if self.mx_records is not None and type(self.mx_records) is not tuple:
+            self.mx_records = tuple(self.mx_records)
 
     def to_dict(self) -> dict:
         """
@@ -57,22 +77,58 @@ class VerificationResult:
         Returns:
             Dictionary representation of the result
         """
-        result = asdict(self)
-        result["status"] = self.status.value
-        result["smtp_status"] = self.smtp_status.value
-        return result
+        mx_records = self.mx_records
+        return {
+            "email": self.email,
+            "status": self.status.value,
+            "smtp_status": self.smtp_status.value,
+            "domain": self.domain,
+            "mx_records": list(mx_records) if mx_records is not None else None,
+            "smtp_response": self.smtp_response,
+            "error_message": self.error_message,
+            "catch_all": self.catch_all,
+            "domain_category": self.domain_category,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "VerificationResult":
+        """
+        Restore result from its dictionary representation.
+
+        Args:
+            data: Dictionary produced by to_dict()
+
+        Returns:
+            VerificationResult instance
+        """
+        return cls(
+            email=data["email"],
+            status=VerificationStatus(data["status"]),
+            smtp_status=SMTPStatus(data.get("smtp_status", SMTPStatus.NOT_CHECKED.value)),
+            domain=data.get("domain"),
+            mx_records=data.get("mx_records"),
+            smtp_response=data.get("smtp_response"),
+            error_message=data.get("error_message"),
+            catch_all=data.get("catch_all"),
+            domain_category=data.get("domain_category"),
+        )
 
     def get_domain_status(self) -> str:
         """
         Get domain status according to TZ requirements.
 
-        TZ specifies ONLY 3 possible statuses:
+        TZ specifies 3 statuses for checked domains:
         - "домен валиден"
         - "домен отсутствует"
         - "MX-записи отсутствуют или некорректны"
 
+        Domains that were not looked up get their own text: listed in the
+        domain index ("домен в списке одноразовых/заблокированных") or
+        skipped when the budget ran out ("домен не проверен (истёк бюджет
+        времени)").
+
         Returns:
-            Domain status message as per TZ specification (one of 3 values)
+            Domain status message
         """
         if self.status == VerificationStatus.INVALID_FORMAT:
             # Invalid format means domain doesn't exist (per TZ requirements)
@@ -81,8 +137,15 @@ class VerificationResult:
             return "домен отсутствует"
         elif self.status == VerificationStatus.NO_MX_RECORDS:
             return "MX-записи отсутствуют или некорректны"
+        elif self.status == VerificationStatus.DEADLINE_EXCEEDED and not self.mx_records:
+            # Budget ran out before MX records were obtained: nothing is known
+            return "домен не проверен (истёк бюджет времени)"
+        elif self.status == VerificationStatus.BLOCKED_DOMAIN:
+            # Disposable / known-bad domain, rejected without DNS lookup
+            return "домен в списке одноразовых/заблокированных"
         else:
-            # VALID, SMTP_UNAVAILABLE, SMTP_REJECTED all mean domain is valid
+            # VALID, CATCH_ALL, SMTP_UNAVAILABLE, SMTP_REJECTED (and DEADLINE_EXCEEDED
+            # after MX lookup) all mean domain is valid
             return "домен валиден"
 
     def get_smtp_status_text(self) -> str:
@@ -97,6 +160,7 @@ class VerificationResult:
             SMTPStatus.REJECTED: "rejected",
             SMTPStatus.UNAVAILABLE: "unavailable",
             SMTPStatus.NOT_CHECKED: "not checked",
+            SMTPStatus.CATCH_ALL: "catch-all",
         }
         return status_map.get(self.smtp_status, "unknown")
 
@@ -109,10 +173,13 @@ class VerificationResult:
         """
         status_messages = {
             VerificationStatus.VALID: "домен валиден",
+            VerificationStatus.CATCH_ALL: "домен валиден (catch-all, адрес не проверен)",
             VerificationStatus.INVALID_FORMAT: "неверный формат email",
             VerificationStatus.DOMAIN_NOT_FOUND: "домен отсутствует",
             VerificationStatus.NO_MX_RECORDS: "MX-записи отсутствуют или некорректны",
             VerificationStatus.SMTP_UNAVAILABLE: "домен валиден (SMTP недоступен)",
             VerificationStatus.SMTP_REJECTED: "домен валиден (SMTP отклонил адрес)",
+            VerificationStatus.DEADLINE_EXCEEDED: "проверка прервана по таймауту",
+            VerificationStatus.BLOCKED_DOMAIN: "домен в списке одноразовых/заблокированных",
         }
         return status_messages.get(self.status, "неизвестный статус")
@@ -0,0 +1,3 @@
+"""
+Local network simulator (stub DNS and SMTP servers) for offline load tests.
+"""
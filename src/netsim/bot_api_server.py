@@ -0,0 +1,274 @@
+"""
+Stub Telegram Bot API server answering from a scenario.
+"""
+
+import json
+import math
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from src.netsim.scenario import Scenario
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_PATH_REGEX = re.compile(r"^/bot([^/]+)/(\w+)$")
+
+# chat_id field of a multipart body (looked up in its first block)
+_MULTIPART_CHAT_REGEX = re.compile(rb'name="chat_id"\r\n\r\n([^\r]*)\r\n')
+
+# Bytes read per step from request bodies (uploads are counted, not kept)
+_READ_SIZE = 64 * 1024
+
+# Text limit of sendMessage/editMessageText, in UTF-16 code units
+_TEXT_LIMIT = 4096
+
+# Methods subject to flood control and injected errors
+_SEND_METHODS = frozenset({"sendMessage", "sendDocument", "editMessageText"})
+
+
+class _BotAPIHandler(BaseHTTPRequestHandler):
+    """Answers one Bot API request."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, every
+    # keep-alive response would stall on the delayed ACK
+    disable_nagle_algorithm = True
+
+    def _read_params(self) -> Tuple[Dict[str, Any], int]:
+        """Read request parameters (query, JSON, form or multipart) and the body size."""
+        params: Dict[str, Any] = dict(parse_qsl(urlsplit(self.path).query))
+        left = int(self.headers.get("Content-Length") or 0)
+        size = left
+        content_type = self.headers.get("Content-Type", "")
+
+        if not content_type.startswith("multipart/form-data"):
+            # Plain parameters are small: read them whole
+            first = self.rfile.read(left) if left else b""
+            left = 0
+        else:
+            first = self.rfile.read(min(left, _READ_SIZE)) if left else b""
+            left -= len(first)
+        while left > 0:
+            chunk = self.rfile.read(min(left, _READ_SIZE))
+            if not chunk:
+                break
+            left -= len(chunk)
+
+        if content_type.startswith("application/json"):
+            params.update(json.loads(first or b"{}"))
+        elif content_type.startswith("application/x-www-form-urlencoded"):
+            params.update(parse_qsl(first.decode("utf-8")))
+        elif content_type.startswith("multipart/form-data"):
+            match = _MULTIPART_CHAT_REGEX.search(first)
+            if match:
+                params["chat_id"] = match.group(1).decode("utf-8")
+        return params, size
+
+    def _respond(self, code: int, data: Dict[str, Any]) -> None:
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self) -> None:
+        api: "StubBotAPIServer" = self.server.api
+        match = _PATH_REGEX.match(urlsplit(self.path).path)
+        try:
+            params, size = self._read_params()
+        except (ValueError, UnicodeDecodeError):
+            self._respond(400, {"ok": False, "error_code": 400, "description": "Bad Request: invalid body"})
+            return
+        if match is None:
+            self._respond(404, {"ok": False, "error_code": 404, "description": "Not Found"})
+            return
+        code, data = api.answer(match.group(2), params, size)
+        self._respond(code, data)
+
+    do_GET = _handle
+    do_POST = _handle
+
+    def log_message(self, format: str, *args) -> None:
+        """Keep per-request logging out of load tests."""
+
+
+class StubBotAPIServer:
+    """
+    Stub Telegram Bot API on localhost, run in a background thread.
+
+    Implements getMe, sendMessage, sendDocument and editMessageText with
+    the response shapes of the real API. The scenario's "bot_api" settings
+    add latency, 429 flood control (random or per-chat rate) with
+    retry_after, and 502 errors. Any bot token is accepted.
+
+    Example:
+        with StubBotAPIServer(Scenario({"bot_api": {"flood_rate": 0.01}})) as api:
+            client = TelegramClient(token, api_url=api.url)
+    """
+
+    def __init__(self, scenario: Optional[Scenario] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Bind server.
+
+        Args:
+            scenario: Settings to answer from (default: no faults)
+            host: Address to bind
+            port: TCP port (0 = pick a free port)
+        """
+        self.scenario = scenario or Scenario()
+        self.stats: Counter = Counter()
+        self._message_id = 0
+        self._texts: Dict[Tuple[str, int], int] = {}
+        self._chat_windows: Dict[str, list] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _BotAPIHandler)
+        self._server.daemon_threads = True
+        self._server.api = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self):
+        """Bound (host, port)."""
+        return self._server.server_address[:2]
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass as api_url / TELEGRAM_API_BASE_URL."""
+        host, port = self.address
+        return f"http://{host}:{port}"
+
+    @staticmethod
+    def _error(code: int, description: str, **parameters: Any) -> Tuple[int, Dict[str, Any]]:
+        data: Dict[str, Any] = {"ok": False, "error_code": code, "description": description}
+        if parameters:
+            data["parameters"] = parameters
+        return code, data
+
+    def _flooded(self, chat_id: str) -> Optional[int]:
+        """Get retry_after if this send hits flood control, else None."""
+        settings = self.scenario.bot_api
+        retry_after = int(settings.get("retry_after", 1))
+        if self.scenario.chance(settings.get("flood_rate", 0)):
+            return retry_after
+
+        chat_rate = settings.get("chat_rate", 0)
+        if chat_rate:
+            now = time.monotonic()
+            with self._lock:
+                window = self._chat_windows.get(chat_id)
+                if window is None or now - window[0] >= 1.0:
+                    window = self._chat_windows[chat_id] = [now, 0]
+                if window[1] >= chat_rate:
+                    return max(1, math.ceil(window[0] + 1.0 - now))
+                window[1] += 1
+        return None
+
+    def _new_message(self, chat_id: str, text_hash: int) -> Dict[str, Any]:
+        with self._lock:
+            self._message_id += 1
+            message_id = self._message_id
+            self._texts[(chat_id, message_id)] = text_hash
+        return {"message_id": message_id, "date": int(time.time()), "chat": {"id": chat_id}}
+
+    def answer(self, method: str, params: Dict[str, Any], size: int = 0) -> Tuple[int, Dict[str, Any]]:
+        """
+        Answer one Bot API call.
+
+        Args:
+            method: Bot API method name
+            params: Request parameters
+            size: Request body size in bytes
+
+        Returns:
+            Tuple of (HTTP status, response document)
+        """
+        settings = self.scenario.bot_api
+        self.stats[method] += 1
+        delay = self.scenario.delay(settings)
+        if delay:
+            time.sleep(delay)
+
+        chat_id = str(params.get("chat_id", ""))
+        if method in _SEND_METHODS:
+            if self.scenario.chance(settings.get("error_rate", 0)):
+                self.stats["error"] += 1
+                return self._error(502, "Bad Gateway")
+            retry_after = self._flooded(chat_id)
+            if retry_after is not None:
+                self.stats["flood"] += 1
+                return self._error(429, f"Too Many Requests: retry after {retry_after}", retry_after=retry_after)
+            if not chat_id:
+                return self._error(400, "Bad Request: chat_id is empty")
+
+        if method == "getMe":
+            return 200, {
+                "ok": True,
+                "result": {"id": 1, "is_bot": True, "first_name": "netsim", "username": "netsim_bot"},
+            }
+
+        if method == "sendMessage":
+            text = str(params.get("text", ""))
+            if not text.strip():
+                return self._error(400, "Bad Request: message text is empty")
+            if len(text.encode("utf-16-le")) // 2 > _TEXT_LIMIT:
+                return self._error(400, "Bad Request: message is too long")
+            message = self._new_message(chat_id, hash(text))
+            message["text"] = text
+            return 200, {"ok": True, "result": message}
+
+        if method == "sendDocument":
+            message = self._new_message(chat_id, 0)
+            message["document"] = {"file_id": f"netsim-{message['message_id']}", "file_size": size}
+            return 200, {"ok": True, "result": message}
+
+        if method == "editMessageText":
+            text = str(params.get("text", ""))
+            try:
+                key = (chat_id, int(params.get("message_id", 0)))
+            except (TypeError, ValueError):
+                return self._error(400, "Bad Request: message identifier is not specified")
+            with self._lock:
+                previous = self._texts.get(key)
+                if previous is not None and previous != hash(text):
+                    self._texts[key] = hash(text)
+            if previous is None:
+                return self._error(400, "Bad Request: message to edit not found")
+            if previous == hash(text):
+                return self._error(
+                    400,
+                    "Bad Request: message is not modified: specified new message content and reply markup "
+                    "are exactly the same as a current content and reply markup of the message",
+                )
+            return 200, {"ok": True, "result": {"message_id": key[1], "chat": {"id": chat_id}, "text": text}}
+
+        return self._error(404, "Not Found")
+
+    def start(self) -> None:
+        """Serve in a background daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="netsim-bot-api", daemon=True)
+        self._thread.start()
+        logger.info("Stub Bot API server listening on %s:%s", *self.address)
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        """Context manager entry - start server."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - stop server."""
+        self.stop()
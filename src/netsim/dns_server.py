@@ -0,0 +1,116 @@
+"""
+Stub authoritative DNS server (UDP) answering from a scenario.
+"""
+
+import socketserver
+import threading
+import time
+from typing import Optional
+
+import dns.flags
+import dns.message
+import dns.rcode
+import dns.rdataclass
+import dns.rdatatype
+import dns.rrset
+
+from src.netsim.scenario import Scenario
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+TTL = 300
+RECORD_KEYS = {dns.rdatatype.MX: "mx", dns.rdatatype.A: "a", dns.rdatatype.AAAA: "aaaa"}
+
+
+class _DNSHandler(socketserver.BaseRequestHandler):
+    """Answers one UDP query."""
+
+    def handle(self) -> None:
+        """Parse query, apply the matching rule and send the response."""
+        data, sock = self.request
+        scenario: Scenario = self.server.scenario
+        try:
+            query = dns.message.from_wire(data)
+        except Exception as e:
+            logger.debug("Malformed DNS query: %s", e)
+            return
+
+        question = query.question[0]
+        qname = question.name.to_text(omit_final_dot=True)
+        rule = scenario.dns_rule(qname)
+        response = dns.message.make_response(query)
+        response.flags |= dns.flags.AA
+
+        if rule is None:
+            response.set_rcode(dns.rcode.NXDOMAIN)
+        else:
+            if rule.get("drop"):
+                # Never answer: the client runs into its timeout
+                return
+            delay = scenario.delay(rule)
+            if delay:
+                time.sleep(delay)
+            response.set_rcode(dns.rcode.from_text(rule.get("rcode", "NOERROR")))
+            key = RECORD_KEYS.get(question.rdtype)
+            values = rule.get(key) if key else None
+            if values and response.rcode() == dns.rcode.NOERROR:
+                if question.rdtype == dns.rdatatype.MX:
+                    # Exchanges are given as host names or IP literals
+                    values = [self._absolute_mx(value) for value in values]
+                response.answer.append(
+                    dns.rrset.from_text_list(question.name, TTL, dns.rdataclass.IN, question.rdtype, values)
+                )
+
+        sock.sendto(response.to_wire(), self.client_address)
+
+    @staticmethod
+    def _absolute_mx(value: str) -> str:
+        """Make the MX exchange of "preference host" absolute."""
+        preference, host = value.split(None, 1)
+        return f"{preference} {host.rstrip('.')}."
+
+
+class _ThreadingUDPServer(socketserver.ThreadingMixIn, socketserver.UDPServer):
+    """UDP server handling each query in its own thread (latency does not serialize)."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class StubDNSServer:
+    """
+    Stub DNS server on localhost, run in a background thread.
+    """
+
+    def __init__(self, scenario: Scenario, host: str = "127.0.0.1", port: int = 0):
+        """
+        Bind server.
+
+        Args:
+            scenario: Rules to answer from
+            host: Address to bind
+            port: UDP port (0 = pick a free port)
+        """
+        self._server = _ThreadingUDPServer((host, port), _DNSHandler)
+        self._server.scenario = scenario
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self):
+        """Bound (host, port)."""
+        return self._server.server_address
+
+    def start(self) -> None:
+        """Serve in a background daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="netsim-dns", daemon=True)
+        self._thread.start()
+        logger.info("Stub DNS server listening on %s:%s", *self.address)
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,188 @@
+"""
+Scripted behaviour of the simulated network.
+
+A scenario is a JSON document with ordered rules; the first rule whose glob
+matches the queried name (DNS) or the recipient address (SMTP) applies:
+
+    {
+      "seed": 42,
+      "smtp_banner_delay": 0,
+      "dns": [
+        {"match": "nx.sim", "rcode": "NXDOMAIN"},
+        {"match": "*.sim", "mx": ["10 127.0.0.1"], "a": ["127.0.0.1"], "latency": 0.001}
+      ],
+      "smtp": [
+        {"match": "user*@ok.sim", "action": "accept"},
+        {"match": "*@ok.sim", "action": "reject"}
+      ]
+    }
+
+DNS rule keys: rcode (NOERROR, NXDOMAIN, SERVFAIL), mx ("preference host"),
+a, aaaa, latency and jitter (seconds), drop (never answer).
+
+SMTP rule keys: action (accept, reject, tempfail, greylist, tarpit,
+disconnect), latency and jitter (seconds before the RCPT reply),
+greylist_attempts (RCPTs answered 451 before acceptance), delay (tarpit
+seconds), code and message (override the reply).
+
+The optional "smtp_blocked_sources" list holds client IP addresses whose
+sessions are refused at the greeting with 554 5.7.1 (a blocklisted sending
+identity; loopback aliases such as 127.0.0.3 work as sources).
+
+The optional "bot_api" object configures the stub Telegram Bot API:
+latency and jitter (seconds per request), flood_rate (share of sends
+answered 429), chat_rate (sends per second allowed per chat, beyond that
+429; 0 = unlimited), retry_after (seconds reported with 429) and
+error_rate (share of sends answered 502).
+"""
+
+import fnmatch
+import json
+import random
+import threading
+from typing import Any, Dict, List, Optional
+
+# Reserved-looking names are rejected by the domain index, so simulated
+# domains live under the unused "sim" TLD
+DEFAULT_SCENARIO: Dict[str, Any] = {
+    "seed": 42,
+    "smtp_banner_delay": 0,
+    "dns": [
+        {"match": "nx.sim", "rcode": "NXDOMAIN"},
+        {"match": "nomx.sim", "a": ["127.0.0.1"]},
+        {"match": "dnsdrop.sim", "drop": True},
+        {"match": "slow.sim", "mx": ["10 127.0.0.1"], "a": ["127.0.0.1"], "latency": 0.05},
+        {"match": "*.sim", "mx": ["10 127.0.0.1"], "a": ["127.0.0.1"]},
+    ],
+    "smtp": [
+        {"match": "user*@ok.sim", "action": "accept"},
+        {"match": "*@ok.sim", "action": "reject"},
+        {"match": "*@reject.sim", "action": "reject"},
+        {"match": "*@catchall.sim", "action": "accept"},
+        {"match": "*@greylist.sim", "action": "greylist", "greylist_attempts": 1},
+        {"match": "*@tarpit.sim", "action": "tarpit", "delay": 30},
+        {"match": "*@drop.sim", "action": "disconnect"},
+        {"match": "user*@slow.sim", "action": "accept", "latency": 0.05},
+        {"match": "*@slow.sim", "action": "reject", "latency": 0.05},
+        {"match": "*", "action": "reject"},
+    ],
+}
+
+
+class Scenario:
+    """
+    Ordered DNS and SMTP rules plus shared simulation state.
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        """
+        Initialize scenario.
+
+        Args:
+            data: Scenario document (default: DEFAULT_SCENARIO)
+        """
+        data = data if data is not None else DEFAULT_SCENARIO
+        self.dns_rules: List[Dict[str, Any]] = list(data.get("dns", []))
+        self.smtp_rules: List[Dict[str, Any]] = list(data.get("smtp", []))
+        self.smtp_banner_delay: float = data.get("smtp_banner_delay", 0)
+        self.smtp_blocked_sources = frozenset(data.get("smtp_blocked_sources", ()))
+        self.bot_api: Dict[str, Any] = dict(data.get("bot_api", {}))
+        self._rng = random.Random(data.get("seed", 42))
+        self._greylist: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str) -> "Scenario":
+        """
+        Load scenario from a JSON file.
+
+        Args:
+            path: Path to scenario file
+
+        Returns:
+            Scenario instance
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    @staticmethod
+    def _match(rules: List[Dict[str, Any]], name: str) -> Optional[Dict[str, Any]]:
+        """Get the first rule whose glob matches name."""
+        name = name.lower()
+        for rule in rules:
+            if fnmatch.fnmatchcase(name, rule.get("match", "*").lower()):
+                return rule
+        return None
+
+    def dns_rule(self, qname: str) -> Optional[Dict[str, Any]]:
+        """
+        Get DNS rule for a queried name.
+
+        Args:
+            qname: Queried name without trailing dot
+
+        Returns:
+            Matching rule or None (answered NXDOMAIN)
+        """
+        return self._match(self.dns_rules, qname)
+
+    def smtp_rule(self, recipient: str) -> Optional[Dict[str, Any]]:
+        """
+        Get SMTP rule for a recipient address.
+
+        Args:
+            recipient: RCPT TO address
+
+        Returns:
+            Matching rule or None (accepted)
+        """
+        return self._match(self.smtp_rules, recipient)
+
+    def delay(self, rule: Dict[str, Any]) -> float:
+        """
+        Get scripted delay of a rule (latency plus seeded jitter).
+
+        Args:
+            rule: DNS or SMTP rule
+
+        Returns:
+            Delay in seconds
+        """
+        latency = rule.get("latency", 0)
+        jitter = rule.get("jitter", 0)
+        if jitter:
+            with self._lock:
+                latency += self._rng.uniform(0, jitter)
+        return latency
+
+    def chance(self, probability: float) -> bool:
+        """
+        Draw a seeded random event.
+
+        Args:
+            probability: Probability of the event (0..1)
+
+        Returns:
+            True if the event happens
+        """
+        if probability <= 0:
+            return False
+        with self._lock:
+            return self._rng.random() < probability
+
+    def greylisted(self, recipient: str, attempts: int) -> bool:
+        """
+        Count an RCPT attempt and tell whether it is still greylisted.
+
+        Args:
+            recipient: RCPT TO address
+            attempts: Attempts answered with 451 before acceptance
+
+        Returns:
+            True if this attempt must be deferred
+        """
+        recipient = recipient.lower()
+        with self._lock:
+            seen = self._greylist.get(recipient, 0)
+            self._greylist[recipient] = seen + 1
+        return seen < attempts
@@ -0,0 +1,153 @@
+"""
+Local network simulator: stub DNS, SMTP and Telegram Bot API servers started together.
+
+Usage:
+    python -m src.netsim.simulator [--scenario scenario.json] [--dns-port 5353] [--smtp-port 2525]
+        [--bot-api-port 8081]
+
+Point the verifier at it with DNS_NAMESERVERS = ["127.0.0.1"], DNS_PORT and
+SMTP_PORT in config.py, and Telegram clients with TELEGRAM_API_BASE_URL
+(NetworkSimulator.configure() does this in-process).
+"""
+
+import argparse
+import os
+import sys
+import threading
+from typing import Optional
+
+import config
+from src.netsim.bot_api_server import StubBotAPIServer
+from src.netsim.dns_server import StubDNSServer
+from src.netsim.scenario import Scenario
+from src.netsim.smtp_server import StubSMTPServer
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class NetworkSimulator:
+    """
+    Runs stub DNS, SMTP and Telegram Bot API servers on localhost.
+
+    Example:
+        with NetworkSimulator() as sim:
+            sim.configure()
+            service = EmailVerificationService()
+    """
+
+    def __init__(
+        self,
+        scenario: Optional[Scenario] = None,
+        host: str = "127.0.0.1",
+        dns_port: int = 0,
+        smtp_port: int = 0,
+        bot_api_port: int = 0,
+    ):
+        """
+        Bind all servers.
+
+        Args:
+            scenario: Scripted behaviour (default: DEFAULT_SCENARIO)
+            host: Address to bind
+            dns_port: UDP port for DNS (0 = pick a free port)
+            smtp_port: TCP port for SMTP (0 = pick a free port)
+            bot_api_port: TCP port for the Bot API (0 = pick a free port)
+        """
+        self.scenario = scenario or Scenario()
+        self.dns = StubDNSServer(self.scenario, host, dns_port)
+        self.smtp = StubSMTPServer(self.scenario, host, smtp_port)
+        self.bot_api = StubBotAPIServer(self.scenario, host, bot_api_port)
+        self._saved_config = None
+
+    @property
+    def dns_port(self) -> int:
+        """Bound DNS port."""
+        return self.dns.address[1]
+
+    @property
+    def smtp_port(self) -> int:
+        """Bound SMTP port."""
+        return self.smtp.address[1]
+
+    def start(self) -> None:
+        """Start all servers."""
+        self.dns.start()
+        self.smtp.start()
+        self.bot_api.start()
+
+    def stop(self) -> None:
+        """Stop all servers and restore configuration changed by configure()."""
+        self.dns.stop()
+        self.smtp.stop()
+        self.bot_api.stop()
+        if self._saved_config is not None:
+            config.DNS_NAMESERVERS, config.DNS_PORT, config.SMTP_PORT, api_url = self._saved_config
+            if api_url is None:
+                os.environ.pop("TELEGRAM_API_BASE_URL", None)
+            else:
+                os.environ["TELEGRAM_API_BASE_URL"] = api_url
+            self._saved_config = None
+
+    def configure(self) -> None:
+        """
+        Point DNS and SMTP settings in config and TELEGRAM_API_BASE_URL at the simulator.
+
+        Takes effect for MXChecker/SMTPVerifier/TelegramClient instances
+        created afterwards.
+        """
+        if self._saved_config is None:
+            self._saved_config = (
+                config.DNS_NAMESERVERS,
+                config.DNS_PORT,
+                config.SMTP_PORT,
+                os.environ.get("TELEGRAM_API_BASE_URL"),
+            )
+        config.DNS_NAMESERVERS = [self.dns.address[0]]
+        config.DNS_PORT = self.dns_port
+        config.SMTP_PORT = self.smtp_port
+        os.environ["TELEGRAM_API_BASE_URL"] = self.bot_api.url
+
+    def __enter__(self):
+        """Context manager entry - start servers."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - stop servers."""
+        self.stop()
+
+
+def main() -> int:
+    """
+    Run the simulator until interrupted.
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(description="Local stub DNS + SMTP + Bot API servers for offline load tests")
+    parser.add_argument("--scenario", type=str, help="Scenario JSON file (default: built-in *.sim scenario)")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Address to bind (default: 127.0.0.1)")
+    parser.add_argument("--dns-port", type=int, default=5353, help="UDP port for DNS (default: 5353)")
+    parser.add_argument("--smtp-port", type=int, default=2525, help="TCP port for SMTP (default: 2525)")
+    parser.add_argument("--bot-api-port", type=int, default=8081, help="TCP port for the Bot API (default: 8081)")
+    args = parser.parse_args()
+
+    scenario = Scenario.load(args.scenario) if args.scenario else Scenario()
+    with NetworkSimulator(scenario, args.host, args.dns_port, args.smtp_port, args.bot_api_port) as sim:
+        print(
+            f"DNS on {args.host}:{sim.dns_port}/udp, SMTP on {args.host}:{sim.smtp_port}/tcp, "
+            f"Bot API on {sim.bot_api.url}\n"
+            f'Set DNS_NAMESERVERS = ["{args.host}"], DNS_PORT = {sim.dns_port}, '
+            f"SMTP_PORT = {sim.smtp_port} in config.py and "
+            f"TELEGRAM_API_BASE_URL={sim.bot_api.url}. Ctrl+C to stop."
+        )
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Stub SMTP server answering RCPT TO from a scenario.
+"""
+
+import re
+import socket
+import socketserver
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+from src.netsim.scenario import Scenario
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_ADDRESS_REGEX = re.compile(r"<([^>]*)>")
+
+# action -> (code, message) of the RCPT reply
+REPLIES = {
+    "accept": (250, "2.1.5 Recipient OK"),
+    "reject": (550, "5.1.1 No such user"),
+    "tempfail": (450, "4.2.1 Mailbox temporarily unavailable"),
+    "greylist": (451, "4.7.1 Greylisted, try again later"),
+    "tarpit": (250, "2.1.5 Recipient OK"),
+}
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Runs one SMTP session."""
+
+    def _reply(self, code: int, message: str) -> None:
+        """Send a single-line reply."""
+        self.wfile.write(f"{code} {message}\r\n".encode("utf-8"))
+
+    def handle(self) -> None:
+        """Greet, then answer commands until QUIT or disconnect."""
+        scenario: Scenario = self.server.scenario
+        source = self.client_address[0]
+        helo = ""
+        if scenario.smtp_banner_delay:
+            time.sleep(scenario.smtp_banner_delay)
+        if source in scenario.smtp_blocked_sources:
+            self._reply(554, f"5.7.1 Client host [{source}] blocked")
+            return
+        self._reply(220, "netsim ESMTP ready")
+
+        try:
+            for raw in self.rfile:
+                line = raw.decode("utf-8", "replace").strip()
+                command = line[:4].upper()
+
+                if command in ("EHLO", "HELO"):
+                    helo = line[5:].strip()
+                    self._reply(250, "netsim")
+                elif command == "MAIL":
+                    match = _ADDRESS_REGEX.search(line)
+                    sender = match.group(1) if match else line[10:].strip()
+                    with self.server.lock:
+                        self.server.senders[(source, helo, sender)] += 1
+                    self._reply(250, "2.1.0 Sender OK")
+                elif command == "RCPT":
+                    if not self._rcpt(scenario, line):
+                        return
+                elif command in ("RSET", "NOOP"):
+                    self._reply(250, "2.0.0 OK")
+                elif command == "QUIT":
+                    self._reply(221, "2.0.0 Bye")
+                    return
+                else:
+                    self._reply(502, "5.5.2 Command not implemented")
+        except (ConnectionError, socket.timeout):
+            pass
+
+    def _rcpt(self, scenario: Scenario, line: str) -> bool:
+        """
+        Answer RCPT TO according to the matching rule.
+
+        Returns:
+            False if the session must end (scripted disconnect)
+        """
+        match = _ADDRESS_REGEX.search(line)
+        recipient = match.group(1) if match else line[8:].strip()
+        rule = scenario.smtp_rule(recipient) or {"action": "accept"}
+        action = rule.get("action", "accept")
+
+        delay = scenario.delay(rule)
+        if action == "tarpit":
+            delay += rule.get("delay", 30)
+        if delay:
+            time.sleep(delay)
+
+        if action == "disconnect":
+            self.connection.shutdown(socket.SHUT_RDWR)
+            return False
+        if action == "greylist" and not scenario.greylisted(recipient, rule.get("greylist_attempts", 1)):
+            action = "accept"
+
+        code, message = REPLIES.get(action, REPLIES["accept"])
+        self._reply(rule.get("code", code), rule.get("message", message))
+        return True
+
+
+class _ThreadingTCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """TCP server handling each session in its own thread."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+
+class StubSMTPServer:
+    """
+    Stub SMTP server on localhost, run in a background thread.
+
+    senders counts MAIL FROM commands by (client IP, EHLO name, sender),
+    i.e. by the sending identity of each session.
+    """
+
+    def __init__(self, scenario: Scenario, host: str = "127.0.0.1", port: int = 0):
+        """
+        Bind server.
+
+        Args:
+            scenario: Rules to answer from
+            host: Address to bind
+            port: TCP port (0 = pick a free port)
+        """
+        self._server = _ThreadingTCPServer((host, port), _SMTPHandler)
+        self._server.scenario = scenario
+        self._server.senders = Counter()
+        self._server.lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self):
+        """Bound (host, port)."""
+        return self._server.server_address
+
+    @property
+    def senders(self) -> Counter:
+        """MAIL FROM commands by (client IP, EHLO name, sender)."""
+        return self._server.senders
+
+    def start(self) -> None:
+        """Serve in a background daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="netsim-smtp", daemon=True)
+        self._thread.start()
+        logger.info("Stub SMTP server listening on %s:%s", *self.address)
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,3 @@
+"""
+Result output modules (serializers, exporters, renderers).
+"""
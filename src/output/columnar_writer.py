@@ -0,0 +1,331 @@
+"""
+Compact columnar binary export of verification results.
+
+File layout (all integers little-endian):
+
+    b"PZRC" | u8 version | u32 header length | header JSON
+    block*                       one of:
+        b"D" u8 dictionary u32 count (u32 length + UTF-8)*   dictionary entries
+        b"R" u32 rows u32 raw length u32 zlib length <zlib>  row group
+        b"S" u32 length <JSON>                               summary (last block)
+    u64 offset of the "S" block | b"PZRC"
+
+A row group holds columns one after another, each as u32 byte length + data:
+email lengths (u32), email bytes, status (u8), smtp_status (u8),
+catch_all (u8: 0 unknown, 1 false, 2 true) and one u32 id column per
+dictionary (0xFFFFFFFF = null). Status enums are dictionary-encoded against
+the header tables; domains, MX sets, SMTP responses, error messages and
+domain categories are deduplicated through dictionaries.
+
+Dictionaries are scoped to one row group: the "D" blocks before
+an "R" block hold exactly the entries its ids refer to, and both sides start
+empty dictionaries for the next group. SMTP replies and error messages are
+mostly unique (queue IDs, addresses), so writer and reader memory stays
+bounded by the row group size however long the export runs.
+"""
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional
+
+from src.models.result import SMTPStatus, VerificationResult, VerificationStatus
+from src.output.summary import ResultSummary
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+MAGIC = b"PZRC"
+VERSION = 1
+NULL_ID = 0xFFFFFFFF
+DICTIONARIES = ("domain", "mx_records", "smtp_response", "error_message", "domain_category")
+CATCH_ALL_CODES = {None: 0, False: 1, True: 2}
+CATCH_ALL_VALUES = (None, False, True)
+
+
+def _le(values: array) -> bytes:
+    """Get little-endian bytes of an array."""
+    if sys.byteorder != "little" and values.itemsize > 1:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_le(typecode: str, data: bytes) -> array:
+    """Build array from little-endian bytes."""
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder != "little" and values.itemsize > 1:
+        values.byteswap()
+    return values
+
+
+class ResultColumnarWriter:
+    """
+    Writes results incrementally into the columnar format described above.
+
+    Also keeps a ResultSummary that is stored in the file footer, so per-status
+    and per-domain counts can be read without scanning rows.
+    """
+
+    ROW_GROUP_SIZE = 65536
+    COMPRESSION_LEVEL = 6
+
+    def __init__(self, output_path: str, row_group_size: int = ROW_GROUP_SIZE):
+        """
+        Open output file and write header.
+
+        Args:
+            output_path: Path to output file
+            row_group_size: Rows buffered before a row group is written
+        """
+        self.output_path = output_path
+        self.row_group_size = row_group_size
+        self.count = 0
+        self.summary = ResultSummary()
+        self._status_codes = {status: code for code, status in enumerate(VerificationStatus)}
+        self._smtp_codes = {status: code for code, status in enumerate(SMTPStatus)}
+        self._dicts: List[Dict[str, int]] = [{} for _ in DICTIONARIES]
+        self._new_entries: List[List[str]] = [[] for _ in DICTIONARIES]
+        self._reset_buffers()
+
+        self._file: Optional[BinaryIO] = open(output_path, "wb")
+        header = json.dumps(
+            {
+                "status": [status.value for status in VerificationStatus],
+                "smtp_status": [status.value for status in SMTPStatus],
+                "dictionaries": list(DICTIONARIES),
+            }
+        ).encode("utf-8")
+        self._file.write(MAGIC + struct.pack("<BI", VERSION, len(header)) + header)
+
+    def _reset_buffers(self) -> None:
+        """Start a new row group."""
+        self._emails: List[bytes] = []
+        self._status = array("B")
+        self._smtp_status = array("B")
+        self._catch_all = array("B")
+        self._ids = [array("I") for _ in DICTIONARIES]
+
+    def _encode(self, dict_index: int, value: Optional[str]) -> int:
+        """
+        Get dictionary id for a value, adding it if new.
+
+        Args:
+            dict_index: Index into DICTIONARIES
+            value: String value (None = null)
+
+        Returns:
+            Dictionary id
+        """
+        if value is None:
+            return NULL_ID
+        entries = self._dicts[dict_index]
+        value_id = entries.get(value)
+        if value_id is None:
+            value_id = entries[value] = len(entries)
+            self._new_entries[dict_index].append(value)
+        return value_id
+
+    def write(self, result: VerificationResult) -> None:
+        """
+        Write one result.
+
+        Args:
+            result: Verification result
+        """
+        self._emails.append(result.email.encode("utf-8"))
+        self._status.append(self._status_codes[result.status])
+        self._smtp_status.append(self._smtp_codes[result.smtp_status])
+        self._catch_all.append(CATCH_ALL_CODES[result.catch_all])
+        mx_records = "\n".join(result.mx_records) if result.mx_records is not None else None
+        for dict_index, value in enumerate(
+            (result.domain, mx_records, result.smtp_response, result.error_message, result.domain_category)
+        ):
+            self._ids[dict_index].append(self._encode(dict_index, value))
+
+        self.summary.add(result)
+        self.count += 1
+
+        if len(self._emails) >= self.row_group_size:
+            self._flush()
+
+    def write_many(self, results: Iterable[VerificationResult]) -> None:
+        """
+        Write many results.
+
+        Args:
+            results: Verification results
+        """
+        for result in results:
+            self.write(result)
+
+    def _flush(self) -> None:
+        """Write pending dictionary entries and the buffered row group."""
+        if not self._emails:
+            return
+
+        for dict_index, entries in enumerate(self._new_entries):
+            if not entries:
+                continue
+            chunks = [b"D", struct.pack("<BI", dict_index, len(entries))]
+            for entry in entries:
+                data = entry.encode("utf-8")
+                chunks.append(struct.pack("<I", len(data)))
+                chunks.append(data)
+            self._file.write(b"".join(chunks))
+            entries.clear()
+
+        columns = [
+            _le(array("I", map(len, self._emails))),
+            b"".join(self._emails),
+            self._status.tobytes(),
+            self._smtp_status.tobytes(),
+            self._catch_all.tobytes(),
+        ] + [_le(ids) for ids in self._ids]
+        raw = b"".join(struct.pack("<I", len(column)) + column for column in columns)
+        compressed = zlib.compress(raw, self.COMPRESSION_LEVEL)
+
+        self._file.write(b"R" + struct.pack("<III", len(self._emails), len(raw), len(compressed)))
+        self._file.write(compressed)
+        self._reset_buffers()
+        for entries in self._dicts:
+            entries.clear()
+
+    def close(self) -> None:
+        """Write remaining rows and the summary footer, then close the file."""
+        if self._file is None:
+            return
+
+        self._flush()
+        summary_offset = self._file.tell()
+        summary = json.dumps(self.summary.to_dict(), ensure_ascii=False).encode("utf-8")
+        self._file.write(b"S" + struct.pack("<I", len(summary)) + summary)
+        self._file.write(struct.pack("<Q", summary_offset) + MAGIC)
+        self._file.close()
+        self._file = None
+        logger.info(f"Results saved to columnar file: {self.output_path} ({self.count} result(s))")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - finish file."""
+        self.close()
+
+
+class ResultColumnarReader:
+    """
+    Reads files written by ResultColumnarWriter.
+    """
+
+    def __init__(self, input_path: str):
+        """
+        Initialize reader.
+
+        Args:
+            input_path: Path to columnar file
+        """
+        self.input_path = input_path
+
+    def read_summary(self) -> dict:
+        """
+        Read the summary footer without scanning rows.
+
+        Returns:
+            Summary dictionary (see ResultSummary.to_dict)
+
+        Raises:
+            ValueError: If the file is not a complete columnar file
+        """
+        with open(self.input_path, "rb") as f:
+            f.seek(-12, 2)
+            summary_offset, magic = struct.unpack("<Q4s", f.read(12))
+            if magic != MAGIC:
+                raise ValueError(f"Not a complete columnar result file: {self.input_path}")
+            f.seek(summary_offset)
+            block_type, length = struct.unpack("<cI", f.read(5))
+            if block_type != b"S":
+                raise ValueError(f"Corrupted summary block in {self.input_path}")
+            return json.loads(f.read(length))
+
+    def __iter__(self) -> Iterator[VerificationResult]:
+        """
+        Iterate over all results.
+
+        Yields:
+            VerificationResult objects in write order
+
+        Raises:
+            ValueError: If the file is not a columnar result file
+        """
+        with open(self.input_path, "rb") as f:
+            magic, version, header_len = struct.unpack("<4sBI", f.read(9))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"Not a columnar result file: {self.input_path}")
+            header = json.loads(f.read(header_len))
+            statuses = [VerificationStatus(value) for value in header["status"]]
+            smtp_statuses = [SMTPStatus(value) for value in header["smtp_status"]]
+            dicts: List[list] = [[] for _ in header["dictionaries"]]
+            mx_index = header["dictionaries"].index("mx_records")
+
+            while True:
+                block_type = f.read(1)
+                if block_type == b"D":
+                    dict_index, count = struct.unpack("<BI", f.read(5))
+                    entries = dicts[dict_index]
+                    for _ in range(count):
+                        (length,) = struct.unpack("<I", f.read(4))
+                        value = f.read(length).decode("utf-8")
+                        entries.append(tuple(value.split("\n")) if dict_index == mx_index else value)
+                elif block_type == b"R":
+                    rows, _, compressed_len = struct.unpack("<III", f.read(12))
+                    yield from self._read_row_group(
+                        zlib.decompress(f.read(compressed_len)), rows, statuses, smtp_statuses, dicts
+                    )
+                    for entries in dicts:
+                        entries.clear()
+                else:
+                    # Summary block or end of file
+                    return
+
+    @staticmethod
+    def _read_row_group(
+        raw: bytes, rows: int, statuses: list, smtp_statuses: list, dicts: List[list]
+    ) -> Iterator[VerificationResult]:
+        """Decode one row group."""
+        columns = []
+        pos = 0
+        while pos < len(raw):
+            (length,) = struct.unpack_from("<I", raw, pos)
+            pos += 4
+            columns.append(raw[pos:pos + length])
+            pos += length
+
+        email_lengths = _from_le("I", columns[0])
+        email_bytes = columns[1]
+        status, smtp_status, catch_all = columns[2], columns[3], columns[4]
+        ids = [_from_le("I", column) for column in columns[5:]]
+
+        def lookup(dict_index: int, row: int):
+            value_id = ids[dict_index][row]
+            return None if value_id == NULL_ID else dicts[dict_index][value_id]
+
+        offset = 0
+        for row in range(rows):
+            end = offset + email_lengths[row]
+            yield VerificationResult(
+                email=email_bytes[offset:end].decode("utf-8"),
+                status=statuses[status[row]],
+                smtp_status=smtp_statuses[smtp_status[row]],
+                domain=lookup(0, row),
+                mx_records=lookup(1, row),
+                smtp_response=lookup(2, row),
+                error_message=lookup(3, row),
+                catch_all=CATCH_ALL_VALUES[catch_all[row]],
+                domain_category=lookup(4, row),
+            )
+            offset = end
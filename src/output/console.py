@@ -0,0 +1,150 @@
+"""
+Buffered console rendering of verification results and summaries.
+"""
+
+import sys
+from typing import Iterable, List, Optional, TextIO
+
+from src.models.result import SMTPStatus, VerificationResult
+from src.output.summary import ResultSummary
+
+
+class ConsoleRenderer:
+    """
+    Renders results to a text stream with few large writes.
+
+    Lines are collected in memory and written once the buffer holds
+    buffer_size results, instead of one print() call per line.
+    """
+
+    SEPARATOR = "=" * 80
+    BUFFER_SIZE = 1000  # results per write
+
+    def __init__(self, stream: Optional[TextIO] = None, buffer_size: int = BUFFER_SIZE):
+        """
+        Initialize renderer.
+
+        Args:
+            stream: Output stream (default: sys.stdout)
+            buffer_size: Results rendered per write
+        """
+        self.stream = stream or sys.stdout
+        self.buffer_size = buffer_size
+        self.count = 0
+        self._buffer: List[str] = []
+        self._buffered = 0
+
+    @staticmethod
+    def format_result(idx: int, result: VerificationResult) -> str:
+        """
+        Format one result as human-readable text.
+
+        Console output follows TZ requirements:
+        - Status: get_domain_status() (the 3 TZ values for checked domains)
+        - SMTP: separate field (verified/rejected/unavailable)
+
+        Args:
+            idx: 1-based result number
+            result: Verification result
+
+        Returns:
+            Multi-line text block ending with an empty line
+        """
+        lines = [
+            f"{idx}. Email: {result.email}",
+            f"   Status: {result.get_domain_status()}",
+        ]
+
+        if result.domain:
+            lines.append(f"   Domain: {result.domain}")
+
+        if result.mx_records:
+            # Filter out empty MX records
+            valid_mx = [mx for mx in result.mx_records if mx]
+            if valid_mx:
+                lines.append(f"   MX Records: {', '.join(valid_mx)}")
+
+        # Show SMTP status separately
+        if result.smtp_status != SMTPStatus.NOT_CHECKED:
+            lines.append(f"   SMTP: {result.get_smtp_status_text()}")
+
+        if result.smtp_response:
+            lines.append(f"   SMTP Response: {result.smtp_response}")
+
+        if result.error_message:
+            lines.append(f"   Error: {result.error_message}")
+
+        lines.append("\n")
+        return "\n".join(lines)
+
+    def header(self) -> None:
+        """Render results header."""
+        self._buffer.append(f"\n{self.SEPARATOR}\nEMAIL VERIFICATION RESULTS\n{self.SEPARATOR}\n\n")
+
+    def render(self, result: VerificationResult) -> None:
+        """
+        Render one result (buffered).
+
+        Args:
+            result: Verification result
+        """
+        self.count += 1
+        self._buffer.append(self.format_result(self.count, result))
+        self._buffered += 1
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def render_many(self, results: Iterable[VerificationResult]) -> None:
+        """
+        Render many results.
+
+        Args:
+            results: Verification results
+        """
+        for result in results:
+            self.render(result)
+
+    def footer(self) -> None:
+        """Render results footer and flush."""
+        self._buffer.append(f"{self.SEPARATOR}\n")
+        self.flush()
+
+    def render_summary(self, summary: ResultSummary, top: int = 10) -> None:
+        """
+        Render aggregate counts and top failing domains, then flush.
+
+        Args:
+            summary: Aggregated results
+            top: Number of failing domains to show
+        """
+        lines = [
+            "",
+            self.SEPARATOR,
+            "EMAIL VERIFICATION SUMMARY",
+            self.SEPARATOR,
+            "",
+            f"Total: {summary.total}",
+            "",
+            "By status:",
+        ]
+        for status, count in summary.by_status.most_common():
+            share = count / summary.total * 100 if summary.total else 0
+            lines.append(f"   {status.value:20s} {count:>10}  {share:6.2f}%")
+
+        failing = summary.top_domains(top, failing_only=True)
+        if failing:
+            lines += ["", f"Top {len(failing)} failing domain(s):"]
+            for domain, count in failing:
+                lines.append(f"   {domain:40s} {count:>10}")
+
+        lines += ["", self.SEPARATOR, ""]
+        self._buffer.append("\n".join(lines))
+        self.flush()
+
+    def flush(self) -> None:
+        """Write buffered text to the stream."""
+        if self._buffer:
+            self.stream.write("".join(self._buffer))
+            self._buffer.clear()
+        self._buffered = 0
+        self.stream.flush()
@@ -0,0 +1,103 @@
+"""
+Streaming CSV export of verification results.
+"""
+
+import csv
+from typing import Iterable, Optional, TextIO
+
+from src.models.result import VerificationResult
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ResultCSVWriter:
+    """
+    Writes results incrementally as CSV rows (one row per result).
+
+    Columns follow VerificationResult.to_dict(); MX hosts are joined with ";"
+    and booleans are written as true/false (empty for unknown).
+    """
+
+    COLUMNS = (
+        "email",
+        "status",
+        "smtp_status",
+        "domain",
+        "mx_records",
+        "smtp_response",
+        "error_message",
+        "catch_all",
+        "domain_category",
+    )
+    BUFFER_SIZE = 1024 * 1024  # bytes
+
+    def __init__(self, output_path: str):
+        """
+        Open output file and write header.
+
+        Args:
+            output_path: Path to output CSV file
+        """
+        self.output_path = output_path
+        self.count = 0
+        self._file: Optional[TextIO] = open(
+            output_path, "w", encoding="utf-8", newline="", buffering=self.BUFFER_SIZE
+        )
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.COLUMNS)
+
+    @staticmethod
+    def _bool(value: Optional[bool]) -> str:
+        """Format optional boolean for CSV."""
+        if value is None:
+            return ""
+        return "true" if value else "false"
+
+    def write(self, result: VerificationResult) -> None:
+        """
+        Write one result.
+
+        Args:
+            result: Verification result
+        """
+        self._writer.writerow(
+            (
+                result.email,
+                result.status.value,
+                result.smtp_status.value,
+                result.domain or "",
+                ";".join(result.mx_records) if result.mx_records else "",
+                result.smtp_response or "",
+                result.error_message or "",
+                self._bool(result.catch_all),
+                result.domain_category or "",
+            )
+        )
+        self.count += 1
+
+    def write_many(self, results: Iterable[VerificationResult]) -> None:
+        """
+        Write many results.
+
+        Args:
+            results: Verification results
+        """
+        for result in results:
+            self.write(result)
+
+    def close(self) -> None:
+        """Close the file."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        logger.info(f"Results saved to CSV file: {self.output_path} ({self.count} result(s))")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close file."""
+        self.close()
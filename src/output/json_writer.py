@@ -0,0 +1,161 @@
+"""
+Streaming JSON / JSON Lines serializer for verification results.
+"""
+
+import json
+from typing import BinaryIO, Callable, Iterable, Optional
+
+from src.models.result import VerificationResult
+from src.utils.logger import setup_logger
+
+try:
+    import orjson
+except ImportError:  # optional faster backend
+    orjson = None
+
+logger = setup_logger(__name__)
+
+
+def _json_dumps(data: dict) -> bytes:
+    """Encode with the standard library backend."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def get_encoder(backend: str = "auto") -> Callable[[dict], bytes]:
+    """
+    Get JSON encoder function.
+
+    Args:
+        backend: "orjson", "json" or "auto" (orjson if installed)
+
+    Returns:
+        Function encoding a dict to UTF-8 bytes
+
+    Raises:
+        ValueError: If backend is unknown or orjson was requested but not installed
+    """
+    if backend == "auto":
+        backend = "orjson" if orjson is not None else "json"
+
+    if backend == "orjson":
+        if orjson is None:
+            raise ValueError("orjson backend requested but orjson is not installed")
+        return orjson.dumps
+    if backend == "json":
+        return _json_dumps
+
+    raise ValueError(f"Unknown JSON backend: {backend}")
+
+
+def _get_indented_encoder(backend: str = "auto") -> Callable[[dict], bytes]:
+    """
+    Get JSON encoder producing json.dump(indent=2) layout.
+
+    Args:
+        backend: "orjson", "json" or "auto" (orjson if installed)
+
+    Returns:
+        Function encoding a dict to UTF-8 bytes with two-space indentation
+    """
+    if get_encoder(backend) is _json_dumps:
+        return lambda data: json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return lambda data: orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+
+class ResultJSONWriter:
+    """
+    Writes results incrementally as JSON Lines or as a streamed JSON document.
+
+    JSON Lines ("jsonl"): one result object per line.
+    JSON ("json"): {"total": N, "results": [...]} in the json.dump(indent=2)
+    layout. The total is only known at the end, so room for it is reserved
+    at the top and filled in on close; if the output cannot seek (a pipe),
+    the total follows the results instead.
+    """
+
+    FORMATS = ("json", "jsonl")
+    BUFFER_SIZE = 1024 * 1024  # bytes
+
+    # Room reserved for the total and its comma (padded with spaces)
+    TOTAL_WIDTH = 21
+
+    def __init__(self, output_path: str, fmt: str = "json", backend: str = "auto"):
+        """
+        Open output file.
+
+        Args:
+            output_path: Path to output file
+            fmt: "json" (streamed document) or "jsonl" (JSON Lines)
+            backend: JSON backend ("auto", "orjson" or "json")
+
+        Raises:
+            ValueError: If format or backend is unknown
+        """
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown output format: {fmt}")
+
+        self.output_path = output_path
+        self.fmt = fmt
+        self.count = 0
+        self._encode = get_encoder(backend) if fmt == "jsonl" else _get_indented_encoder(backend)
+        self._file: Optional[BinaryIO] = open(output_path, "wb", buffering=self.BUFFER_SIZE)
+        self._total_offset: Optional[int] = None
+
+        if fmt == "json":
+            if self._file.seekable():
+                self._file.write(b'{\n  "total": ')
+                self._total_offset = self._file.tell()
+                self._file.write(b" " * self.TOTAL_WIDTH + b"\n")
+            else:
+                self._file.write(b"{\n")
+            self._file.write(b'  "results": [')
+
+    def write(self, result: VerificationResult) -> None:
+        """
+        Write one result.
+
+        Args:
+            result: Verification result
+        """
+        data = self._encode(result.to_dict())
+        if self.fmt == "jsonl":
+            self._file.write(data + b"\n")
+        else:
+            self._file.write((b"\n    " if self.count == 0 else b",\n    ") + data.replace(b"\n", b"\n    "))
+        self.count += 1
+
+    def write_many(self, results: Iterable[VerificationResult]) -> None:
+        """
+        Write many results.
+
+        Args:
+            results: Verification results
+        """
+        for result in results:
+            self.write(result)
+
+    def close(self) -> None:
+        """Finish the document and close the file."""
+        if self._file is None:
+            return
+
+        if self.fmt == "json":
+            self._file.write(b"\n  ]" if self.count else b"]")
+            if self._total_offset is None:
+                self._file.write(f',\n  "total": {self.count}\n}}'.encode("utf-8"))
+            else:
+                self._file.write(b"\n}")
+                self._file.seek(self._total_offset)
+                self._file.write(f"{self.count},".ljust(self.TOTAL_WIDTH).encode("utf-8"))
+
+        self._file.close()
+        self._file = None
+        logger.info(f"Results saved to {self.fmt.upper()} file: {self.output_path} ({self.count} result(s))")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - finish document."""
+        self.close()
@@ -0,0 +1,106 @@
+"""
+Live progress line for bulk verification.
+"""
+
+import sys
+import time
+from typing import Optional, TextIO
+
+
+def format_duration(seconds: float) -> str:
+    """
+    Format seconds as HH:MM:SS.
+
+    Args:
+        seconds: Duration in seconds
+
+    Returns:
+        Formatted duration
+    """
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+class ProgressReporter:
+    """
+    Shows processed count, addresses per second and ETA on one line.
+
+    On a terminal the line is redrawn in place at most every `interval`
+    seconds; on a pipe (cron jobs, log files) a full line is written every
+    `pipe_interval` seconds instead, so logs are not flooded.
+    """
+
+    def __init__(
+        self,
+        total: Optional[int] = None,
+        stream: Optional[TextIO] = None,
+        interval: float = 0.5,
+        pipe_interval: float = 10.0,
+    ):
+        """
+        Initialize progress reporter.
+
+        Args:
+            total: Expected number of addresses (None = unknown, no ETA)
+            stream: Output stream (default: sys.stderr)
+            interval: Seconds between redraws on a terminal
+            pipe_interval: Seconds between lines when not a terminal
+        """
+        self.total = total
+        self.stream = stream or sys.stderr
+        self.is_tty = hasattr(self.stream, "isatty") and self.stream.isatty()
+        self.interval = interval if self.is_tty else pipe_interval
+        self.done = 0
+        self.started_at = time.monotonic()
+        self._next_render = self.started_at + self.interval
+
+    def update(self, count: int = 1) -> None:
+        """
+        Account for processed addresses and redraw if due.
+
+        Args:
+            count: Number of newly processed addresses
+        """
+        self.done += count
+        now = time.monotonic()
+        if now >= self._next_render:
+            self._next_render = now + self.interval
+            self._render(now)
+
+    def format_line(self, now: float) -> str:
+        """
+        Build progress text.
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            Progress line without line terminator
+        """
+        elapsed = max(now - self.started_at, 1e-9)
+        rate = self.done / elapsed
+
+        if self.total:
+            percent = self.done / self.total * 100
+            remaining = (self.total - self.done) / rate if rate > 0 else 0
+            return (
+                f"[{self.done}/{self.total}] {percent:5.1f}% | {rate:,.1f} addr/s | "
+                f"elapsed {format_duration(elapsed)} | ETA {format_duration(remaining)}"
+            )
+        return f"[{self.done}] {rate:,.1f} addr/s | elapsed {format_duration(elapsed)}"
+
+    def _render(self, now: float) -> None:
+        """Write progress line."""
+        line = self.format_line(now)
+        if self.is_tty:
+            self.stream.write(f"\r\033[K{line}")
+        else:
+            self.stream.write(f"{line}\n")
+        self.stream.flush()
+
+    def close(self) -> None:
+        """Write final progress line."""
+        self._render(time.monotonic())
+        if self.is_tty:
+            self.stream.write("\n")
+            self.stream.flush()
@@ -0,0 +1,96 @@
+"""
+On-the-fly summary aggregation of verification results.
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.models.result import VerificationResult, VerificationStatus
+
+
+class ResultSummary:
+    """
+    Counts results per VerificationStatus and per domain as they stream by.
+    """
+
+    # Statuses that count as failures for "top failing domains"
+    FAILURE_STATUSES = frozenset(
+        {
+            VerificationStatus.DOMAIN_NOT_FOUND,
+            VerificationStatus.NO_MX_RECORDS,
+            VerificationStatus.SMTP_UNAVAILABLE,
+            VerificationStatus.SMTP_REJECTED,
+            VerificationStatus.BLOCKED_DOMAIN,
+            VerificationStatus.DEADLINE_EXCEEDED,
+        }
+    )
+
+    def __init__(self):
+        """Initialize empty summary."""
+        self.total = 0
+        self.by_status: Counter = Counter()
+        self.by_domain: Dict[Optional[str], Counter] = {}
+
+    def add(self, result: VerificationResult) -> None:
+        """
+        Account for one result.
+
+        Args:
+            result: Verification result
+        """
+        self.total += 1
+        self.by_status[result.status] += 1
+        domain_counts = self.by_domain.get(result.domain)
+        if domain_counts is None:
+            domain_counts = self.by_domain[result.domain] = Counter()
+        domain_counts[result.status] += 1
+
+    def add_many(self, results: Iterable[VerificationResult]) -> None:
+        """
+        Account for many results.
+
+        Args:
+            results: Verification results
+        """
+        for result in results:
+            self.add(result)
+
+    def top_domains(self, limit: int = 10, failing_only: bool = False) -> List[Tuple[str, int]]:
+        """
+        Get domains with the most results.
+
+        Args:
+            limit: Maximum number of domains
+            failing_only: Count only failed verifications
+
+        Returns:
+            List of (domain, count) sorted by count descending
+        """
+        totals = Counter()
+        for domain, counts in self.by_domain.items():
+            if domain is None:
+                continue
+            if failing_only:
+                count = sum(n for status, n in counts.items() if status in self.FAILURE_STATUSES)
+            else:
+                count = sum(counts.values())
+            if count:
+                totals[domain] = count
+        return totals.most_common(limit)
+
+    def to_dict(self) -> dict:
+        """
+        Convert summary to dictionary for JSON serialization.
+
+        Returns:
+            Dictionary with total, per-status and per-domain counts
+        """
+        return {
+            "total": self.total,
+            "by_status": {status.value: count for status, count in self.by_status.most_common()},
+            "by_domain": {
+                domain: {status.value: count for status, count in counts.items()}
+                for domain, counts in self.by_domain.items()
+                if domain is not None
+            },
+        }
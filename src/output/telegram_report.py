@@ -0,0 +1,167 @@
+"""
+Live verification progress in one Telegram message.
+"""
+
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+import config
+from src.models.result import VerificationResult, VerificationStatus
+from src.output.progress import format_duration
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class TelegramReport:
+    """
+    Aggregates results and keeps one Telegram message updated with the totals.
+
+    add() only bumps counters, so it is cheap at any result rate. A
+    background thread posts the summary (counts per VerificationStatus,
+    addresses per second, ETA) once and then edits that same message with
+    editMessageText every `interval` seconds: one request per interval
+    however many results arrive. Failed requests are logged and retried on
+    the next tick; they never interrupt verification.
+
+    Example:
+        with TelegramClient(token) as client:
+            report = TelegramReport(client, chat_id, total=len(emails))
+            report.start()
+            for result in service.iter_verify(emails):
+                report.add(result)
+            report.close()
+    """
+
+    def __init__(
+        self,
+        client,
+        chat_id: str,
+        total: Optional[int] = None,
+        interval: float = config.TELEGRAM_REPORT_INTERVAL,
+        title: str = "Email verification",
+    ):
+        """
+        Initialize report.
+
+        Args:
+            client: TelegramClient used for sending and editing
+            chat_id: Chat to report to
+            total: Expected number of addresses (None = unknown, no ETA)
+            interval: Seconds between message edits
+            title: First line of the message
+        """
+        self.client = client
+        self.chat_id = chat_id
+        self.total = total
+        self.interval = interval
+        self.title = title
+        self.done = 0
+        self.by_status: Counter = Counter()
+        self.started_at = time.monotonic()
+        self.message_id: Optional[int] = None
+        self._last_text: Optional[str] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, result: VerificationResult) -> None:
+        """
+        Account for one result.
+
+        Args:
+            result: Verification result
+        """
+        with self._lock:
+            self.done += 1
+            self.by_status[result.status] += 1
+
+    def format_text(self, now: float, state: str = "running") -> str:
+        """
+        Build message text.
+
+        Args:
+            now: Current monotonic time
+            state: Run state shown in the title (running, finished, stopped)
+
+        Returns:
+            Message text
+        """
+        with self._lock:
+            done = self.done
+            by_status = self.by_status.copy()
+
+        elapsed = max(now - self.started_at, 1e-9)
+        rate = done / elapsed
+        lines = [f"{self.title}: {state}"]
+
+        if self.total:
+            lines.append(f"Processed: {done:,} / {self.total:,} ({done / self.total * 100:.1f}%)")
+        else:
+            lines.append(f"Processed: {done:,}")
+
+        timing = f"Rate: {rate:,.1f} addr/s | Elapsed: {format_duration(elapsed)}"
+        if self.total and state == "running":
+            remaining = (self.total - done) / rate if rate > 0 else 0
+            timing += f" | ETA: {format_duration(remaining)}"
+        lines.append(timing)
+
+        lines.append("")
+        for status in VerificationStatus:
+            count = by_status.get(status, 0)
+            if count:
+                lines.append(f"{status.value}: {count:,} ({count / done * 100:.1f}%)")
+        return "\n".join(lines)
+
+    def push(self, state: str = "running") -> bool:
+        """
+        Post or edit the report message now.
+
+        Args:
+            state: Run state shown in the title (running, finished, stopped)
+
+        Returns:
+            True if the message shows the current text
+        """
+        text = self.format_text(time.monotonic(), state)
+        if text == self._last_text:
+            return True
+
+        if self.message_id is None:
+            self.message_id, error = self.client.send_editable_message(self.chat_id, text)
+            success = self.message_id is not None
+        else:
+            success, error = self.client.edit_message_text(self.chat_id, self.message_id, text)
+
+        if success:
+            self._last_text = text
+        else:
+            logger.warning(f"Telegram report not updated: {error}")
+        return success
+
+    def _run(self) -> None:
+        """Update the message every interval until closed."""
+        self.push()
+        while not self._stop.wait(self.interval):
+            self.push()
+
+    def start(self) -> None:
+        """Start background updates."""
+        self.started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="telegram-report", daemon=True)
+        self._thread.start()
+
+    def close(self, completed: bool = True) -> None:
+        """
+        Stop background updates and show the final totals.
+
+        Args:
+            completed: False if the run was interrupted (shown as stopped)
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.push("finished" if completed else "stopped")
@@ -0,0 +1,242 @@
+"""
+Pool of sending identities (source address, EHLO name, MAIL FROM) for SMTP probes.
+"""
+
+import errno
+import ipaddress
+import smtplib
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import config
+from src.utils.deadline import Deadline, DeadlineExceeded
+from src.utils.logger import setup_logger
+from src.utils.metrics import REGISTRY
+from src.utils.rate_limiter import TokenBucket
+
+logger = setup_logger(__name__)
+
+SMTP_IDENTITY_PROBES = REGISTRY.counter(
+    "email_verifier_smtp_identity_probes_total", "SMTP probes by sending identity", ("identity", "outcome")
+)
+
+# Keys of an identity in config.SMTP_IDENTITIES
+_IDENTITY_KEYS = frozenset({"name", "source_address", "helo", "from_email", "rate", "burst"})
+
+# Errors binding the local address: the identity itself is unusable
+_BIND_ERRNOS = frozenset({errno.EADDRNOTAVAIL, errno.EADDRINUSE})
+
+
+class SMTPIdentity:
+    """
+    One sending identity with its own rate limit and health state.
+    """
+
+    def __init__(
+        self,
+        from_email: str,
+        source_address: Optional[str] = None,
+        helo: Optional[str] = None,
+        name: Optional[str] = None,
+        rate: float = 0,
+        burst: float = 1,
+    ):
+        """
+        Initialize identity.
+
+        Args:
+            from_email: Address for MAIL FROM
+            source_address: Local IP address to connect from (None = chosen by the OS)
+            helo: EHLO/HELO name (None = local FQDN)
+            name: Label in logs and metrics (default: the non-empty settings)
+            rate: Probes per second (0 = unlimited)
+            burst: Probes allowed at once
+
+        Raises:
+            ValueError: If source_address is not an IP address or rate is negative
+        """
+        if source_address is not None:
+            source_address = str(ipaddress.ip_address(source_address))
+        if rate < 0:
+            raise ValueError(f"Rate must not be negative: {rate}")
+        self.from_email = from_email
+        self.source_address = source_address
+        self.helo = helo
+        self.name = name or " ".join(part for part in (source_address, helo, from_email) if part)
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.probes = 0
+        self.failures = 0  # consecutive
+        self.cooldown_until = 0.0  # monotonic time
+
+
+class IdentityPool:
+    """
+    Spreads SMTP probes over several sending identities.
+
+    acquire() hands out identities round-robin, skipping those that are
+    out of rate tokens or cooling down; when every identity is busy it
+    waits for the first token, and when all are cooling down it uses the
+    one that recovers first. Each probe reports back whether the remote
+    side objected to the identity (banner or EHLO refused, MAIL FROM
+    rejected, 421, 5.7.x policy replies, local bind errors). After
+    max_failures such probes in a row the identity sits out `cooldown`
+    seconds; one more failure afterwards puts it back, a clean answer
+    clears the count. Network failures say nothing about the identity and
+    leave its health unchanged.
+
+    Example:
+        pool = IdentityPool([{"source_address": "127.0.0.2", "helo": "a.sim"},
+                             {"source_address": "127.0.0.3", "helo": "b.sim"}])
+        verifier = SMTPVerifier(identities=pool)
+    """
+
+    def __init__(
+        self,
+        identities: List[Dict[str, Any]],
+        from_email: str = config.SMTP_FROM_EMAIL,
+        rate: float = config.SMTP_IDENTITY_RATE,
+        max_failures: int = config.SMTP_IDENTITY_MAX_FAILURES,
+        cooldown: float = config.SMTP_IDENTITY_COOLDOWN,
+    ):
+        """
+        Initialize pool.
+
+        Args:
+            identities: Identity settings (keys: name, source_address, helo,
+                from_email, rate, burst), see config.SMTP_IDENTITIES
+            from_email: MAIL FROM of identities that do not set one
+            rate: Probes per second of identities that do not set one (0 = unlimited)
+            max_failures: Consecutive failures before a cooldown
+            cooldown: Seconds an identity is skipped after max_failures
+
+        Raises:
+            ValueError: If the list is empty or an identity is invalid
+        """
+        if not identities:
+            raise ValueError("Identity pool needs at least one identity")
+        self.identities: List[SMTPIdentity] = []
+        for spec in identities:
+            unknown = set(spec) - _IDENTITY_KEYS
+            if unknown:
+                raise ValueError(f"Unknown SMTP identity setting(s): {', '.join(sorted(unknown))}")
+            self.identities.append(
+                SMTPIdentity(
+                    from_email=spec.get("from_email") or from_email,
+                    source_address=spec.get("source_address"),
+                    helo=spec.get("helo"),
+                    name=spec.get("name"),
+                    rate=spec.get("rate", rate),
+                    burst=spec.get("burst", 1),
+                )
+            )
+        self.max_failures = max(max_failures, 1)
+        self.cooldown = cooldown
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, deadline: Optional[Deadline] = None) -> SMTPIdentity:
+        """
+        Pick the identity for the next probe, waiting for its rate token if needed.
+
+        Args:
+            deadline: Optional budget of the probe; the wait for a token
+                must fit into it
+
+        Returns:
+            Identity to probe with
+
+        Raises:
+            DeadlineExceeded: If the next token is due after the deadline
+                (no token is taken)
+        """
+        with self._lock:
+            now = time.monotonic()
+            count = len(self.identities)
+            order = [self.identities[(self._next + i) % count] for i in range(count)]
+            ready = [identity for identity in order if identity.cooldown_until <= now]
+
+            if ready:
+                identity = min(ready, key=lambda i: i.bucket.wait_time() if i.bucket else 0.0)
+            else:
+                identity = min(order, key=lambda i: i.cooldown_until)
+                logger.debug("All SMTP identities cooling down, using %s", identity.name)
+
+            if identity.bucket and deadline is not None:
+                remaining = deadline.remaining()
+                if remaining is not None and identity.bucket.wait_time() > remaining:
+                    raise DeadlineExceeded(f"Deadline exceeded before a rate token of SMTP identity {identity.name}")
+
+            self._next = (self.identities.index(identity) + 1) % count
+            identity.probes += 1
+            delay = identity.bucket.reserve() if identity.bucket else 0.0
+
+        if delay > 0:
+            time.sleep(delay)
+        return identity
+
+    def report(self, identity: SMTPIdentity, healthy: Optional[bool]) -> None:
+        """
+        Record what a probe said about its identity.
+
+        Args:
+            identity: Identity returned by acquire()
+            healthy: True if the server answered normally, False if it
+                objected to the identity, None if the probe was inconclusive
+        """
+        outcome = "unknown" if healthy is None else "ok" if healthy else "failed"
+        SMTP_IDENTITY_PROBES.inc(identity.name, outcome)
+        if healthy is None:
+            return
+
+        with self._lock:
+            if healthy:
+                identity.failures = 0
+                return
+            identity.failures += 1
+            tripped = identity.failures >= self.max_failures
+            if tripped:
+                identity.cooldown_until = time.monotonic() + self.cooldown
+
+        if tripped:
+            logger.warning(
+                f"SMTP identity {identity.name} failed {identity.failures} probe(s) in a row, "
+                f"cooling down for {self.cooldown:g}s"
+            )
+
+    @staticmethod
+    def reply_verdict(code: int, text: str) -> Optional[bool]:
+        """
+        Judge the identity by the reply to RCPT TO.
+
+        Args:
+            code: SMTP reply code
+            text: Reply text
+
+        Returns:
+            False for 421 and 5.7.x policy rejections, True for other 250/550
+            answers, None otherwise (e.g. greylisting)
+        """
+        if code == 421 or text.startswith("5.7."):
+            return False
+        if code in (250, 550):
+            return True
+        return None
+
+    @staticmethod
+    def error_verdict(error: Exception) -> Optional[bool]:
+        """
+        Judge the identity by an exception raised during the probe.
+
+        Args:
+            error: Exception from connect or the SMTP dialogue
+
+        Returns:
+            False if the server refused the session or the source address
+            could not be bound, None for network failures
+        """
+        if isinstance(error, smtplib.SMTPResponseException):
+            return False
+        if isinstance(error, OSError) and error.errno in _BIND_ERRNOS:
+            return False
+        return None
@@ -2,15 +2,28 @@
 SMTP handshake verification without sending emails.
 """
 
+import secrets
 import smtplib
 import socket
+import time
+from collections import OrderedDict
 from typing import Optional, Tuple
 
 import config
+from src.smtp.identity_pool import IdentityPool
+from src.transport.smtp_transport import LiveSMTPTransport
+from src.utils.deadline import Deadline, DeadlineExceeded
 from src.utils.logger import setup_logger
+from src.utils.metrics import CACHE_LOOKUPS, REGISTRY
 
 logger = setup_logger(__name__)
 
+SMTP_CONNECTS = REGISTRY.counter("email_verifier_smtp_connects_total", "SMTP connection attempts", ("outcome",))
+SMTP_CONNECT_SECONDS = REGISTRY.histogram("email_verifier_smtp_connect_seconds", "SMTP connect latency")
+SMTP_RESPONSES = REGISTRY.counter(
+    "email_verifier_smtp_responses_total", "SMTP reply codes by command", ("command", "code")
+)
+
 
 class SMTPVerifier:
     """
@@ -21,6 +34,9 @@ class SMTPVerifier:
         self,
         timeout: int = config.SMTP_TIMEOUT,
         from_email: str = config.SMTP_FROM_EMAIL,
+        port: Optional[int] = None,
+        transport=None,
+        identities: Optional[IdentityPool] = None,
     ):
         """
         Initialize SMTP verifier.
@@ -28,39 +44,120 @@ class SMTPVerifier:
         Args:
             timeout: Connection timeout in seconds
             from_email: Email address to use in MAIL FROM command
+            port: SMTP port of MX hosts (None = config.SMTP_PORT at creation time)
+            transport: SMTP transport (default: LiveSMTPTransport); see
+                src.transport.smtp_transport for recording and replay
+            identities: Sending identities to rotate (None = built from
+                config.SMTP_IDENTITIES at creation time if set, else every
+                probe uses from_email and the default source address)
         """
         self.timeout = timeout
         self.from_email = from_email
+        self.port = port if port is not None else config.SMTP_PORT
+        self.transport = transport if transport is not None else LiveSMTPTransport()
+        if identities is None and config.SMTP_IDENTITIES:
+            identities = IdentityPool(config.SMTP_IDENTITIES, from_email=from_email)
+        self.identities = identities
+        # domain -> (catch_all, monotonic expiry), least recently used first
+        self._catch_all_cache: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()
+
+    def _apply_deadline(self, smtp, deadline: Optional[Deadline], stage: str) -> None:
+        """
+        Clamp socket timeout of an open SMTP session to the remaining budget.
+
+        Args:
+            smtp: SMTP session
+            deadline: Optional budget for the handshake
+            stage: Name of the command about to be sent
 
-    def verify_email(self, email: str, mx_host: str) -> Tuple[bool, Optional[str], Optional[str]]:
+        Raises:
+            DeadlineExceeded: If the budget has already run out
+        """
+        if deadline is None:
+            return
+        deadline.check(stage)
+        if smtp.sock:
+            smtp.sock.settimeout(deadline.clamp(self.timeout))
+
+    @staticmethod
+    def _raise_if_expired(deadline: Optional[Deadline], mx_host: str) -> None:
+        """
+        Turn a session failure caused by an exhausted budget into DeadlineExceeded.
+
+        smtplib reports a read timeout during EHLO, MAIL FROM or RCPT TO as
+        SMTPServerDisconnected, so every failure is checked against the
+        deadline, not only socket.timeout.
+
+        Raises:
+            DeadlineExceeded: If the budget has run out
+        """
+        if deadline and deadline.expired():
+            raise DeadlineExceeded(f"Deadline exceeded during SMTP session with {mx_host}")
+
+    def verify_email(
+        self, email: str, mx_host: str, deadline: Optional[Deadline] = None, probe: bool = False
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         Verify email address via SMTP handshake.
 
         Performs: EHLO -> MAIL FROM -> RCPT TO
 
+        With an identity pool, the session uses the next identity's source
+        address, EHLO name and MAIL FROM, and the replies are reported back
+        to the pool.
+
         Args:
             email: Email address to verify
             mx_host: MX server hostname to connect to
+            deadline: Optional budget the whole handshake must fit into
+            probe: email is a random catch-all probe address (the session is
+                keyed by domain in transcripts)
 
         Returns:
             Tuple of (is_valid, smtp_response, error_message)
             smtp_response format: "CODE response_text" for all successful SMTP replies
+
+        Raises:
+            DeadlineExceeded: If the budget runs out before the handshake completes
         """
         smtp = None
+        identity = None
+        healthy: Optional[bool] = None  # what the session said about the identity
         try:
+            if deadline:
+                deadline.check(f"SMTP connect to {mx_host}")
+            if self.identities is not None:
+                identity = self.identities.acquire(deadline)
+            from_email = identity.from_email if identity is not None else self.from_email
+            source_address, helo = (identity.source_address, identity.helo) if identity is not None else (None, None)
+
             # Connect to SMTP server
-            logger.debug(f"Connecting to SMTP server: {mx_host}:{config.SMTP_PORT}")
-            smtp = smtplib.SMTP(timeout=self.timeout)
-            smtp.connect(mx_host, config.SMTP_PORT)
+            logger.debug("Connecting to SMTP server: %s:%s", mx_host, self.port)
+            timeout = deadline.clamp(self.timeout) if deadline else self.timeout
+            session_key = f"*@{email.rpartition('@')[2]}" if probe else email
+            started_at = time.perf_counter()
+            try:
+                smtp = self.transport.connect(mx_host, self.port, timeout, session_key, source_address, helo)
+            except Exception as e:
+                SMTP_CONNECTS.inc("error")
+                healthy = IdentityPool.error_verdict(e)
+                raise
+            finally:
+                SMTP_CONNECT_SECONDS.observe(time.perf_counter() - started_at)
+            SMTP_CONNECTS.inc("ok")
 
             # EHLO/HELO
-            logger.debug(f"Sending EHLO to {mx_host}")
+            logger.debug("Sending EHLO to %s", mx_host)
+            self._apply_deadline(smtp, deadline, "EHLO")
             smtp.ehlo_or_helo_if_needed()
 
             # MAIL FROM
-            logger.debug(f"Sending MAIL FROM: {self.from_email}")
-            code, response = smtp.mail(self.from_email)
+            logger.debug("Sending MAIL FROM: %s", from_email)
+            self._apply_deadline(smtp, deadline, "MAIL FROM")
+            code, response = smtp.mail(from_email)
+            SMTP_RESPONSES.inc("MAIL", str(code))
             if code != 250:
+                healthy = False
                 response_text = response.decode() if isinstance(response, bytes) else str(response)
                 smtp_response = f"{code} {response_text}"
                 error_msg = f"MAIL FROM rejected with code {code}: {response_text}"
@@ -68,17 +165,20 @@ class SMTPVerifier:
                 return False, smtp_response, error_msg
 
             # RCPT TO
-            logger.debug(f"Sending RCPT TO: {email}")
+            logger.debug("Sending RCPT TO: %s", email)
+            self._apply_deadline(smtp, deadline, "RCPT TO")
             code, response = smtp.rcpt(email)
+            SMTP_RESPONSES.inc("RCPT", str(code))
 
             # Decode response
             response_text = response.decode() if isinstance(response, bytes) else str(response)
             smtp_response = f"{code} {response_text}"
+            healthy = IdentityPool.reply_verdict(code, response_text)
 
             # Analyze response code
             if code == 250:
                 # Email accepted
-                logger.info(f"Email {email} verified successfully on {mx_host}")
+                logger.debug("Email %s verified successfully on %s", email, mx_host)
                 return True, smtp_response, None
             elif code == 550:
                 # Email rejected (user does not exist)
@@ -91,12 +191,19 @@ class SMTPVerifier:
                 logger.warning(error_msg)
                 return False, smtp_response, error_msg
 
+        except DeadlineExceeded:
+            raise
+
         except smtplib.SMTPServerDisconnected as e:
+            self._raise_if_expired(deadline, mx_host)
             error_msg = f"SMTP server disconnected: {e}"
             logger.error(error_msg)
             return False, None, error_msg
 
         except smtplib.SMTPResponseException as e:
+            # Greeting or EHLO refused: the server objects to the identity
+            healthy = False
+            SMTP_RESPONSES.inc("session", str(e.smtp_code))
             response_text = e.smtp_error.decode() if isinstance(e.smtp_error, bytes) else str(e.smtp_error)
             smtp_response = f"{e.smtp_code} {response_text}"
             error_msg = f"SMTP response error (code {e.smtp_code}): {response_text}"
@@ -107,6 +214,7 @@ class SMTPVerifier:
             return False, smtp_response, error_msg
 
         except socket.timeout:
+            self._raise_if_expired(deadline, mx_host)
             error_msg = f"SMTP connection timeout to {mx_host}"
             logger.error(error_msg)
             return False, None, error_msg
@@ -122,34 +230,49 @@ class SMTPVerifier:
             return False, None, error_msg
 
         except OSError as e:
+            self._raise_if_expired(deadline, mx_host)
             error_msg = f"Network error connecting to {mx_host}: {e}"
             logger.error(error_msg)
             return False, None, error_msg
 
         except Exception as e:
+            self._raise_if_expired(deadline, mx_host)
             error_msg = f"Unexpected error during SMTP verification: {e}"
             logger.error(error_msg)
             return False, None, error_msg
 
         finally:
+            if identity is not None:
+                self.identities.report(identity, healthy)
+
             # Always close the connection
             if smtp:
                 try:
+                    if deadline and smtp.sock:
+                        # Do not let QUIT overrun an exhausted budget
+                        smtp.sock.settimeout(deadline.clamp(self.timeout))
                     smtp.quit()
-                    logger.debug(f"SMTP connection to {mx_host} closed")
+                    logger.debug("SMTP connection to %s closed", mx_host)
                 except Exception as e:
-                    logger.debug(f"Error closing SMTP connection: {e}")
+                    logger.debug("Error closing SMTP connection: %s", e)
 
-    def verify_with_fallback(self, email: str, mx_hosts: list) -> Tuple[bool, Optional[str], Optional[str]]:
+    def verify_with_fallback(
+        self, email: str, mx_hosts: list, deadline: Optional[Deadline] = None, probe: bool = False
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         Try to verify email with multiple MX hosts (fallback mechanism).
 
         Args:
             email: Email address to verify
             mx_hosts: List of MX server hostnames (ordered by priority)
+            deadline: Optional budget shared by all MX attempts
+            probe: email is a random catch-all probe address
 
         Returns:
             Tuple of (is_valid, smtp_response, error_message)
+
+        Raises:
+            DeadlineExceeded: If the budget runs out before a definitive answer
         """
         if not mx_hosts:
             return False, None, "No MX hosts provided"
@@ -158,8 +281,8 @@ class SMTPVerifier:
         last_response = None
 
         for mx_host in mx_hosts:
-            logger.info(f"Attempting SMTP verification on {mx_host} for {email}")
-            is_valid, response, error = self.verify_email(email, mx_host)
+            logger.debug("Attempting SMTP verification on %s for %s", mx_host, email)
+            is_valid, response, error = self.verify_email(email, mx_host, deadline, probe)
 
             if is_valid:
                 return True, response, None
@@ -179,3 +302,53 @@ class SMTPVerifier:
         error_msg = f"SMTP verification failed on all {len(mx_hosts)} MX host(s). Last error: {last_error}"
         logger.error(error_msg)
         return False, last_response, error_msg
+
+    def is_catch_all(self, domain: str, mx_hosts: list, deadline: Optional[Deadline] = None) -> Optional[bool]:
+        """
+        Check whether a domain accepts mail for any recipient.
+
+        The domain is probed once with a random local part that cannot exist.
+        A definitive verdict is cached per domain for CATCH_ALL_CACHE_TTL
+        seconds (at most CATCH_ALL_CACHE_SIZE domains, least recently used
+        evicted first); an inconclusive probe is not cached, so the next
+        address of the domain probes again.
+
+        Args:
+            domain: Domain to probe
+            mx_hosts: List of MX server hostnames (ordered by priority)
+            deadline: Optional budget for the probe
+
+        Returns:
+            True if the probe address was accepted, False if it was rejected,
+            None if the servers did not give a definitive answer
+
+        Raises:
+            DeadlineExceeded: If the budget runs out during the probe
+        """
+        cached = self._catch_all_cache.get(domain)
+        if cached is not None:
+            if cached[1] > time.monotonic():
+                CACHE_LOOKUPS.inc("catch_all", "hit")
+                self._catch_all_cache.move_to_end(domain)
+                logger.debug("Using cached catch-all verdict for domain: %s", domain)
+                return cached[0]
+            del self._catch_all_cache[domain]
+
+        CACHE_LOOKUPS.inc("catch_all", "miss")
+        probe_email = f"{secrets.token_hex(12)}@{domain}"
+        logger.debug("Probing domain %s for catch-all with %s", domain, probe_email)
+        is_valid, response, _ = self.verify_with_fallback(probe_email, mx_hosts, deadline, probe=True)
+
+        if is_valid:
+            catch_all = True
+            logger.debug("Domain %s is catch-all (accepts any recipient)", domain)
+        elif response and response.startswith("550"):
+            catch_all = False
+        else:
+            # Timeout, greylisting, ...: no verdict, probe again next time
+            return None
+
+        self._catch_all_cache[domain] = (catch_all, time.monotonic() + config.CATCH_ALL_CACHE_TTL)
+        if len(self._catch_all_cache) > config.CATCH_ALL_CACHE_SIZE:
+            self._catch_all_cache.popitem(last=False)
+        return catch_all
@@ -0,0 +1,3 @@
+"""
+Persistent storage modules.
+"""
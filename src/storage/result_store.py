@@ -0,0 +1,203 @@
+"""
+Persistent per-address verdict cache with per-status TTL.
+"""
+
+import json
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional
+
+import config
+from src.models.result import VerificationResult, VerificationStatus
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ResultStore:
+    """
+    SQLite-backed store of verification results keyed by normalized address.
+
+    Each row keeps the serialized result and the time it was produced. A row
+    is fresh while its age is below the TTL configured for its status, so
+    changing RESULT_CACHE_TTL applies to already stored verdicts too.
+    """
+
+    # SQLite limits bound parameters per statement (999 on older builds)
+    LOOKUP_CHUNK_SIZE = 500
+
+    def __init__(self, db_path: str, ttl: Optional[Dict[str, float]] = None):
+        """
+        Open (or create) result store.
+
+        Args:
+            db_path: Path to SQLite database file
+            ttl: Seconds to keep a verdict, by VerificationStatus value
+                (missing or 0 = never cached)
+        """
+        self.db_path = db_path
+        self.ttl = ttl if ttl is not None else config.RESULT_CACHE_TTL
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # WITHOUT ROWID keeps rows clustered in the primary key B-tree:
+        # one index lookup per address, no separate rowid table
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                email TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                checked_at REAL NOT NULL,
+                payload TEXT NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+        logger.debug(f"Result store opened: {db_path}")
+
+    @staticmethod
+    def normalize(email: str) -> str:
+        """
+        Build cache key for an email address.
+
+        Args:
+            email: Email address
+
+        Returns:
+            Normalized address
+        """
+        return email.strip().lower()
+
+    def _is_fresh(self, status: str, checked_at: float, now: float) -> bool:
+        """
+        Check whether a stored verdict is still within its TTL.
+
+        Args:
+            status: VerificationStatus value of the stored verdict
+            checked_at: Unix time the verdict was produced
+            now: Current Unix time
+
+        Returns:
+            True if verdict can be reused, False otherwise
+        """
+        ttl = self.ttl.get(status, 0)
+        return ttl > 0 and now - checked_at < ttl
+
+    def get(self, email: str) -> Optional[VerificationResult]:
+        """
+        Get fresh cached verdict for an address.
+
+        Args:
+            email: Email address
+
+        Returns:
+            Cached VerificationResult, or None if missing or stale
+        """
+        return self.get_many([email]).get(self.normalize(email))
+
+    def get_many(self, emails: Iterable[str]) -> Dict[str, VerificationResult]:
+        """
+        Get fresh cached verdicts for many addresses.
+
+        Args:
+            emails: Email addresses
+
+        Returns:
+            Mapping of normalized address to cached VerificationResult
+            (stale and missing addresses are omitted)
+        """
+        keys = list({self.normalize(email) for email in emails})
+        now = time.time()
+        found: Dict[str, VerificationResult] = {}
+
+        for start in range(0, len(keys), self.LOOKUP_CHUNK_SIZE):
+            chunk = keys[start:start + self.LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT email, status, checked_at, payload FROM results WHERE email IN ({placeholders})",
+                chunk,
+            )
+            for key, status, checked_at, payload in rows:
+                if self._is_fresh(status, checked_at, now):
+                    found[key] = VerificationResult.from_dict(json.loads(payload))
+
+        logger.debug(f"Result store: {len(found)}/{len(keys)} fresh verdict(s)")
+        return found
+
+    def put(self, result: VerificationResult) -> None:
+        """
+        Store a verdict.
+
+        Args:
+            result: Verification result to store
+        """
+        self.put_many([result])
+
+    def put_many(self, results: Iterable[VerificationResult]) -> int:
+        """
+        Store many verdicts in one transaction.
+
+        Results whose status has no TTL are skipped.
+
+        Args:
+            results: Verification results to store
+
+        Returns:
+            Number of stored verdicts
+        """
+        now = time.time()
+        rows: List[tuple] = [
+            (
+                self.normalize(result.email),
+                result.status.value,
+                now,
+                json.dumps(result.to_dict(), ensure_ascii=False),
+            )
+            for result in results
+            if self.ttl.get(result.status.value, 0) > 0
+        ]
+
+        if rows:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO results (email, status, checked_at, payload) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+        return len(rows)
+
+    def purge_expired(self) -> int:
+        """
+        Delete verdicts that are past their TTL.
+
+        Returns:
+            Number of deleted rows
+        """
+        now = time.time()
+        deleted = 0
+        with self._conn:
+            for status in VerificationStatus:
+                ttl = self.ttl.get(status.value, 0)
+                cursor = self._conn.execute(
+                    "DELETE FROM results WHERE status = ? AND checked_at <= ?",
+                    (status.value, now - ttl),
+                )
+                deleted += cursor.rowcount
+        logger.info(f"Result store: purged {deleted} expired verdict(s)")
+        return deleted
+
+    def __len__(self) -> int:
+        """Get number of stored verdicts (fresh or stale)."""
+        return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+        logger.debug("Result store closed")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close database."""
+        self.close()
@@ -2,13 +2,17 @@
 File reading utilities for Telegram sender.
 """
 
+import re
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional
 
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Numeric chat ID (negative for groups and channels) or @channelusername
+_CHAT_ID = re.compile(r"-?\d+|@[A-Za-z]\w{3,}")
+
 
 class FileReader:
     """
@@ -58,6 +62,80 @@ class FileReader:
             logger.error(f"Error reading file {file_path}: {e}")
             raise IOError(f"Failed to read file: {e}")
 
+    @staticmethod
+    def iter_chunks(file_path: str, chunk_size: int = 64 * 1024) -> Iterator[str]:
+        """
+        Stream text content from file in chunks ending on line boundaries.
+
+        The file is memory-mapped, so large files are never loaded whole.
+        Line endings are normalized to LF and a UTF-8 BOM is dropped.
+
+        Args:
+            file_path: Path to text file
+            chunk_size: Approximate bytes per chunk
+
+        Yields:
+            Text chunks
+
+        Raises:
+            FileNotFoundError: If file does not exist
+            IOError: If file cannot be read or is not valid UTF-8
+        """
+        from src.ingest.mmap_reader import iter_chunks
+
+        path = Path(file_path)
+
+        if not path.exists():
+            logger.error(f"File not found: {file_path}")
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        if not path.is_file():
+            logger.error(f"Path is not a file: {file_path}")
+            raise IOError(f"Path is not a file: {file_path}")
+
+        try:
+            yield from iter_chunks(file_path, chunk_size=chunk_size, errors="strict")
+        except UnicodeDecodeError as e:
+            logger.error(f"Failed to decode file as UTF-8: {file_path} - {e}")
+            raise IOError(f"File encoding error: {e}")
+
+        except OSError as e:
+            logger.error(f"Error reading file {file_path}: {e}")
+            raise IOError(f"Failed to read file: {e}")
+
+    @staticmethod
+    def read_chat_ids(file_path: str) -> List[str]:
+        """
+        Read broadcast recipients: one chat ID per line.
+
+        Blank lines and lines starting with "#" are skipped, duplicates are
+        dropped (first occurrence kept).
+
+        Args:
+            file_path: Path to chat list file
+
+        Returns:
+            Chat IDs in file order
+
+        Raises:
+            FileNotFoundError: If file does not exist
+            IOError: If file cannot be read or has an invalid chat ID
+        """
+        content = FileReader.read_file(file_path)
+
+        chat_ids = {}
+        for line_number, line in enumerate(content.splitlines(), 1):
+            chat_id = line.strip()
+            if not chat_id or chat_id.startswith("#"):
+                continue
+            if not _CHAT_ID.fullmatch(chat_id):
+                logger.error(f"Invalid chat ID in {file_path}, line {line_number}: {chat_id}")
+                raise IOError(f"Invalid chat ID in {file_path}, line {line_number}: {chat_id}")
+            chat_ids.setdefault(chat_id, None)
+
+        logger.info(f"Loaded {len(chat_ids)} chat ID(s) from {file_path}")
+        return list(chat_ids)
+
     @staticmethod
     def validate_content(content: Optional[str]) -> bool:
         """
@@ -0,0 +1,292 @@
+"""
+Splitting long text into Telegram-sized messages.
+"""
+
+import html
+import re
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Bot API limit for sendMessage text, in UTF-16 code units after entity parsing
+MESSAGE_LIMIT = 4096
+
+# HTML: tags and character references; everything else is text
+_HTML_TOKEN = re.compile(r"<(/?)([a-zA-Z][\w-]*)[^>]*>|&(?:#\d+|#x[0-9a-fA-F]+|\w+);")
+
+# Markdown (legacy): escapes, links, pre/code/bold/italic markers
+_MARKDOWN_TOKEN = re.compile(r"\\[_*`\[]|\[[^\]\n]*\]\([^)\n]*\)|```[\w+-]*\n?|[`*_]")
+_MARKDOWN_CODE_TOKEN = {"```": re.compile(r"```"), "`": re.compile(r"`")}
+
+# Token kinds
+_TEXT, _ATOM, _OPEN, _CLOSE = range(4)
+
+
+def utf16_len(text: str) -> int:
+    """
+    Get length of text in UTF-16 code units, the unit of Bot API limits.
+
+    Args:
+        text: Text
+
+    Returns:
+        Number of UTF-16 code units
+    """
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _utf16_prefix(text: str, units: int) -> int:
+    """Get the number of characters of text that fit into units UTF-16 code units."""
+    if units >= len(text) and utf16_len(text) <= units:
+        return len(text)
+    used = 0
+    for index, char in enumerate(text):
+        used += 2 if ord(char) > 0xFFFF else 1
+        if used > units:
+            return index
+    return len(text)
+
+
+class MessageSplitter:
+    """
+    Splits text into messages within the Bot API length limit.
+
+    Messages are cut on line boundaries where possible, then on spaces, and
+    only then inside a word (never inside a character: lengths are counted in
+    UTF-16 code units, as Telegram does). With parse_mode set, markup does
+    not count toward the limit, tags and entities are never cut, and
+    formatting open at a cut is closed at the end of the message and
+    reopened at the start of the next one.
+
+    Text is fed incrementally, so a large file can be split while streaming.
+
+    Example:
+        splitter = MessageSplitter(parse_mode="HTML")
+        messages = list(splitter.split_stream(FileReader.iter_chunks(path)))
+    """
+
+    def __init__(self, limit: int = MESSAGE_LIMIT, parse_mode: Optional[str] = None):
+        """
+        Initialize splitter.
+
+        Args:
+            limit: Maximum message length in UTF-16 code units
+            parse_mode: None, "HTML" or "Markdown"
+        """
+        if parse_mode not in (None, "HTML", "Markdown"):
+            raise ValueError(f"Unsupported parse mode: {parse_mode}")
+        self.limit = limit
+        self.parse_mode = parse_mode
+        # Formatting currently open: (opening markup, closing markup)
+        self._open: List[Tuple[str, str]] = []
+        self._parts: List[str] = []
+        self._used = 0
+        self._has_text = False
+        self._pending = ""
+
+    def split(self, text: str) -> List[str]:
+        """
+        Split a complete text.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            List of messages
+        """
+        return list(self.split_stream([text]))
+
+    def split_stream(self, pieces: Iterable[str]) -> Iterator[str]:
+        """
+        Split text arriving in pieces.
+
+        Args:
+            pieces: Consecutive parts of the text (e.g. FileReader.iter_chunks)
+
+        Yields:
+            Messages in order
+        """
+        for piece in pieces:
+            yield from self.feed(piece)
+        yield from self.flush()
+
+    def feed(self, text: str) -> Iterator[str]:
+        """
+        Add text; complete lines are packed, a trailing partial line is kept.
+
+        Args:
+            text: Next part of the text
+
+        Yields:
+            Messages completed by this part
+        """
+        text = self._pending + text
+        end = text.rfind("\n") + 1
+        self._pending = text[end:]
+        for line in text[:end].splitlines(keepends=True):
+            yield from self._add_line(line)
+
+    def flush(self) -> Iterator[str]:
+        """
+        Pack the remaining text and emit the last message.
+
+        Yields:
+            Remaining messages
+        """
+        if self._pending:
+            line, self._pending = self._pending, ""
+            yield from self._add_line(line)
+        message = self._emit()
+        if message is not None:
+            yield message
+
+    def _tokenize(self, line: str) -> List[Tuple[int, str, int]]:
+        """Split a line into (kind, markup or text, visible length) tokens."""
+        if self.parse_mode == "HTML":
+            return self._tokenize_html(line)
+        if self.parse_mode == "Markdown":
+            return self._tokenize_markdown(line)
+        return [(_TEXT, line, utf16_len(line))]
+
+    @staticmethod
+    def _tokenize_html(line: str) -> List[Tuple[int, str, int]]:
+        tokens = []
+        position = 0
+        for match in _HTML_TOKEN.finditer(line):
+            if match.start() > position:
+                text = line[position:match.start()]
+                tokens.append((_TEXT, text, utf16_len(text)))
+            markup = match.group(0)
+            if match.group(2) is None:
+                tokens.append((_ATOM, markup, utf16_len(html.unescape(markup))))
+            elif match.group(1):
+                tokens.append((_CLOSE, markup, 0))
+            else:
+                tokens.append((_OPEN, markup, 0))
+            position = match.end()
+        if position < len(line):
+            text = line[position:]
+            tokens.append((_TEXT, text, utf16_len(text)))
+        return tokens
+
+    def _tokenize_markdown(self, line: str) -> List[Tuple[int, str, int]]:
+        tokens = []
+        position = 0
+        # Only the closing marker is special inside code and pre
+        marker = self._open[-1][1] if self._open else None
+        while position < len(line):
+            pattern = _MARKDOWN_CODE_TOKEN.get(marker, _MARKDOWN_TOKEN)
+            match = pattern.search(line, position)
+            if match is None:
+                break
+            if match.start() > position:
+                text = line[position:match.start()]
+                tokens.append((_TEXT, text, utf16_len(text)))
+            markup = match.group(0)
+            if markup.startswith("\\"):
+                tokens.append((_ATOM, markup, utf16_len(markup[1:])))
+            elif markup.startswith("["):
+                label = markup[1:markup.index("]")]
+                tokens.append((_ATOM, markup, utf16_len(label)))
+            elif marker is not None and markup == marker:
+                tokens.append((_CLOSE, markup, 0))
+                marker = None
+            elif marker is None:
+                tokens.append((_OPEN, markup, 0))
+                marker = "```" if markup.startswith("```") else markup
+            else:
+                tokens.append((_TEXT, markup, utf16_len(markup)))
+            position = match.end()
+        if position < len(line):
+            text = line[position:]
+            tokens.append((_TEXT, text, utf16_len(text)))
+        return tokens
+
+    def _add_line(self, line: str) -> Iterator[str]:
+        """Pack one line, keeping it whole if it fits into a message."""
+        tokens = self._tokenize(line)
+        visible = sum(token[2] for token in tokens)
+        if visible > self.limit - self._used and self._used:
+            message = self._emit()
+            if message is not None:
+                yield message
+        for kind, value, width in tokens:
+            if kind == _TEXT:
+                yield from self._add_text(value)
+                continue
+            if width > self.limit - self._used:
+                message = self._emit()
+                if message is not None:
+                    yield message
+            self._append(kind, value, width)
+
+    def _add_text(self, text: str) -> Iterator[str]:
+        """Pack plain text, cutting on spaces (or anywhere) when it overflows."""
+        while text:
+            room = self.limit - self._used
+            cut = _utf16_prefix(text, room)
+            if cut >= len(text):
+                self._append(_TEXT, text, utf16_len(text))
+                return
+            space = text.rfind(" ", 0, cut)
+            if space > 0:
+                cut = space + 1
+            elif self._used:
+                # The word may fit into the next message whole
+                if utf16_len(text.split(" ", 1)[0]) <= self.limit:
+                    cut = 0
+            else:
+                cut = max(cut, 1)
+            if cut:
+                self._append(_TEXT, text[:cut], utf16_len(text[:cut]))
+                text = text[cut:]
+            message = self._emit()
+            if message is not None:
+                yield message
+
+    def _append(self, kind: int, value: str, width: int) -> None:
+        """Add a token to the current message and track open formatting."""
+        self._parts.append(value)
+        self._used += width
+        if kind == _OPEN:
+            self._open.append((value, self._closing(value)))
+        elif kind == _CLOSE:
+            self._close(value)
+        elif width and not value.isspace():
+            self._has_text = True
+
+    def _closing(self, markup: str) -> str:
+        """Get closing markup for an opening tag or marker."""
+        if self.parse_mode == "HTML":
+            name = _HTML_TOKEN.match(markup).group(2)
+            return f"</{name}>"
+        return "```" if markup.startswith("```") else markup
+
+    def _close(self, markup: str) -> None:
+        """Pop formatting closed by markup."""
+        for index in range(len(self._open) - 1, -1, -1):
+            if self._open[index][1].lower() == markup.lower():
+                del self._open[index]
+                return
+
+    def _emit(self) -> Optional[str]:
+        """
+        Finish the current message: close open formatting and reopen it for the next.
+
+        Returns:
+            Message text, or None if it has no visible text
+        """
+        message = "".join(self._parts)
+        if self._open:
+            # Markers must follow the formatted text directly
+            message = message.rstrip() + "".join(closing for _, closing in reversed(self._open))
+        has_text = self._has_text
+        self._parts = [opening for opening, _ in self._open]
+        self._used = 0
+        self._has_text = False
+        if not has_text:
+            return None
+        logger.debug("Message chunk ready (%s chars)", len(message))
+        return message
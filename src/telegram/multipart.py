@@ -0,0 +1,150 @@
+"""
+Streaming multipart/form-data bodies for file uploads.
+"""
+
+import gzip
+import os
+import shutil
+import tempfile
+import uuid
+from typing import BinaryIO, Dict, Optional
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Bytes copied per step when compressing
+_COPY_SIZE = 1024 * 1024
+
+
+class MultipartFile:
+    """
+    multipart/form-data body with one file part, read from disk as it is sent.
+
+    The object is file-like (read) with a known length, so requests sends
+    it with a Content-Length header in blocks, holding only one block in
+    memory whatever the file size. With compress=True the file is first
+    gzipped into an anonymous temporary file (to know the length); memory
+    use stays constant as well.
+
+    Example:
+        with MultipartFile({"chat_id": "1"}, "document", "report.txt") as body:
+            session.post(url, data=body, headers={"Content-Type": body.content_type})
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        file_field: str,
+        file_path: str,
+        filename: Optional[str] = None,
+        compress: bool = False,
+    ):
+        """
+        Open the file and prepare the body.
+
+        Args:
+            fields: Plain form fields sent before the file
+            file_field: Form field name of the file
+            file_path: Path of the file to upload
+            filename: Name shown to the recipient (default: file base name,
+                plus ".gz" when compressed)
+            compress: Gzip the file on the way
+
+        Raises:
+            FileNotFoundError: If file does not exist
+            IOError: If the path is not a file or cannot be read
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        if not os.path.isfile(file_path):
+            raise IOError(f"Path is not a file: {file_path}")
+
+        filename = filename or os.path.basename(file_path) + (".gz" if compress else "")
+        self._file = self._open(file_path, compress)
+        self._file.seek(0, os.SEEK_END)
+        self.file_size = self._file.tell()
+
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        head = []
+        for name, value in fields.items():
+            head.append(
+                f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+            )
+        file_type = "application/gzip" if compress else "application/octet-stream"
+        safe_name = filename.replace('"', "%22").replace("\r", "").replace("\n", "")
+        head.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; filename="{safe_name}"\r\n'
+            f"Content-Type: {file_type}\r\n\r\n"
+        )
+        self._head = "".join(head).encode("utf-8")
+        self._tail = f"\r\n--{boundary}--\r\n".encode("ascii")
+        self.rewind()
+
+    @staticmethod
+    def _open(file_path: str, compress: bool) -> BinaryIO:
+        """Open the file, or a gzipped copy of it in a temporary file."""
+        try:
+            source = open(file_path, "rb")
+        except OSError as e:
+            raise IOError(f"Failed to read file: {e}")
+        if not compress:
+            return source
+
+        compressed = tempfile.TemporaryFile()
+        try:
+            with source, gzip.GzipFile(filename="", mode="wb", fileobj=compressed, mtime=0) as archive:
+                shutil.copyfileobj(source, archive, _COPY_SIZE)
+        except OSError as e:
+            compressed.close()
+            raise IOError(f"Failed to compress file: {e}")
+        logger.debug("Compressed %s to %s bytes", file_path, compressed.tell())
+        return compressed
+
+    def rewind(self) -> None:
+        """Start the body over (e.g. to resend it after a retryable error)."""
+        self._file.seek(0)
+        self._part = 0
+        self._offset = 0
+
+    def __len__(self) -> int:
+        """Total body size in bytes."""
+        return len(self._head) + self.file_size + len(self._tail)
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read the next bytes of the body.
+
+        Args:
+            size: Maximum bytes (-1 = up to the end of the current part)
+
+        Returns:
+            Bytes, empty at the end of the body
+        """
+        while self._part < 3:
+            if self._part == 1:
+                data = self._file.read(size)
+            else:
+                buffer = self._head if self._part == 0 else self._tail
+                end = len(buffer) if size < 0 else self._offset + size
+                data = buffer[self._offset:end]
+                self._offset += len(data)
+            if data:
+                return data
+            self._part += 1
+            self._offset = 0
+        return b""
+
+    def close(self) -> None:
+        """Close the file (and delete the compressed copy)."""
+        self._file.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close file."""
+        self.close()
@@ -0,0 +1,291 @@
+"""
+Durable local outbox for Telegram messages (SQLite).
+"""
+
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.telegram.message_splitter import MESSAGE_LIMIT, MessageSplitter, utf16_len
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class Outbox:
+    """
+    SQLite queue of messages waiting to be delivered to Telegram.
+
+    Producers enqueue and return at once; drain() delivers with
+    at-least-once semantics: a message is marked sent only after the API
+    accepted it, so a crash in between sends it again. Each message has an
+    idempotency key, and enqueueing a key that is already in the outbox
+    (pending, sent or failed) is a no-op, so producers can safely retry.
+
+    Consecutive small messages to the same chat are coalesced into one send
+    of up to MESSAGE_LIMIT characters. Messages to a chat are delivered in
+    order: while one is waiting for a retry, later ones to that chat wait too.
+
+    One drain() may run per outbox file at a time.
+    """
+
+    # Separator between coalesced messages
+    SEPARATOR = "\n\n"
+
+    # Retry schedule for network/server errors: RETRY_BASE * 2^attempt, capped
+    RETRY_BASE = 5.0  # seconds
+    RETRY_MAX = 15 * 60  # seconds
+    MAX_ATTEMPTS = 10  # then the message is marked failed
+
+    # Sent keys are remembered this long to reject duplicates
+    SENT_RETENTION = 7 * 24 * 3600  # seconds
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) outbox.
+
+        Args:
+            db_path: Path to SQLite database file
+        """
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                idempotency_key TEXT NOT NULL UNIQUE,
+                chat_id TEXT NOT NULL,
+                parse_mode TEXT,
+                text TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                state TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL DEFAULT 0,
+                last_error TEXT,
+                sent_at REAL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS outbox_due ON outbox (state, next_attempt_at)")
+        self._conn.commit()
+        logger.debug(f"Outbox opened: {db_path}")
+
+    def enqueue(
+        self, chat_id: str, texts: Iterable[str], parse_mode: Optional[str] = None, key: Optional[str] = None
+    ) -> int:
+        """
+        Queue messages for a chat in one transaction.
+
+        Texts longer than MESSAGE_LIMIT are split. The n-th message gets
+        the idempotency key "<key>:<n>".
+
+        Args:
+            chat_id: Target chat ID
+            texts: Messages in delivery order
+            parse_mode: Optional parse mode (Markdown, HTML)
+            key: Idempotency key of this submission (default: random, no
+                deduplication)
+
+        Returns:
+            Number of messages queued (0 if the key was already used)
+        """
+        key = key or uuid.uuid4().hex
+        now = time.time()
+        rows = []
+        for text in texts:
+            parts = [text]
+            if utf16_len(text) > MESSAGE_LIMIT:
+                parts = MessageSplitter(parse_mode=parse_mode).split(text)
+            for part in parts:
+                rows.append((f"{key}:{len(rows)}", chat_id, parse_mode, part, now))
+
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO outbox (idempotency_key, chat_id, parse_mode, text, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            queued = self._conn.total_changes - before
+
+        if queued < len(rows):
+            logger.info(f"Skipped {len(rows) - queued} already queued message(s) for key {key}")
+        return queued
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Count messages by state.
+
+        Returns:
+            Dictionary of state -> count (pending, sent, failed)
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT state, COUNT(*) FROM outbox GROUP BY state").fetchall()
+        counts = {"pending": 0, "sent": 0, "failed": 0}
+        counts.update(dict(rows))
+        return counts
+
+    def _claim(self, limit: int) -> List[Tuple]:
+        """Get due pending messages of chats that have no message waiting for a retry."""
+        with self._lock:
+            return self._conn.execute(
+                """
+                SELECT id, chat_id, parse_mode, text, attempts FROM outbox
+                WHERE state = 'pending' AND next_attempt_at <= :now
+                  AND chat_id NOT IN (
+                      SELECT chat_id FROM outbox WHERE state = 'pending' AND next_attempt_at > :now
+                  )
+                ORDER BY id LIMIT :limit
+                """,
+                {"now": time.time(), "limit": limit},
+            ).fetchall()
+
+    def _coalesce(self, rows: List[Tuple]) -> Dict[str, List[Tuple[List[Tuple], str, Optional[str]]]]:
+        """
+        Pack messages into sends.
+
+        Returns:
+            Dictionary of chat_id -> list of (rows, text, parse_mode) in order
+        """
+        sends: Dict[str, List[Tuple[List[Tuple], str, Optional[str]]]] = {}
+        separator_length = utf16_len(self.SEPARATOR)
+        for row in rows:
+            chat_sends = sends.setdefault(row[1], [])
+            if chat_sends:
+                packed, text, parse_mode = chat_sends[-1]
+                if (
+                    parse_mode == row[2]
+                    and utf16_len(text) + separator_length + utf16_len(row[3]) <= MESSAGE_LIMIT
+                ):
+                    packed.append(row)
+                    chat_sends[-1] = (packed, text + self.SEPARATOR + row[3], parse_mode)
+                    continue
+            chat_sends.append(([row], row[3], row[2]))
+        return sends
+
+    def _finish(self, rows: List[Tuple], success: bool, error: Optional[str], retryable: bool) -> str:
+        """Record the outcome of one send; returns the new state of its rows."""
+        now = time.time()
+        with self._lock, self._conn:
+            if success:
+                self._conn.executemany(
+                    "UPDATE outbox SET state = 'sent', sent_at = ?, attempts = attempts + 1, last_error = NULL "
+                    "WHERE id = ?",
+                    [(now, row[0]) for row in rows],
+                )
+                return "sent"
+
+            attempts = max(row[4] for row in rows) + 1
+            if not retryable or attempts >= self.MAX_ATTEMPTS:
+                state, next_attempt_at = "failed", 0.0
+            else:
+                state = "pending"
+                next_attempt_at = now + min(self.RETRY_BASE * 2 ** (attempts - 1), self.RETRY_MAX)
+            self._conn.executemany(
+                "UPDATE outbox SET state = ?, attempts = ?, next_attempt_at = ?, last_error = ? WHERE id = ?",
+                [(state, attempts, next_attempt_at, error, row[0]) for row in rows],
+            )
+            return state
+
+    def purge(self) -> int:
+        """
+        Delete sent messages older than SENT_RETENTION.
+
+        Returns:
+            Number of deleted messages
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM outbox WHERE state = 'sent' AND sent_at < ?", (time.time() - self.SENT_RETENTION,)
+            )
+        return cursor.rowcount
+
+    def drain(
+        self,
+        client,
+        workers: int = 4,
+        batch_size: int = 500,
+        follow: bool = False,
+        poll_interval: float = 1.0,
+        stop: Optional[threading.Event] = None,
+    ) -> Dict[str, int]:
+        """
+        Deliver queued messages.
+
+        Chats are served concurrently by up to workers threads (size the
+        client pool to match); each chat's sends go out in order and stop
+        at its first failure. A failure the client reports as retryable is
+        rescheduled with exponential backoff, any other marks the messages
+        failed.
+
+        Args:
+            client: TelegramClient used for delivery
+            workers: Chats served concurrently
+            batch_size: Messages taken from the outbox per round
+            follow: Keep polling for new messages instead of returning once
+                nothing is due
+            poll_interval: Seconds between polls when idle (follow mode)
+            stop: Event that ends a follow-mode drain
+
+        Returns:
+            Dictionary with messages sent, requests made, messages
+            rescheduled and messages failed
+        """
+        stats = {"sent": 0, "requests": 0, "retried": 0, "failed": 0}
+        self.purge()
+
+        def _deliver(chat_sends):
+            outcomes = []
+            for rows, text, parse_mode in chat_sends:
+                success, error, retryable = client.try_send_message(rows[0][1], text, parse_mode)
+                outcomes.append((rows, success, error, retryable))
+                if not success:
+                    break
+            return outcomes
+
+        with ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="telegram-outbox") as executor:
+            while stop is None or not stop.is_set():
+                rows = self._claim(batch_size)
+                if not rows:
+                    if not follow:
+                        break
+                    if stop is not None:
+                        stop.wait(poll_interval)
+                    else:
+                        time.sleep(poll_interval)
+                    continue
+
+                sends = self._coalesce(rows)
+                logger.debug(
+                    "Draining %s message(s) to %s chat(s) in %s send(s)",
+                    len(rows), len(sends), sum(len(chat_sends) for chat_sends in sends.values()),
+                )
+                for future in [executor.submit(_deliver, chat_sends) for chat_sends in sends.values()]:
+                    for rows_sent, success, error, retryable in future.result():
+                        state = self._finish(rows_sent, success, error, retryable)
+                        stats["requests"] += 1
+                        stats["retried" if state == "pending" else state] += len(rows_sent)
+
+        logger.info(
+            f"Outbox drained: {stats['sent']} sent in {stats['requests']} request(s), "
+            f"{stats['retried']} rescheduled, {stats['failed']} failed"
+        )
+        return stats
+
+    def close(self) -> None:
+        """Close database connection."""
+        self._conn.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close connection."""
+        self.close()
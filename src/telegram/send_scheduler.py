@@ -0,0 +1,107 @@
+"""
+Pacing of Bot API sends within Telegram's flood limits.
+"""
+
+import threading
+import time
+from typing import Dict
+
+from src.utils.logger import setup_logger
+from src.utils.rate_limiter import TokenBucket
+
+logger = setup_logger(__name__)
+
+
+class SendScheduler:
+    """
+    Paces messages with token buckets: one shared by all chats, one per chat.
+
+    Defaults follow the Bot API FAQ: about 30 messages per second overall,
+    about 1 per second in a chat and 20 per minute in a group or channel
+    (chat IDs starting with "-"). A 429 retry_after pauses the chat it was
+    returned for and drops the global burst, so the retried message is not
+    followed by another flood. Thread-safe; one scheduler is shared by all
+    senders of a bot.
+    """
+
+    GLOBAL_RATE = 30.0  # messages per second across chats
+    CHAT_RATE = 1.0  # messages per second in a private chat
+    GROUP_RATE = 20 / 60  # messages per second in a group or channel
+    CHAT_BURST = 3  # messages sent to a chat back to back before pacing starts
+
+    # Per-chat buckets kept before full (idle) ones are discarded
+    MAX_IDLE_CHATS = 1024
+
+    def __init__(
+        self,
+        global_rate: float = GLOBAL_RATE,
+        chat_rate: float = CHAT_RATE,
+        group_rate: float = GROUP_RATE,
+        chat_burst: int = CHAT_BURST,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            global_rate: Messages per second for the whole bot (0 = unlimited)
+            chat_rate: Messages per second per private chat (0 = unlimited)
+            group_rate: Messages per second per group or channel (0 = unlimited)
+            chat_burst: Messages a chat may receive before pacing starts
+        """
+        self._global = TokenBucket(global_rate, burst=global_rate) if global_rate > 0 else None
+        self.chat_rate = chat_rate
+        self.group_rate = group_rate
+        self.chat_burst = chat_burst
+        self._chats: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _chat_bucket(self, chat_id: str):
+        """Get (or create) the bucket of a chat, or None if the chat is not limited."""
+        rate = self.group_rate if str(chat_id).startswith("-") else self.chat_rate
+        if rate <= 0:
+            return None
+        with self._lock:
+            bucket = self._chats.get(chat_id)
+            if bucket is None:
+                if len(self._chats) >= self.MAX_IDLE_CHATS:
+                    now = time.monotonic()
+                    for key in [key for key, old in self._chats.items() if old.idle(now)]:
+                        del self._chats[key]
+                bucket = self._chats[chat_id] = TokenBucket(rate, burst=self.chat_burst)
+            return bucket
+
+    def wait(self, chat_id: str) -> float:
+        """
+        Block until a message may be sent to a chat.
+
+        Args:
+            chat_id: Target chat ID
+
+        Returns:
+            Seconds waited
+        """
+        waited = 0.0
+        bucket = self._chat_bucket(chat_id)
+        if bucket is not None:
+            waited += bucket.acquire()
+        if self._global is not None:
+            waited += self._global.acquire()
+        if waited > 0.5:
+            logger.debug("Paced send to chat %s by %.2fs", chat_id, waited)
+        return waited
+
+    def backoff(self, chat_id: str, retry_after: float) -> None:
+        """
+        Apply a flood-control wait returned by the Bot API.
+
+        Args:
+            chat_id: Chat the 429 response was returned for
+            retry_after: Seconds from parameters.retry_after
+        """
+        bucket = self._chat_bucket(chat_id)
+        if bucket is not None:
+            bucket.pause(retry_after)
+        else:
+            time.sleep(retry_after)
+        if self._global is not None:
+            self._global.pause(0)
@@ -2,8 +2,11 @@
 Telegram Bot API client for sending messages.
 """
 
-from typing import Optional, Tuple
+import os
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 
 from src.utils.logger import setup_logger
 
@@ -18,18 +21,66 @@ class TelegramClient:
     API_BASE_URL = "https://api.telegram.org"
     DEFAULT_TIMEOUT = 10  # seconds
 
-    def __init__(self, bot_token: str, timeout: int = DEFAULT_TIMEOUT):
+    DEFAULT_POOL_SIZE = 10  # keep-alive connections to the API host
+    DEFAULT_MAX_RETRIES = 3  # resends of a message rejected by flood control (429)
+    DOCUMENT_LIMIT = 50 * 1024 * 1024  # bytes a bot may upload with sendDocument
+
+    def __init__(
+        self,
+        bot_token: str,
+        timeout: int = DEFAULT_TIMEOUT,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        scheduler=None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        api_url: Optional[str] = None,
+    ):
         """
         Initialize Telegram client.
 
         Args:
             bot_token: Telegram bot token from @BotFather
             timeout: HTTP request timeout in seconds
+            pool_size: Connections kept open for concurrent requests
+            scheduler: Optional SendScheduler pacing sendMessage calls
+            max_retries: Resends after a 429 response (waiting out retry_after)
+            api_url: Bot API base URL (default: TELEGRAM_API_BASE_URL environment
+                variable, else API_BASE_URL), e.g. a local stub for load tests
         """
         self.bot_token = bot_token
         self.timeout = timeout
+        self.scheduler = scheduler
+        self.max_retries = max_retries
         self.session = requests.Session()
-        self.base_url = f"{self.API_BASE_URL}/bot{bot_token}"
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.api_url = (api_url or os.getenv("TELEGRAM_API_BASE_URL") or self.API_BASE_URL).rstrip("/")
+        self.base_url = f"{self.api_url}/bot{bot_token}"
+
+    @staticmethod
+    def _api_error(response: requests.Response) -> Tuple[str, Dict[str, Any]]:
+        """
+        Read an error response of the Bot API.
+
+        Args:
+            response: Non-200 HTTP response
+
+        Returns:
+            Tuple of (description, parameters); parameters holds retry_after
+            or migrate_to_chat_id when the API sent them
+        """
+        try:
+            error_data = response.json()
+        except ValueError:
+            error_data = None
+        if not isinstance(error_data, dict):
+            return f"HTTP {response.status_code}", {}
+
+        description = error_data.get("description") or f"HTTP {response.status_code}"
+        parameters = error_data.get("parameters") or {}
+        if "migrate_to_chat_id" in parameters:
+            description += f" (chat migrated to {parameters['migrate_to_chat_id']})"
+        return description, parameters
 
     def send_message(
         self, chat_id: str, text: str, parse_mode: Optional[str] = None
@@ -37,6 +88,10 @@ class TelegramClient:
         """
         Send text message to Telegram chat.
 
+        The send is paced by the scheduler (if any). A 429 response is
+        waited out for its retry_after and the message resent, up to
+        max_retries times.
+
         Args:
             chat_id: Telegram chat ID (can be user ID or channel/group ID)
             text: Message text to send
@@ -45,6 +100,25 @@ class TelegramClient:
         Returns:
             Tuple of (success: bool, error_message: Optional[str])
         """
+        success, error, _ = self.try_send_message(chat_id, text, parse_mode)
+        return success, error
+
+    def try_send_message(
+        self, chat_id: str, text: str, parse_mode: Optional[str] = None
+    ) -> Tuple[bool, Optional[str], bool]:
+        """
+        Send text message and tell whether a failure is worth retrying later.
+
+        Args:
+            chat_id: Telegram chat ID
+            text: Message text to send
+            parse_mode: Optional parse mode (Markdown, HTML)
+
+        Returns:
+            Tuple of (success, error_message, retryable); retryable is True
+            for network errors, server errors (5xx) and exhausted 429
+            retries, False when the API rejected the message itself
+        """
         url = f"{self.base_url}/sendMessage"
 
         payload = {
@@ -55,42 +129,288 @@ class TelegramClient:
         if parse_mode:
             payload["parse_mode"] = parse_mode
 
-        try:
-            logger.debug(f"Sending message to chat {chat_id} (length: {len(text)} chars)")
+        logger.debug(f"Sending message to chat {chat_id} (length: {len(text)} chars)")
+        result, error, retryable = self._send(chat_id, url, "Message", json=payload)
+        return result is not None, error, retryable
+
+    def send_editable_message(
+        self, chat_id: str, text: str, parse_mode: Optional[str] = None
+    ) -> Tuple[Optional[int], Optional[str]]:
+        """
+        Send text message and get its ID for later edit_message_text calls.
 
-            response = self.session.post(url, json=payload, timeout=self.timeout)
+        Args:
+            chat_id: Telegram chat ID
+            text: Message text to send
+            parse_mode: Optional parse mode (Markdown, HTML)
+
+        Returns:
+            Tuple of (message_id or None, error_message: Optional[str])
+        """
+        url = f"{self.base_url}/sendMessage"
+
+        payload = {"chat_id": chat_id, "text": text}
+        if parse_mode:
+            payload["parse_mode"] = parse_mode
+
+        result, error, _ = self._send(chat_id, url, "Message", json=payload)
+        if result is None:
+            return None, error
+        message_id = result.get("message_id") if isinstance(result, dict) else None
+        if message_id is None:
+            return None, "Response has no message_id"
+        return message_id, None
+
+    def edit_message_text(
+        self, chat_id: str, message_id: int, text: str, parse_mode: Optional[str] = None
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Replace the text of a message sent by the bot.
+
+        An edit that does not change the text counts as success.
+
+        Args:
+            chat_id: Telegram chat ID
+            message_id: ID of the message to edit
+            text: New message text
+            parse_mode: Optional parse mode (Markdown, HTML)
+
+        Returns:
+            Tuple of (success: bool, error_message: Optional[str])
+        """
+        url = f"{self.base_url}/editMessageText"
+
+        payload = {"chat_id": chat_id, "message_id": message_id, "text": text}
+        if parse_mode:
+            payload["parse_mode"] = parse_mode
+
+        result, error, _ = self._send(chat_id, url, "Message edit", json=payload)
+        if result is None and error is not None and "message is not modified" in error:
+            return True, None
+        return result is not None, error
+
+    def send_document(
+        self,
+        chat_id: str,
+        file_path: str,
+        caption: Optional[str] = None,
+        parse_mode: Optional[str] = None,
+        compress: bool = False,
+        filename: Optional[str] = None,
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Upload a file to Telegram chat as a document.
+
+        The file is streamed from disk in a multipart body with a
+        Content-Length, so memory use does not depend on the file size.
+        Pacing and 429 retries work as in send_message.
+
+        Args:
+            chat_id: Telegram chat ID
+            file_path: Path of the file to upload
+            caption: Optional caption (up to 1024 characters)
+            parse_mode: Optional parse mode of the caption (Markdown, HTML)
+            compress: Gzip the file on the way (sent as <name>.gz)
+            filename: Name shown in the chat (default: file base name)
+
+        Returns:
+            Tuple of (success: bool, error_message: Optional[str])
+
+        Raises:
+            FileNotFoundError: If file does not exist
+            IOError: If file cannot be read
+        """
+        from src.telegram.multipart import MultipartFile
+
+        url = f"{self.base_url}/sendDocument"
+
+        fields = {"chat_id": chat_id}
+        if caption:
+            fields["caption"] = caption
+            if parse_mode:
+                fields["parse_mode"] = parse_mode
+
+        with MultipartFile(fields, "document", file_path, filename=filename, compress=compress) as body:
+            if body.file_size > self.DOCUMENT_LIMIT:
+                error_msg = (
+                    f"File is too large for the Bot API: {body.file_size} bytes "
+                    f"(limit {self.DOCUMENT_LIMIT // (1024 * 1024)} MB)"
+                )
+                logger.error(error_msg)
+                return False, error_msg
+
+            logger.debug(f"Uploading document to chat {chat_id} ({body.file_size} bytes)")
+            result, error, _ = self._send(
+                chat_id, url, "Document", data=body, headers={"Content-Type": body.content_type}
+            )
+            return result is not None, error
+
+    def _send(self, chat_id: str, url: str, what: str, **request: Any) -> Tuple[Any, Optional[str], bool]:
+        """
+        Make a send request, paced and retried after 429 responses.
+
+        Args:
+            chat_id: Target chat ID
+            url: Bot API method URL
+            what: What is sent, for log messages
+            **request: Arguments of session.post (a body with rewind() is
+                rewound before each resend)
+
+        Returns:
+            Tuple of (API result or None on failure, error_message, retryable)
+        """
+        for attempt in range(self.max_retries + 1):
+            if self.scheduler is not None:
+                self.scheduler.wait(chat_id)
+            if attempt and hasattr(request.get("data"), "rewind"):
+                request["data"].rewind()
+
+            result, error, retry_after, retryable = self._post(url, chat_id, what, request)
+            if result is not None or retry_after is None:
+                return result, error, retryable
+            if attempt == self.max_retries:
+                logger.error(f"Telegram API error: {error} (gave up after {attempt} retries)")
+                break
+
+            logger.warning(f"Flood control for chat {chat_id}, retrying in {retry_after}s")
+            if self.scheduler is not None:
+                self.scheduler.backoff(chat_id, retry_after)
+            else:
+                time.sleep(retry_after)
+
+        return None, error, True
+
+    def _post(
+        self, url: str, chat_id: str, what: str, request: Dict[str, Any]
+    ) -> Tuple[Any, Optional[str], Optional[float], bool]:
+        """
+        Make one send request.
+
+        Args:
+            url: Bot API method URL
+            chat_id: Target chat ID
+            what: What is sent, for log messages
+            request: Arguments of session.post
+
+        Returns:
+            Tuple of (API result or None on failure, error_message,
+            retry_after, retryable); retry_after is set only for a 429
+            response that carries it
+        """
+        try:
+            response = self.session.post(url, timeout=self.timeout, **request)
 
             # Check HTTP status
             if response.status_code == 200:
-                logger.info(f"Message sent successfully to chat {chat_id}")
-                return True, None
+                logger.info(f"{what} sent successfully to chat {chat_id}")
+                try:
+                    result = response.json().get("result")
+                except (ValueError, AttributeError):
+                    result = None
+                return True if result is None else result, None, None, False
 
             # Handle error responses
-            error_data = response.json() if response.headers.get("content-type") == "application/json" else {}
-            error_description = error_data.get("description", f"HTTP {response.status_code}")
+            error_description, parameters = self._api_error(response)
+            retry_after = parameters.get("retry_after") if response.status_code == 429 else None
+            if retry_after is not None:
+                return None, error_description, float(retry_after), True
 
             logger.error(f"Telegram API error: {error_description}")
-            return False, error_description
+            retryable = response.status_code == 429 or response.status_code >= 500
+            return None, error_description, None, retryable
 
         except requests.exceptions.Timeout:
             error_msg = f"Request timeout after {self.timeout}s"
             logger.error(error_msg)
-            return False, error_msg
+            return None, error_msg, None, True
 
         except requests.exceptions.ConnectionError as e:
             error_msg = f"Connection error: {e}"
             logger.error(error_msg)
-            return False, error_msg
+            return None, error_msg, None, True
 
         except requests.exceptions.RequestException as e:
             error_msg = f"Request error: {e}"
             logger.error(error_msg)
-            return False, error_msg
+            return None, error_msg, None, True
 
         except Exception as e:
             error_msg = f"Unexpected error: {e}"
             logger.error(error_msg)
-            return False, error_msg
+            return None, error_msg, None, True
+
+    def send_messages(
+        self, chat_id: str, texts: Iterable[str], parse_mode: Optional[str] = None
+    ) -> Tuple[int, Optional[str]]:
+        """
+        Send a sequence of messages (e.g. chunks of a long text) to one chat.
+
+        Messages are taken from texts lazily, so text split while streaming
+        is never held in memory. Telegram shows messages in arrival order,
+        so each one is sent only after the previous one was accepted (one
+        request in flight per chat). No new message is sent after the first
+        failure.
+
+        Args:
+            chat_id: Telegram chat ID
+            texts: Messages to send, in order
+            parse_mode: Optional parse mode (Markdown, HTML)
+
+        Returns:
+            Tuple of (messages sent, error of the first failure or None)
+        """
+        sent = 0
+        for text in texts:
+            success, error = self.send_message(chat_id, text, parse_mode)
+            if not success:
+                return sent, error
+            sent += 1
+        return sent, None
+
+    def broadcast(
+        self, chat_ids: Iterable[str], texts: Sequence[str], parse_mode: Optional[str] = None, workers: int = 8
+    ) -> Iterator[Tuple[str, int, Optional[str]]]:
+        """
+        Send the same messages to many chats concurrently.
+
+        Each chat gets all messages in order from one worker; up to workers
+        chats are served at a time over the session pool (size the client
+        with pool_size=workers), paced by the scheduler if set. Results are
+        yielded as chats finish, so a report can be written while the
+        broadcast runs.
+
+        Args:
+            chat_ids: Target chat IDs
+            texts: Messages to send to every chat
+            parse_mode: Optional parse mode (Markdown, HTML)
+            workers: Chats served concurrently
+
+        Yields:
+            Tuples of (chat_id, messages sent, error of the first failure or None)
+        """
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        def _send(chat_id: str) -> Tuple[str, int, Optional[str]]:
+            sent, error = self.send_messages(chat_id, texts, parse_mode)
+            return chat_id, sent, error
+
+        pending = set()
+        with ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="telegram-broadcast") as executor:
+            try:
+                for chat_id in chat_ids:
+                    if len(pending) >= workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+                    pending.add(executor.submit(_send, chat_id))
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            finally:
+                # Stopped early (consumer closed or interrupted): skip chats not started yet
+                for future in pending:
+                    future.cancel()
 
     def test_connection(self) -> Tuple[bool, Optional[str]]:
         """
@@ -112,8 +432,7 @@ class TelegramClient:
                 logger.info(f"Bot token valid. Bot username: @{bot_username}")
                 return True, None
 
-            error_data = response.json() if response.headers.get("content-type") == "application/json" else {}
-            error_description = error_data.get("description", f"HTTP {response.status_code}")
+            error_description, _ = self._api_error(response)
             logger.error(f"Invalid bot token: {error_description}")
             return False, error_description
 
@@ -3,15 +3,111 @@ CLI tool for sending text files to Telegram.
 """
 
 import argparse
+import csv
 import os
 import sys
+from itertools import chain
+from typing import List
 
-from src.telegram.file_reader import FileReader
-from src.telegram.telegram_client import TelegramClient
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Failed chats listed on the console after a broadcast (all are in --report)
+MAX_FAILURES_SHOWN = 20
+
+
+def _broadcast(client, args, chat_ids: List[str], messages: List[str]) -> int:
+    """
+    Send messages to every chat and report the outcome per chat.
+
+    Args:
+        client: TelegramClient with a pool of args.workers connections
+        args: Parsed CLI arguments
+        chat_ids: Target chats
+        messages: Messages sent to each chat
+
+    Returns:
+        Exit code (0 if every chat received all messages, 1 otherwise)
+    """
+    report_file = open(args.report, "w", newline="", encoding="utf-8") if args.report else None
+    report = csv.writer(report_file) if report_file else None
+    if report:
+        report.writerow(["chat_id", "status", "parts_sent", "error"])
+
+    delivered = 0
+    failures = []
+    try:
+        for chat_id, sent, error in client.broadcast(chat_ids, messages, args.parse_mode, workers=args.workers):
+            if error is None:
+                delivered += 1
+            else:
+                failures.append((chat_id, error))
+            if report:
+                report.writerow([chat_id, "sent" if error is None else "failed", sent, error or ""])
+    finally:
+        if report_file:
+            report_file.close()
+
+    total = len(chat_ids)
+    logger.info(f"Broadcast finished: {delivered}/{total} chats")
+    print(f"{'✅' if not failures else '⚠️ '} Broadcast finished: {delivered}/{total} chats")
+    print(f"   File: {args.file}")
+    if len(messages) > 1:
+        print(f"   Parts per chat: {len(messages)}")
+    for chat_id, error in failures[:MAX_FAILURES_SHOWN]:
+        print(f"   ❌ {chat_id}: {error}")
+    if len(failures) > MAX_FAILURES_SHOWN:
+        print(f"   ... and {len(failures) - MAX_FAILURES_SHOWN} more failed chat(s)")
+    if args.report:
+        print(f"   Report: {args.report}")
+    return 0 if not failures else 1
+
+
+def _build_scheduler(args):
+    """
+    Create the send scheduler configured by --rate and --chat-rate.
+
+    Args:
+        args: Parsed CLI arguments
+
+    Returns:
+        SendScheduler instance
+    """
+    from src.telegram.send_scheduler import SendScheduler
+
+    return SendScheduler(
+        global_rate=args.rate,
+        chat_rate=args.chat_rate,
+        group_rate=min(args.chat_rate, SendScheduler.GROUP_RATE),
+    )
+
+
+def _drain_outbox(args, bot_token: str) -> int:
+    """
+    Deliver the messages queued in the outbox.
+
+    Args:
+        args: Parsed CLI arguments
+        bot_token: Telegram bot token
+
+    Returns:
+        Exit code (0 unless some messages were rejected by the API)
+    """
+    from src.telegram.outbox import Outbox
+    from src.telegram.telegram_client import TelegramClient
+
+    workers = max(args.workers, 1)
+    with Outbox(args.outbox) as outbox, TelegramClient(
+        bot_token, timeout=args.timeout, pool_size=workers, scheduler=_build_scheduler(args), api_url=args.api_url
+    ) as client:
+        stats = outbox.drain(client, workers=workers, follow=args.follow)
+        counts = outbox.counts()
+
+    print(f"📤 Outbox drained: {stats['sent']} message(s) sent in {stats['requests']} request(s)")
+    print(f"   Waiting for retry: {counts['pending']}, failed: {counts['failed']}")
+    return 0 if not stats["failed"] else 1
+
 
 def main() -> int:
     """
@@ -25,8 +121,9 @@ def main() -> int:
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Environment Variables:
-  TELEGRAM_BOT_TOKEN    Bot token from @BotFather (alternative to --token)
-  TELEGRAM_CHAT_ID      Chat ID to send message to (alternative to --chat)
+  TELEGRAM_BOT_TOKEN      Bot token from @BotFather (alternative to --token)
+  TELEGRAM_CHAT_ID        Chat ID to send message to (alternative to --chat)
+  TELEGRAM_API_BASE_URL   Bot API base URL (alternative to --api-url)
 
 Examples:
   # Using CLI arguments
@@ -37,6 +134,25 @@ Examples:
   export TELEGRAM_CHAT_ID="123456789"
   python -m src.telegram.telegram_sender --file message.txt
 
+  # Long file: split into 4096-character messages, sent in order
+  python -m src.telegram.telegram_sender --file report.txt --parse-mode HTML
+
+  # Long file to a test chat without pacing
+  python -m src.telegram.telegram_sender --file report.txt --chat-rate 0
+
+  # Large report as one gzip-compressed file instead of many messages
+  python -m src.telegram.telegram_sender --file report.log --document --gzip --caption "Nightly report"
+
+  # Queue through a local outbox and return at once; deliver later (or in a service)
+  python -m src.telegram.telegram_sender --file alert.txt --outbox outbox.db --key alert-42
+  python -m src.telegram.telegram_sender --outbox outbox.db --drain --follow
+
+  # Broadcast to every chat listed in chats.txt (one ID per line)
+  python -m src.telegram.telegram_sender --file digest.txt --chats-file chats.txt --workers 16 --report report.csv
+
+  # Against the local stub Bot API (python -m src.netsim.simulator)
+  python -m src.telegram.telegram_sender --file message.txt --api-url http://127.0.0.1:8081
+
   # Test connection
   python -m src.telegram.telegram_sender --test --token YOUR_TOKEN
         """,
@@ -62,6 +178,12 @@ Examples:
         help="Telegram chat ID (or set TELEGRAM_CHAT_ID env var)",
     )
 
+    parser.add_argument(
+        "--chats-file",
+        type=str,
+        help="Broadcast: file with one chat ID per line (instead of --chat)",
+    )
+
     # Optional parameters
     parser.add_argument(
         "--parse-mode",
@@ -83,6 +205,82 @@ Examples:
         help="HTTP request timeout in seconds (default: 10)",
     )
 
+    parser.add_argument(
+        "--api-url",
+        type=str,
+        help="Bot API base URL, e.g. a local stub (or set TELEGRAM_API_BASE_URL env var; "
+        "default: https://api.telegram.org)",
+    )
+
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=30,
+        help="Messages per second across all chats, 0 = unlimited (default: 30)",
+    )
+
+    parser.add_argument(
+        "--chat-rate",
+        type=float,
+        default=1,
+        help="Messages per second to one chat (groups: 20/min), 0 = unlimited (default: 1)",
+    )
+
+    parser.add_argument(
+        "--document",
+        action="store_true",
+        help="Upload the file as a document (up to 50 MB) instead of sending its text",
+    )
+
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="With --document: compress the file on the way (sent as <name>.gz)",
+    )
+
+    parser.add_argument(
+        "--caption",
+        type=str,
+        help="With --document: caption shown under the file",
+    )
+
+    parser.add_argument(
+        "--outbox",
+        type=str,
+        help="SQLite outbox: queue the messages there and return (see --drain)",
+    )
+
+    parser.add_argument(
+        "--key",
+        type=str,
+        help="With --outbox: idempotency key; queueing the same key again is a no-op",
+    )
+
+    parser.add_argument(
+        "--drain",
+        action="store_true",
+        help="With --outbox: deliver queued messages (after queueing --file, if given)",
+    )
+
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="With --drain: keep delivering new messages until interrupted",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Broadcast/drain: chats served concurrently over one connection pool (default: 8)",
+    )
+
+    parser.add_argument(
+        "--report",
+        type=str,
+        help="Broadcast: write per-chat results to this CSV file",
+    )
+
     args = parser.parse_args()
 
     try:
@@ -93,10 +291,13 @@ Examples:
             print("Error: Bot token required. Use --token or set TELEGRAM_BOT_TOKEN environment variable")
             return 1
 
+        # requests is only imported once we actually talk to the Bot API
+        from src.telegram.telegram_client import TelegramClient
+
         # Test mode
         if args.test:
             logger.info("Running connection test")
-            with TelegramClient(bot_token, timeout=args.timeout) as client:
+            with TelegramClient(bot_token, timeout=args.timeout, api_url=args.api_url) as client:
                 success, error = client.test_connection()
 
             if success:
@@ -106,11 +307,27 @@ Examples:
                 print(f"❌ Connection test failed: {error}")
                 return 1
 
+        if (args.key or args.drain) and not args.outbox:
+            print("Error: --key and --drain require --outbox")
+            return 1
+
+        if args.follow and not args.drain:
+            print("Error: --follow requires --drain")
+            return 1
+
+        # Drain only: deliver what producers queued earlier
+        if args.drain and not args.file:
+            return _drain_outbox(args, bot_token)
+
+        if args.chat and args.chats_file:
+            print("Error: --chat and --chats-file cannot be used together")
+            return 1
+
         # Get chat ID from args or env
         chat_id = args.chat or os.getenv("TELEGRAM_CHAT_ID")
-        if not chat_id:
-            logger.error("Chat ID not provided. Use --chat or set TELEGRAM_CHAT_ID")
-            print("Error: Chat ID required. Use --chat or set TELEGRAM_CHAT_ID environment variable")
+        if not chat_id and not args.chats_file:
+            logger.error("Chat ID not provided. Use --chat, --chats-file or set TELEGRAM_CHAT_ID")
+            print("Error: Chat ID required. Use --chat, --chats-file or set TELEGRAM_CHAT_ID environment variable")
             return 1
 
         # File is required for sending
@@ -120,34 +337,118 @@ Examples:
             parser.print_help()
             return 1
 
-        # Read file content
+        from src.telegram.file_reader import FileReader
+        from src.telegram.message_splitter import MessageSplitter
+
+        if (args.gzip or args.caption) and not args.document:
+            print("Error: --gzip and --caption require --document")
+            return 1
+
+        if args.document:
+            if args.chats_file or args.outbox:
+                print("Error: --document cannot be used with --chats-file or --outbox")
+                return 1
+
+            logger.info(f"Uploading file {args.file} to Telegram chat {chat_id}")
+            with TelegramClient(bot_token, timeout=args.timeout, api_url=args.api_url) as client:
+                success, error = client.send_document(
+                    chat_id=chat_id,
+                    file_path=args.file,
+                    caption=args.caption,
+                    parse_mode=args.parse_mode,
+                    compress=args.gzip,
+                )
+
+            if success:
+                print(f"✅ Document sent successfully to chat {chat_id}")
+                print(f"   File: {args.file}")
+                print(f"   Size: {os.path.getsize(args.file)} bytes{' (gzip-compressed)' if args.gzip else ''}")
+                return 0
+            else:
+                print(f"❌ Failed to send document: {error}")
+                return 1
+
+        # Stream the file and split it into messages within the API limit
         logger.info(f"Reading file: {args.file}")
-        content = FileReader.read_file(args.file)
+        messages = MessageSplitter(parse_mode=args.parse_mode).split_stream(FileReader.iter_chunks(args.file))
+
+        scheduler = _build_scheduler(args)
 
         # Validate content
-        if not FileReader.validate_content(content):
+        first = next(messages, None)
+        if first is None:
             logger.error("File content is empty")
             print("Error: File is empty or contains only whitespace")
             return 1
 
-        # Send message to Telegram
+        if args.outbox:
+            from src.telegram.outbox import Outbox
+
+            chat_ids = FileReader.read_chat_ids(args.chats_file) if args.chats_file else [chat_id]
+            messages = [first, *messages]
+            with Outbox(args.outbox) as outbox:
+                queued = 0
+                for target in chat_ids:
+                    key = f"{args.key}:{target}" if args.key and args.chats_file else args.key
+                    queued += outbox.enqueue(target, messages, args.parse_mode, key=key)
+
+            logger.info(f"Queued {queued} message(s) for {len(chat_ids)} chat(s)")
+            print(f"📥 Queued {queued} message(s) for {len(chat_ids)} chat(s) in {args.outbox}")
+            if not args.drain:
+                return 0
+            return _drain_outbox(args, bot_token)
+
+        if args.chats_file:
+            chat_ids = FileReader.read_chat_ids(args.chats_file)
+            if not chat_ids:
+                print(f"Error: No chat IDs in {args.chats_file}")
+                return 1
+
+            # Every chat gets the same messages, so they are split once
+            messages = [first, *messages]
+            logger.info(f"Broadcasting {len(messages)} message(s) to {len(chat_ids)} chats")
+            workers = max(args.workers, 1)
+            with TelegramClient(
+                bot_token, timeout=args.timeout, pool_size=workers, scheduler=scheduler, api_url=args.api_url
+            ) as client:
+                return _broadcast(client, args, chat_ids, messages)
+
+        # Count what is sent without keeping the messages
+        total_chars = 0
+
+        def _counted():
+            nonlocal total_chars
+            for message in chain([first], messages):
+                total_chars += len(message)
+                yield message
+
+        # Send message(s) to Telegram
         logger.info(f"Sending message to Telegram chat {chat_id}")
-        with TelegramClient(bot_token, timeout=args.timeout) as client:
-            success, error = client.send_message(
+        with TelegramClient(
+            bot_token,
+            timeout=args.timeout,
+            scheduler=scheduler,
+            api_url=args.api_url,
+        ) as client:
+            sent, error = client.send_messages(
                 chat_id=chat_id,
-                text=content,
+                texts=_counted(),
                 parse_mode=args.parse_mode,
             )
 
-        if success:
-            logger.info("Message sent successfully")
+        if error is None:
+            logger.info(f"Message sent successfully ({sent} part(s))")
             print(f"✅ Message sent successfully to chat {chat_id}")
             print(f"   File: {args.file}")
-            print(f"   Length: {len(content)} characters")
+            print(f"   Length: {total_chars} characters")
+            if sent > 1:
+                print(f"   Parts: {sent}")
             return 0
         else:
             logger.error(f"Failed to send message: {error}")
             print(f"❌ Failed to send message: {error}")
+            if sent:
+                print(f"   Parts sent before the failure: {sent}")
             return 1
 
     except FileNotFoundError as e:
@@ -0,0 +1,3 @@
+"""
+Pluggable DNS and SMTP transports (live, recording, replaying).
+"""
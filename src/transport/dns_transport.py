@@ -0,0 +1,153 @@
+"""
+DNS transports used by MXChecker.
+
+A DNS transport has the dnspython resolver interface:
+resolve(domain, rdtype, lifetime) returns the answer rdata (objects with
+.preference/.exchange for MX) or raises dns.resolver.NXDOMAIN, NoAnswer,
+Timeout or another dns.exception.DNSException.
+"""
+
+import time
+from typing import Optional
+
+import dns.exception
+import dns.rdata
+import dns.rdataclass
+import dns.resolver
+
+import config
+from src.transport.transcript import Transcript, TranscriptWriter
+
+
+class LiveDNSTransport:
+    """
+    Queries DNS servers with a dnspython resolver configured from config.
+    """
+
+    def __init__(self):
+        """Initialize resolver (nameservers and port are read from config at creation)."""
+        self.resolver = dns.resolver.Resolver()
+        self.resolver.timeout = config.DNS_TIMEOUT
+        self.resolver.lifetime = config.DNS_TIMEOUT
+
+        if config.DNS_NAMESERVERS:
+            self.resolver.nameservers = config.DNS_NAMESERVERS
+        self.resolver.port = config.DNS_PORT
+
+    def resolve(self, domain: str, rdtype: str, lifetime: Optional[float] = None):
+        """
+        Send one DNS query.
+
+        Args:
+            domain: Domain name to query
+            rdtype: Record type (MX, A, AAAA)
+            lifetime: Seconds to wait for an answer
+
+        Returns:
+            dnspython answer
+        """
+        return self.resolver.resolve(domain, rdtype, lifetime=lifetime)
+
+
+class RecordingDNSTransport:
+    """
+    Passes queries to another transport and records every answer with its timing.
+    """
+
+    def __init__(self, inner, writer: TranscriptWriter):
+        """
+        Initialize recorder.
+
+        Args:
+            inner: Transport doing the actual queries
+            writer: Transcript to append to
+        """
+        self.inner = inner
+        self.writer = writer
+
+    def resolve(self, domain: str, rdtype: str, lifetime: Optional[float] = None):
+        """
+        Query through the inner transport and record the outcome.
+
+        Args:
+            domain: Domain name to query
+            rdtype: Record type (MX, A, AAAA)
+            lifetime: Seconds to wait for an answer
+
+        Returns:
+            Answer of the inner transport
+        """
+        record = {"t": "dns", "q": [domain, rdtype], "o": "error"}
+        started_at = time.perf_counter()
+        try:
+            answer = self.inner.resolve(domain, rdtype, lifetime=lifetime)
+            record["o"] = "ok"
+            record["a"] = [rdata.to_text() for rdata in answer]
+            return answer
+        except dns.resolver.NXDOMAIN:
+            record["o"] = "nxdomain"
+            raise
+        except dns.resolver.NoAnswer:
+            record["o"] = "no_answer"
+            raise
+        except dns.resolver.Timeout:
+            record["o"] = "timeout"
+            raise
+        except Exception as e:
+            record["e"] = str(e)
+            raise
+        finally:
+            record["s"] = round(time.perf_counter() - started_at, 6)
+            self.writer.write(record)
+
+
+class ReplayDNSTransport:
+    """
+    Answers queries from a transcript without network access.
+    """
+
+    def __init__(self, transcript: Transcript, speed: float = 1.0):
+        """
+        Initialize replayer.
+
+        Args:
+            transcript: Recorded exchanges
+            speed: Replay speed (1.0 = recorded latency, 0 = as fast as possible)
+        """
+        self.transcript = transcript
+        self.speed = speed
+
+    def resolve(self, domain: str, rdtype: str, lifetime: Optional[float] = None):
+        """
+        Replay the recorded answer for a query.
+
+        A recorded answer slower than lifetime is replayed as a timeout.
+
+        Args:
+            domain: Domain name to query
+            rdtype: Record type (MX, A, AAAA)
+            lifetime: Seconds to wait for an answer
+
+        Returns:
+            List of rdata
+
+        Raises:
+            dns.exception.DNSException: As recorded, or if the query was never recorded
+        """
+        record = self.transcript.next("dns", domain, rdtype)
+        if record is None:
+            raise dns.exception.DNSException(f"No recorded answer for {rdtype} {domain}")
+
+        if self.transcript.wait(record["s"], lifetime, self.speed):
+            raise dns.resolver.Timeout()
+
+        outcome = record["o"]
+        if outcome == "ok":
+            return [dns.rdata.from_text(dns.rdataclass.IN, rdtype, text) for text in record["a"]]
+        if outcome == "nxdomain":
+            raise dns.resolver.NXDOMAIN()
+        if outcome == "no_answer":
+            raise dns.resolver.NoAnswer()
+        if outcome == "timeout":
+            raise dns.resolver.Timeout()
+        raise dns.exception.DNSException(record.get("e") or "Recorded DNS error")
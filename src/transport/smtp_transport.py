@@ -0,0 +1,344 @@
+"""
+SMTP transports used by SMTPVerifier.
+
+An SMTP transport opens sessions: connect(host, port, timeout, recipient,
+source_address=None, local_hostname=None) returns an object with the
+smtplib.SMTP subset the verifier uses (sock, ehlo_or_helo_if_needed, mail,
+rcpt, quit) or raises the exception smtplib would. recipient identifies the
+session in transcripts; catch-all probes pass "*@domain" instead of their
+random address. source_address and local_hostname are the local IP to
+connect from and the EHLO name of the sending identity.
+"""
+
+import smtplib
+import socket
+import time
+from typing import Any, Dict, List, Optional
+
+from src.transport.transcript import Transcript, TranscriptWriter
+
+
+def _text(message: Any) -> str:
+    """Decode an SMTP reply text."""
+    return message.decode("utf-8", "replace") if isinstance(message, bytes) else str(message)
+
+
+def _describe(exc: Exception) -> List[Any]:
+    """Serialize an exception raised during an SMTP session as [kind, message, code]."""
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return ["response", _text(exc.smtp_error), exc.smtp_code]
+    if isinstance(exc, smtplib.SMTPServerDisconnected):
+        return ["disconnected", str(exc)]
+    if isinstance(exc, socket.timeout):
+        return ["timeout", str(exc)]
+    if isinstance(exc, socket.gaierror):
+        return ["gaierror", str(exc)]
+    if isinstance(exc, ConnectionRefusedError):
+        return ["refused", str(exc)]
+    if isinstance(exc, OSError):
+        return ["oserror", str(exc)]
+    return ["error", str(exc)]
+
+
+def _rebuild(description: List[Any]) -> Exception:
+    """Recreate an exception serialized by _describe."""
+    kind, message = description[0], description[1]
+    if kind == "response":
+        return smtplib.SMTPResponseException(description[2], message.encode("utf-8"))
+    if kind == "disconnected":
+        return smtplib.SMTPServerDisconnected(message)
+    if kind == "timeout":
+        return socket.timeout(message)
+    if kind == "gaierror":
+        return socket.gaierror(message)
+    if kind == "refused":
+        return ConnectionRefusedError(message)
+    if kind == "oserror":
+        return OSError(message)
+    return Exception(message)
+
+
+# What smtplib raises when a command reply or the connection times out, as _describe would record it
+_READ_TIMEOUT = ["disconnected", "Connection unexpectedly closed: timed out"]
+_CONNECT_TIMEOUT = ["timeout", "timed out"]
+
+
+def _replay_error(step: Dict[str, Any], timed_out: bool, timeout_error: List[Any]) -> Optional[Exception]:
+    """
+    Get the exception a replayed step raises.
+
+    A step that timed out raises what was recorded if the recording timed
+    out too (smtplib reports a read timeout as SMTPServerDisconnected, a
+    connect timeout as socket.timeout), otherwise timeout_error.
+
+    Args:
+        step: Recorded step
+        timed_out: True if the step exceeds the current timeout
+        timeout_error: What the live call raises on a timeout, as described by _describe
+
+    Returns:
+        Exception to raise, or None if the step succeeds
+    """
+    recorded = step.get("x")
+    if timed_out:
+        if recorded and recorded[0] in ("timeout", "disconnected"):
+            return _rebuild(recorded)
+        return _rebuild(timeout_error)
+    return _rebuild(recorded) if recorded else None
+
+
+class LiveSMTPTransport:
+    """
+    Opens real SMTP sessions with smtplib.
+    """
+
+    def connect(
+        self,
+        host: str,
+        port: int,
+        timeout: float,
+        recipient: str,
+        source_address: Optional[str] = None,
+        local_hostname: Optional[str] = None,
+    ) -> smtplib.SMTP:
+        """
+        Connect to an SMTP server.
+
+        Args:
+            host: Server hostname
+            port: Server port
+            timeout: Socket timeout in seconds
+            recipient: Session key (unused)
+            source_address: Local IP address to bind (None = chosen by the OS)
+            local_hostname: EHLO/HELO name (None = local FQDN)
+
+        Returns:
+            Connected smtplib.SMTP session
+
+        Raises:
+            smtplib.SMTPConnectError: If the server does not greet with 220
+        """
+        smtp = smtplib.SMTP(
+            local_hostname=local_hostname,
+            timeout=timeout,
+            source_address=(source_address, 0) if source_address else None,
+        )
+        try:
+            code, message = smtp.connect(host, port)
+            if code != 220:
+                # Greeting refused (e.g. 554 for a blocked source): raise like smtplib.SMTP(host) does
+                raise smtplib.SMTPConnectError(code, message)
+        except Exception:
+            smtp.close()
+            raise
+        return smtp
+
+
+class _RecordingSession:
+    """Proxies an SMTP session and records each command with its reply and timing."""
+
+    def __init__(self, smtp: smtplib.SMTP, record: Dict[str, Any], writer: TranscriptWriter):
+        self._smtp = smtp
+        self._record = record
+        self._writer = writer
+
+    @property
+    def sock(self):
+        """Socket of the underlying session."""
+        return self._smtp.sock
+
+    def _step(self, command: str, func, *args):
+        started_at = time.perf_counter()
+        step: Dict[str, Any] = {"cmd": command}
+        self._record["c"].append(step)
+        try:
+            result = func(*args)
+        except Exception as e:
+            step["x"] = _describe(e)
+            raise
+        finally:
+            step["s"] = round(time.perf_counter() - started_at, 6)
+        if isinstance(result, tuple):
+            step["r"] = [result[0], _text(result[1])]
+        return result
+
+    def ehlo_or_helo_if_needed(self) -> None:
+        """Send EHLO (or HELO) if not done yet."""
+        self._step("ehlo", self._smtp.ehlo_or_helo_if_needed)
+
+    def mail(self, sender: str):
+        """Send MAIL FROM."""
+        return self._step("mail", self._smtp.mail, sender)
+
+    def rcpt(self, recipient: str):
+        """Send RCPT TO."""
+        return self._step("rcpt", self._smtp.rcpt, recipient)
+
+    def quit(self):
+        """Send QUIT and write the session to the transcript."""
+        try:
+            return self._step("quit", self._smtp.quit)
+        finally:
+            self._writer.write(self._record)
+
+
+class RecordingSMTPTransport:
+    """
+    Opens sessions through another transport and records every dialogue.
+
+    A session is written to the transcript when it is closed with quit().
+    """
+
+    def __init__(self, inner, writer: TranscriptWriter):
+        """
+        Initialize recorder.
+
+        Args:
+            inner: Transport opening the actual sessions
+            writer: Transcript to append to
+        """
+        self.inner = inner
+        self.writer = writer
+
+    def connect(
+        self,
+        host: str,
+        port: int,
+        timeout: float,
+        recipient: str,
+        source_address: Optional[str] = None,
+        local_hostname: Optional[str] = None,
+    ) -> _RecordingSession:
+        """
+        Connect through the inner transport and start recording.
+
+        The sending identity is passed on but not recorded: replay does
+        not depend on it.
+
+        Args:
+            host: Server hostname
+            port: Server port
+            timeout: Socket timeout in seconds
+            recipient: Session key
+            source_address: Local IP address to bind
+            local_hostname: EHLO/HELO name
+
+        Returns:
+            Recording session proxy
+        """
+        step: Dict[str, Any] = {"cmd": "connect"}
+        record = {"t": "smtp", "q": [host, recipient], "c": [step]}
+        started_at = time.perf_counter()
+        try:
+            smtp = self.inner.connect(host, port, timeout, recipient, source_address, local_hostname)
+        except Exception as e:
+            step["s"] = round(time.perf_counter() - started_at, 6)
+            step["x"] = _describe(e)
+            self.writer.write(record)
+            raise
+        step["s"] = round(time.perf_counter() - started_at, 6)
+        return _RecordingSession(smtp, record, self.writer)
+
+
+class _ReplaySocket:
+    """Keeps the timeout the verifier sets on the session socket."""
+
+    def __init__(self, timeout: Optional[float]):
+        self.timeout = timeout
+
+    def settimeout(self, timeout: Optional[float]) -> None:
+        self.timeout = timeout
+
+
+class _ReplaySession:
+    """Replays the recorded steps of one SMTP dialogue."""
+
+    def __init__(self, transcript: Transcript, steps: List[Dict[str, Any]], timeout: Optional[float], speed: float):
+        self.sock = _ReplaySocket(timeout)
+        self._transcript = transcript
+        self._steps = iter(steps)
+        self._speed = speed
+
+    def _step(self, command: str):
+        step = next(self._steps, None)
+        if step is None or step["cmd"] != command:
+            raise smtplib.SMTPServerDisconnected(f"Transcript has no {command} step at this point")
+        timed_out = self._transcript.wait(step["s"], self.sock.timeout, self._speed)
+        error = _replay_error(step, timed_out, _READ_TIMEOUT)
+        if error is not None:
+            raise error
+        reply = step.get("r")
+        return (reply[0], reply[1].encode("utf-8")) if reply else None
+
+    def ehlo_or_helo_if_needed(self) -> None:
+        """Replay EHLO."""
+        self._step("ehlo")
+
+    def mail(self, sender: str):
+        """Replay MAIL FROM."""
+        return self._step("mail")
+
+    def rcpt(self, recipient: str):
+        """Replay RCPT TO."""
+        return self._step("rcpt")
+
+    def quit(self):
+        """Replay QUIT."""
+        return self._step("quit")
+
+
+class ReplaySMTPTransport:
+    """
+    Replays SMTP dialogues from a transcript without network access.
+    """
+
+    def __init__(self, transcript: Transcript, speed: float = 1.0):
+        """
+        Initialize replayer.
+
+        Args:
+            transcript: Recorded exchanges
+            speed: Replay speed (1.0 = recorded latency, 0 = as fast as possible)
+        """
+        self.transcript = transcript
+        self.speed = speed
+
+    def connect(
+        self,
+        host: str,
+        port: int,
+        timeout: float,
+        recipient: str,
+        source_address: Optional[str] = None,
+        local_hostname: Optional[str] = None,
+    ) -> _ReplaySession:
+        """
+        Replay the connect step of the recorded session for (host, recipient).
+
+        A recorded step slower than the current socket timeout is replayed
+        as the timeout error smtplib raises at that point.
+
+        Args:
+            host: Server hostname
+            port: Server port (not part of the key)
+            timeout: Socket timeout in seconds
+            recipient: Session key
+            source_address: Local IP address (not part of the key)
+            local_hostname: EHLO/HELO name (not part of the key)
+
+        Returns:
+            Replay session
+
+        Raises:
+            OSError: As recorded, or if the session was never recorded
+        """
+        record = self.transcript.next("smtp", host, recipient)
+        if record is None:
+            raise OSError(f"No recorded SMTP session for {recipient} on {host}")
+
+        connect, *steps = record["c"]
+        timed_out = self.transcript.wait(connect["s"], timeout, self.speed)
+        error = _replay_error(connect, timed_out, _CONNECT_TIMEOUT)
+        if error is not None:
+            raise error
+        return _ReplaySession(self.transcript, steps, timeout, self.speed)
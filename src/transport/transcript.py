@@ -0,0 +1,198 @@
+"""
+Transcript files: recorded DNS answers and SMTP dialogues with timings.
+
+A transcript is JSON Lines (gzip-compressed if the name ends in ".gz"), one
+exchange per line:
+
+    {"t":"meta","v":1,"created":"2026-10-19T12:00:00+0000"}
+    {"t":"dns","q":["example.com","MX"],"o":"ok","a":["10 mx.example.com."],"s":0.0123}
+    {"t":"smtp","q":["mx.example.com","user@example.com"],"c":[
+        {"cmd":"connect","s":0.08},{"cmd":"ehlo","s":0.03},
+        {"cmd":"mail","s":0.02,"r":[250,"2.1.0 OK"]},{"cmd":"rcpt","s":0.02,"r":[550,"5.1.1 No such user"]},
+        {"cmd":"quit","s":0.01,"r":[221,"Bye"]}]}
+
+"s" is the duration in seconds, "o" the DNS outcome (ok, nxdomain,
+no_answer, timeout, error) and "x" a failed step as [kind, message, code].
+"""
+
+import gzip
+import json
+import threading
+import time
+from typing import Any, Dict, IO, Iterable, List, Optional, Tuple
+
+VERSION = 1
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    """Open a transcript file for text I/O, gzip-compressed for *.gz."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class TranscriptWriter:
+    """
+    Appends recorded exchanges to a transcript file (thread-safe).
+    """
+
+    def __init__(self, path: str):
+        """
+        Create transcript file.
+
+        Args:
+            path: Output file path (*.gz for gzip compression)
+        """
+        self.path = path
+        self.count = 0
+        self._lock = threading.Lock()
+        self._file = _open(path, "w")
+        self._write_line({"t": "meta", "v": VERSION, "created": time.strftime("%Y-%m-%dT%H:%M:%S%z")})
+
+    def _write_line(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """
+        Append one exchange.
+
+        Args:
+            record: DNS or SMTP record
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            self._write_line(record)
+            self.count += 1
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close file."""
+        self.close()
+
+
+class Transcript:
+    """
+    Recorded exchanges indexed for replay.
+
+    Exchanges with the same key are handed out in recorded order; once they
+    are used up the last one repeats, so a replay that asks more often than
+    the recording did (e.g. with caching disabled) stays deterministic.
+
+    Recorded durations are replayed by wait(). Time skipped by a faster
+    replay is added to clock(), so deadlines driven by it (set_clock in
+    src.utils.deadline) expire where they did in the recording; this is
+    exact for sequential runs.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()):
+        """
+        Index records.
+
+        Args:
+            records: Transcript records (meta records are ignored)
+        """
+        self._entries: Dict[Tuple, List[Dict[str, Any]]] = {}
+        self._cursors: Dict[Tuple, int] = {}
+        self._skipped = 0.0
+        self._lock = threading.Lock()
+        for record in records:
+            kind = record.get("t")
+            if kind in ("dns", "smtp"):
+                self._entries.setdefault((kind, *record["q"]), []).append(record)
+
+    @classmethod
+    def load(cls, path: str) -> "Transcript":
+        """
+        Load transcript file.
+
+        Args:
+            path: Transcript file path
+
+        Returns:
+            Transcript instance
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            IOError: If the file is not a valid transcript
+        """
+        records = []
+        with _open(path, "r") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    if record.get("t") in ("dns", "smtp"):
+                        record["q"] = list(record["q"])
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    raise IOError(f"Invalid transcript {path}, line {line_number}: {e}")
+                records.append(record)
+        return cls(records)
+
+    def next(self, kind: str, *key: Any) -> Optional[Dict[str, Any]]:
+        """
+        Get the next recorded exchange for a key.
+
+        Args:
+            kind: "dns" or "smtp"
+            *key: Query key (domain, rdtype) or (host, recipient)
+
+        Returns:
+            Recorded exchange, or None if the key was never recorded
+        """
+        key = (kind, *key)
+        entries = self._entries.get(key)
+        if not entries:
+            return None
+        with self._lock:
+            index = self._cursors.get(key, 0)
+            self._cursors[key] = index + 1
+        return entries[min(index, len(entries) - 1)]
+
+    def clock(self) -> float:
+        """
+        Monotonic time including recorded time skipped by wait().
+
+        Returns:
+            Seconds
+        """
+        return time.monotonic() + self._skipped
+
+    def wait(self, elapsed: float, timeout: Optional[float], speed: float) -> bool:
+        """
+        Replay a recorded duration.
+
+        Args:
+            elapsed: Recorded duration in seconds
+            timeout: Timeout of the replayed call (None = unlimited)
+            speed: Replay speed (1.0 = recorded speed, 2.0 = twice as fast,
+                0 = no sleeping)
+
+        Returns:
+            True if the recorded duration exceeds the timeout, i.e. the call
+            would have timed out under the current settings
+        """
+        timed_out = timeout is not None and elapsed > timeout
+        duration = timeout if timed_out else elapsed
+        slept = duration / speed if speed > 0 else 0.0
+        if slept:
+            time.sleep(slept)
+        if duration > slept:
+            with self._lock:
+                self._skipped += duration - slept
+        return timed_out
+
+    def __len__(self) -> int:
+        """Number of recorded exchanges."""
+        return sum(len(entries) for entries in self._entries.values())
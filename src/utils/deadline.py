@@ -0,0 +1,102 @@
+"""
+Deadline budgets for cooperative cancellation of verification work.
+"""
+
+import time
+from typing import Callable, Optional
+
+# Time source of all deadlines; a fast transcript replay swaps in a clock that
+# also counts the recorded time it skipped (see src.transport.transcript)
+_clock: Callable[[], float] = time.monotonic
+
+
+def set_clock(clock: Optional[Callable[[], float]] = None) -> None:
+    """
+    Replace the time source of deadlines.
+
+    Args:
+        clock: Monotonic clock in seconds (None = time.monotonic)
+    """
+    global _clock
+    _clock = clock or time.monotonic
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a verification budget runs out before work is finished."""
+
+
+class Deadline:
+    """
+    Absolute point in time by which a unit of work must finish.
+
+    Deadlines are passed down from the batch to every email and from every
+    email to each DNS query and SMTP command, which clamp their own timeouts
+    to the remaining budget.
+    """
+
+    # Smallest timeout handed to sockets/resolvers (0 would mean non-blocking)
+    MIN_TIMEOUT = 0.001
+
+    def __init__(self, seconds: Optional[float] = None, parent: Optional["Deadline"] = None):
+        """
+        Initialize deadline.
+
+        Args:
+            seconds: Budget in seconds from now (None = unlimited)
+            parent: Optional enclosing deadline; the earlier of the two wins
+        """
+        expires_at = _clock() + seconds if seconds is not None else None
+
+        if parent is not None and parent.expires_at is not None:
+            if expires_at is None or parent.expires_at < expires_at:
+                expires_at = parent.expires_at
+
+        self.expires_at = expires_at
+
+    def remaining(self) -> Optional[float]:
+        """
+        Get remaining budget.
+
+        Returns:
+            Seconds left (never negative), or None if unlimited
+        """
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - _clock())
+
+    def expired(self) -> bool:
+        """
+        Check whether the budget has run out.
+
+        Returns:
+            True if deadline has passed, False otherwise
+        """
+        return self.expires_at is not None and _clock() >= self.expires_at
+
+    def clamp(self, timeout: float) -> float:
+        """
+        Limit a per-operation timeout to the remaining budget.
+
+        Args:
+            timeout: Timeout the operation would use without a deadline
+
+        Returns:
+            The smaller of timeout and the remaining budget
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        return max(min(timeout, remaining), self.MIN_TIMEOUT)
+
+    def check(self, stage: str) -> None:
+        """
+        Raise if the budget has run out.
+
+        Args:
+            stage: Name of the step about to start (used in the error message)
+
+        Raises:
+            DeadlineExceeded: If deadline has passed
+        """
+        if self.expired():
+            raise DeadlineExceeded(f"Deadline exceeded before {stage}")
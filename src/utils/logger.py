@@ -1,14 +1,238 @@
 """
 Logging configuration module.
+
+Log records are handed to a queue in the calling thread and formatted and
+written by a background listener thread, so hot paths pay only for a
+queue put. Optional JSON output and per-call-site rate limiting are
+configured in config.py.
 """
 
+import atexit
+import json
 import logging
+import queue
 import sys
-from typing import Optional
+import threading
+import time
+from typing import Dict, Optional, Tuple
 
 import config
 
 
+class JSONFormatter(logging.Formatter):
+    """Formats records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format record as JSON.
+
+        Args:
+            record: Log record
+
+        Returns:
+            JSON line
+        """
+        data = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exc_info"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Drops records from call sites that log faster than the allowed rate.
+
+    Each call site (logger name + line number) gets a token bucket of
+    `burst` records refilled at `rate` records per second. Records at
+    ERROR level and above are never dropped.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize filter.
+
+        Args:
+            rate: Records per second allowed per call site
+            burst: Records allowed in a burst per call site
+        """
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.suppressed = 0
+        self._buckets: Dict[Tuple[str, int], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Decide whether a record passes.
+
+        Args:
+            record: Log record
+
+        Returns:
+            True if the record should be logged
+        """
+        if record.levelno >= logging.ERROR:
+            return True
+
+        key = (record.name, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(self.burst), now]
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens >= 1:
+                bucket[0] = tokens - 1
+                return True
+            bucket[0] = tokens
+            self.suppressed += 1
+            return False
+
+
+class _DeferredQueueHandler(logging.Handler):
+    """
+    Puts records on an in-process queue for the listener thread.
+
+    Like logging.handlers.QueueHandler, the message is merged with its
+    arguments (and the traceback rendered) in the calling thread, so the
+    listener never sees mutable objects that changed after the call. Unlike
+    it, the listener thread is started with the first record, so processes
+    that never log (e.g. --help) neither import logging.handlers nor start
+    a thread.
+    """
+
+    def __init__(self):
+        """Initialize handler with an empty queue."""
+        super().__init__()
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._started = False
+        self._start_lock = threading.Lock()
+
+    def _start_listener(self) -> None:
+        """Start the background listener once."""
+        global _listener
+
+        with self._start_lock:
+            if self._started:
+                return
+            from logging.handlers import QueueListener
+
+            _listener = QueueListener(self.queue, _build_stream_handler(), respect_handler_level=True)
+            _listener.start()
+            atexit.register(shutdown_logging)
+            self._started = True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Enqueue a record.
+
+        Args:
+            record: Log record
+        """
+        if not self._started:
+            self._start_listener()
+        try:
+            record.msg = record.getMessage()
+            record.args = None
+            if record.exc_info:
+                if not record.exc_text:
+                    record.exc_text = _EXC_FORMATTER.formatException(record.exc_info)
+                record.exc_info = None
+            self.queue.put_nowait(record)
+        except Exception:
+            self.handleError(record)
+
+
+# Renders tracebacks in the calling thread (the frames may be gone later)
+_EXC_FORMATTER = logging.Formatter()
+
+_queue_handler: Optional[logging.Handler] = None
+_listener = None
+_rate_limit_filter: Optional[RateLimitFilter] = None
+
+
+def _build_stream_handler() -> logging.Handler:
+    """Create the handler that actually writes records."""
+    handler = logging.StreamHandler(sys.stdout)
+    if config.LOG_JSON:
+        handler.setFormatter(JSONFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(config.LOG_FORMAT))
+    return handler
+
+
+def _get_shared_handler() -> logging.Handler:
+    """
+    Get the handler shared by all loggers, creating it on first use.
+
+    Returns:
+        Queue handler (async mode) or stream handler (sync mode)
+    """
+    global _queue_handler, _rate_limit_filter
+
+    if _queue_handler is not None:
+        return _queue_handler
+
+    if config.LOG_ASYNC:
+        handler: logging.Handler = _DeferredQueueHandler()
+    else:
+        handler = _build_stream_handler()
+
+    if config.LOG_RATE_LIMIT:
+        _rate_limit_filter = RateLimitFilter(config.LOG_RATE_LIMIT, config.LOG_RATE_BURST)
+        handler.addFilter(_rate_limit_filter)
+
+    _queue_handler = handler
+    return handler
+
+
+def time_logging(histogram, *labelvalues: str) -> None:
+    """
+    Add the time callers spend handing records to the shared handler to a histogram.
+
+    In async mode this is the filter and queue put; the writing itself
+    happens on the listener thread. The time overlaps the stage the
+    logging call is made from.
+
+    Args:
+        histogram: Histogram to observe into (e.g. metrics.STAGE_SECONDS)
+        *labelvalues: Label values (e.g. "logging")
+    """
+    handler = _get_shared_handler()
+    handle = handler.handle
+
+    def _timed_handle(record: logging.LogRecord):
+        started_at = time.perf_counter()
+        try:
+            return handle(record)
+        finally:
+            histogram.observe(time.perf_counter() - started_at, *labelvalues)
+
+    handler.handle = _timed_handle
+
+
+def shutdown_logging() -> None:
+    """Write all queued records and stop the background listener."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+    if _rate_limit_filter is not None and _rate_limit_filter.suppressed:
+        sys.stdout.write(f"Logging: {_rate_limit_filter.suppressed} record(s) suppressed by rate limit\n")
+        _rate_limit_filter.suppressed = 0
+
+
 def setup_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     """
     Configure and return a logger instance.
@@ -29,14 +253,7 @@ def setup_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     log_level = level or config.LOG_LEVEL
     logger.setLevel(getattr(logging, log_level.upper()))
 
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, log_level.upper()))
-
-    # Formatter
-    formatter = logging.Formatter(config.LOG_FORMAT)
-    console_handler.setFormatter(formatter)
-
-    logger.addHandler(console_handler)
+    # All loggers share one handler (and one background writer)
+    logger.addHandler(_get_shared_handler())
 
     return logger
@@ -0,0 +1,352 @@
+"""
+In-process counters and latency histograms with Prometheus text export.
+
+Metrics are registered once at module level by the code that updates them
+and rendered in the Prometheus text exposition format, e.g. for the node
+exporter textfile collector.
+"""
+
+import bisect
+import os
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Latency buckets in seconds, from cache hits to SMTP tarpits
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """Format a label set as {a="1",b="2"}."""
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """
+    Monotonic counter, optionally split by labels.
+    """
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """
+        Initialize counter.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            labelnames: Label names, values are passed to inc() in this order
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        """
+        Increment counter.
+
+        Args:
+            *labelvalues: Label values in labelnames order
+            amount: Increment
+        """
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def get(self, *labelvalues: str) -> float:
+        """
+        Get current value.
+
+        Args:
+            *labelvalues: Label values in labelnames order
+
+        Returns:
+            Counter value (0 if never incremented)
+        """
+        return self._values.get(labelvalues, 0)
+
+    def samples(self) -> Iterator[str]:
+        """Yield exposition lines for all label sets."""
+        with self._lock:
+            values = sorted(self._values.items())
+        for labelvalues, value in values:
+            yield f"{self.name}{_format_labels(self.labelnames, labelvalues)} {value:g}"
+
+
+class Histogram:
+    """
+    Cumulative histogram of observed values, optionally split by labels.
+    """
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Initialize histogram.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            labelnames: Label names, values are passed to observe() in this order
+            buckets: Sorted upper bounds (+Inf is implicit)
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # Per label set: [bucket counts..., +Inf count], sum
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """
+        Record one observation.
+
+        Args:
+            value: Observed value (seconds for latencies)
+            *labelvalues: Label values in labelnames order
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labelvalues)
+            if entry is None:
+                entry = self._values[labelvalues] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def totals(self) -> Dict[Tuple[str, ...], Tuple[int, float]]:
+        """
+        Get observation count and sum per label set.
+
+        Returns:
+            Mapping of label values to (count, sum)
+        """
+        with self._lock:
+            return {labels: (sum(counts), total[0]) for labels, (counts, total) in self._values.items()}
+
+    def samples(self) -> Iterator[str]:
+        """Yield exposition lines for all label sets."""
+        with self._lock:
+            values = sorted((labels, (list(counts), total[0])) for labels, (counts, total) in self._values.items())
+        for labelvalues, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                labels = _format_labels(self.labelnames, labelvalues, f'le="{le}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, labelvalues)
+            yield f"{self.name}_sum{labels} {total:g}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together.
+    """
+
+    def __init__(self):
+        """Initialize empty registry."""
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        """Register metric, returning the existing one if the name is taken."""
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """
+        Get or create a counter.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            labelnames: Label names
+
+        Returns:
+            Registered counter
+        """
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """
+        Get or create a histogram.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            labelnames: Label names
+            buckets: Sorted upper bounds
+
+        Returns:
+            Registered histogram
+        """
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """
+        Render all metrics in Prometheus text exposition format.
+
+        Returns:
+            Exposition text
+        """
+        lines = []
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.TYPE}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """
+        Write metrics atomically (temporary file + rename), so scrapers never
+        see a partial file.
+
+        Args:
+            path: Output file path
+        """
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+
+class MetricsFileWriter:
+    """
+    Periodically writes a registry to a file from a background thread.
+    """
+
+    def __init__(self, registry: "MetricsRegistry", path: str, interval: float = 15.0):
+        """
+        Initialize writer.
+
+        Args:
+            registry: Metrics to write
+            path: Output file path
+            interval: Seconds between writes
+        """
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start periodic writes."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Write until stopped."""
+        while not self._stop.wait(self.interval):
+            self._write()
+
+    def _write(self) -> None:
+        """Write the file, logging (not raising) I/O errors such as a full disk."""
+        try:
+            self.registry.write(self.path)
+        except OSError as e:
+            logger.error(f"Cannot write metrics file {self.path}: {e}")
+
+    def stop(self) -> None:
+        """Stop periodic writes and write final values."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self._write()
+
+
+REGISTRY = MetricsRegistry()
+
+# Per-stage wall time, shared by --profile and --metrics-file
+STAGE_SECONDS = REGISTRY.histogram(
+    "email_verifier_stage_seconds", "Wall time spent per processing stage", ("stage",)
+)
+
+# Lookups in MX snapshot/cache, catch-all cache and the result store
+CACHE_LOOKUPS = REGISTRY.counter(
+    "email_verifier_cache_lookups_total", "Cache lookups by cache and outcome (hit/miss)", ("cache", "outcome")
+)
+
+
+def stage_table(histogram: Histogram = STAGE_SECONDS) -> str:
+    """
+    Format per-stage wall time as a text table.
+
+    Args:
+        histogram: Stage histogram
+
+    Returns:
+        Table sorted by total time
+    """
+    totals = sorted(histogram.totals().items(), key=lambda item: item[1][1], reverse=True)
+    grand_total = sum(total for _, (_, total) in totals) or 1e-9
+    lines = [f"{'stage':20s} {'calls':>10s} {'total, s':>10s} {'avg, ms':>10s} {'share':>7s}"]
+    for (stage,), (count, total) in totals:
+        avg_ms = total / count * 1000 if count else 0
+        lines.append(f"{stage:20s} {count:>10} {total:>10.3f} {avg_ms:>10.3f} {total / grand_total * 100:>6.1f}%")
+    return "\n".join(lines)
+
+
+class timed:
+    """
+    Context manager adding elapsed wall time to a histogram.
+
+    Example:
+        with timed(STAGE_SECONDS, "serialization"):
+            writer.write(result)
+    """
+
+    __slots__ = ("histogram", "labelvalues", "started_at")
+
+    def __init__(self, histogram: Histogram, *labelvalues: str):
+        """
+        Initialize timer.
+
+        Args:
+            histogram: Histogram to observe into
+            *labelvalues: Label values
+        """
+        self.histogram = histogram
+        self.labelvalues = labelvalues
+
+    def __enter__(self):
+        """Start timer."""
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Observe elapsed time."""
+        self.histogram.observe(time.perf_counter() - self.started_at, *self.labelvalues)
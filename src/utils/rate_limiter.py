@@ -0,0 +1,97 @@
+"""
+Token bucket rate limiting for outgoing requests.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `burst` requests at once, refilled at `rate` per second.
+
+    acquire() reserves a token and sleeps until it is due, so concurrent
+    callers are served in reservation order and the long-run rate never
+    exceeds `rate`, however many threads share the bucket.
+    """
+
+    def __init__(self, rate: float, burst: float = 1):
+        """
+        Initialize bucket (full).
+
+        Args:
+            rate: Tokens added per second (must be positive)
+            burst: Bucket capacity
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive: {rate}")
+        self.rate = rate
+        self.burst = max(float(burst), 1.0)
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """
+        Take a token, going into debt if the bucket is empty.
+
+        Returns:
+            Seconds until the token is due (0 if available now)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def wait_time(self) -> float:
+        """
+        Get the time until a token is available, without taking it.
+
+        Returns:
+            Seconds until the next token (0 if available now)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            return (1 - self._tokens) / self.rate if self._tokens < 1 else 0.0
+
+    def acquire(self) -> float:
+        """
+        Take a token, sleeping until it is due.
+
+        Returns:
+            Seconds waited
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hand out no new token for the given time (e.g. a server-imposed backoff).
+
+        Args:
+            seconds: Time from now until the next token
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
+
+    def idle(self, now: Optional[float] = None) -> bool:
+        """
+        Check whether the bucket has refilled completely (it can be discarded).
+
+        Args:
+            now: Monotonic time (default: current)
+
+        Returns:
+            True if the bucket is full
+        """
+        with self._lock:
+            now = time.monotonic() if now is None else now
+            return self._tokens + (now - self._updated_at) * self.rate >= self.burst
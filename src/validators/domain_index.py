@@ -0,0 +1,218 @@
+"""
+Static index of disposable, known-bad and role addresses checked before DNS.
+"""
+
+import argparse
+import hashlib
+import sys
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class DomainIndex:
+    """
+    In-memory index of domain categories loaded from local data files.
+
+    Every category is a sorted array of 64-bit hashes, so ~1M domains take
+    8 MB and a lookup is a binary search. Categories are read from
+    `<category>.txt` (one entry per line, `#` comments) or from a compiled
+    `<category>.idx` file, which loads without hashing and is preferred when
+    it is newer than the text file.
+
+    The `role` category holds local parts (admin, info, ...) instead of domains.
+    """
+
+    ROLE_CATEGORY = "role"
+    TYPECODE = "Q"  # unsigned 64-bit
+
+    def __init__(self, categories: Optional[Dict[str, array]] = None):
+        """
+        Initialize index.
+
+        Args:
+            categories: Mapping of category name to sorted array of key hashes
+        """
+        self.categories = categories or {}
+
+    @staticmethod
+    def hash_key(key: str) -> int:
+        """
+        Get stable 64-bit hash of an index key.
+
+        Args:
+            key: Lowercase domain or local part
+
+        Returns:
+            Hash value
+        """
+        return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+    @classmethod
+    def build_array(cls, keys: Iterable[str]) -> array:
+        """
+        Build sorted hash array from index keys.
+
+        Args:
+            keys: Domains or local parts
+
+        Returns:
+            Sorted array of unique key hashes
+        """
+        hashes = {cls.hash_key(key) for key in keys}
+        return array(cls.TYPECODE, sorted(hashes))
+
+    @staticmethod
+    def read_keys(path: Path) -> Iterable[str]:
+        """
+        Read index keys from a text data file.
+
+        Args:
+            path: Path to `<category>.txt`
+
+        Yields:
+            Normalized keys
+        """
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                key = line.split("#", 1)[0].strip().lower().rstrip(".")
+                if key:
+                    yield key
+
+    @classmethod
+    def load(cls, directory: str) -> "DomainIndex":
+        """
+        Load all categories from a data directory.
+
+        Args:
+            directory: Directory with `<category>.txt` / `<category>.idx` files
+
+        Returns:
+            DomainIndex instance (empty if directory does not exist)
+        """
+        path = Path(directory)
+        if not path.is_dir():
+            logger.warning(f"Domain index directory not found: {directory}")
+            return cls()
+
+        categories: Dict[str, array] = {}
+        names = {p.stem for p in path.iterdir() if p.suffix in (".txt", ".idx")}
+
+        for name in sorted(names):
+            txt_path = path / f"{name}.txt"
+            idx_path = path / f"{name}.idx"
+
+            if idx_path.exists() and (not txt_path.exists() or idx_path.stat().st_mtime >= txt_path.stat().st_mtime):
+                hashes = array(cls.TYPECODE)
+                with idx_path.open("rb") as f:
+                    hashes.fromfile(f, idx_path.stat().st_size // hashes.itemsize)
+                if sys.byteorder != "little":
+                    hashes.byteswap()
+            else:
+                hashes = cls.build_array(cls.read_keys(txt_path))
+
+            categories[name] = hashes
+            logger.debug(f"Loaded domain index category '{name}': {len(hashes)} entries")
+
+        return cls(categories)
+
+    @classmethod
+    def compile(cls, directory: str) -> int:
+        """
+        Write compiled `.idx` files for every `.txt` file in a directory.
+
+        Args:
+            directory: Data directory
+
+        Returns:
+            Number of compiled categories
+        """
+        compiled = 0
+        for txt_path in sorted(Path(directory).glob("*.txt")):
+            hashes = cls.build_array(cls.read_keys(txt_path))
+            if sys.byteorder != "little":
+                hashes.byteswap()
+            with txt_path.with_suffix(".idx").open("wb") as f:
+                hashes.tofile(f)
+            logger.info(f"Compiled {txt_path.name}: {len(hashes)} entries")
+            compiled += 1
+        return compiled
+
+    @staticmethod
+    def _contains(hashes: array, value: int) -> bool:
+        """
+        Binary search for a hash in a sorted array.
+
+        Args:
+            hashes: Sorted hash array
+            value: Hash to look for
+
+        Returns:
+            True if present, False otherwise
+        """
+        pos = bisect_left(hashes, value)
+        return pos < len(hashes) and hashes[pos] == value
+
+    def lookup(self, domain: str, local_part: Optional[str] = None) -> Optional[str]:
+        """
+        Find the category of an address.
+
+        The domain and all its parent domains are checked, so listing
+        `mailinator.com` also covers `eu.mailinator.com`, and listing a bare
+        TLD such as `invalid` covers every domain under it.
+
+        Args:
+            domain: Lowercase domain
+            local_part: Optional lowercase local part for the role category
+
+        Returns:
+            Category name, or None if the address is not indexed
+        """
+        labels = domain.split(".")
+        suffix_hashes = [self.hash_key(".".join(labels[i:])) for i in range(len(labels))]
+
+        for name, hashes in self.categories.items():
+            if name == self.ROLE_CATEGORY:
+                continue
+            for value in suffix_hashes:
+                if self._contains(hashes, value):
+                    return name
+
+        role = self.categories.get(self.ROLE_CATEGORY)
+        if local_part and role is not None and self._contains(role, self.hash_key(local_part)):
+            return self.ROLE_CATEGORY
+
+        return None
+
+    def __len__(self) -> int:
+        """Get total number of indexed entries."""
+        return sum(len(hashes) for hashes in self.categories.values())
+
+
+def main() -> int:
+    """
+    Compile text data files into `.idx` files for fast loading.
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    parser = argparse.ArgumentParser(description="Compile domain index data files")
+    parser.add_argument("directory", help="Directory with <category>.txt files")
+    args = parser.parse_args()
+
+    if not Path(args.directory).is_dir():
+        print(f"Error: Directory not found: {args.directory}")
+        return 1
+
+    compiled = DomainIndex.compile(args.directory)
+    print(f"Compiled {compiled} categor{'y' if compiled == 1 else 'ies'} in {args.directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
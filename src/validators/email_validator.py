@@ -3,13 +3,25 @@ Email format validation and domain extraction.
 """
 
 import re
-from typing import Optional, Tuple
+from typing import Iterable, List, NamedTuple, Optional, Tuple
 
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+class ParsedEmail(NamedTuple):
+    """Email address normalized and split in a single pass."""
+
+    is_valid: bool
+    local_part: Optional[str]  # Lowercase local part (None if invalid)
+    domain: Optional[str]  # Lowercase domain (None if invalid)
+
+
+# Shared result for every invalid address
+_INVALID = ParsedEmail(False, None, None)
+
+
 class EmailValidator:
     """
     Validates email format and extracts domain.
@@ -82,6 +94,57 @@ class EmailValidator:
             logger.error(f"Failed to extract domain from '{email}': {e}")
             return None
 
+    @staticmethod
+    def quick_reject(email: str) -> bool:
+        """
+        Reject obviously bad input without running the regex.
+
+        Only rejects strings the regex and length checks would reject too,
+        so it never changes the verdict - it just skips the expensive part.
+
+        Args:
+            email: Normalized (stripped, lowercase) email address
+
+        Returns:
+            True if email is certainly invalid, False if it needs full validation
+        """
+        return (
+            len(email) > 254  # RFC 5321
+            or email.count("@") != 1
+            or " " in email
+            or email[0] == "@"
+            or email[-1] in "@.-"
+        )
+
+    @staticmethod
+    def parse(email: str) -> ParsedEmail:
+        """
+        Normalize, validate and split an email address in a single pass.
+
+        Args:
+            email: Email address to parse
+
+        Returns:
+            ParsedEmail with validity, local part and domain
+        """
+        if not email or not isinstance(email, str):
+            return _INVALID
+
+        normalized = email.strip().lower()
+        if not normalized or EmailValidator.quick_reject(normalized):
+            return _INVALID
+
+        local, _, domain = normalized.partition("@")
+
+        # RFC 5321 local part / RFC 1035 domain length checks
+        if len(local) > 64 or len(domain) > 253:
+            return _INVALID
+
+        if not EmailValidator.EMAIL_REGEX.match(normalized):
+            return _INVALID
+
+        return ParsedEmail(True, local, domain)
+
     @staticmethod
     def validate_and_extract(email: str) -> Tuple[bool, Optional[str]]:
         """
@@ -96,3 +159,54 @@ class EmailValidator:
         is_valid = EmailValidator.validate_format(email)
         domain = EmailValidator.extract_domain(email) if is_valid else None
         return is_valid, domain
+
+    @staticmethod
+    def validate_many(emails: Iterable[str]) -> List[bool]:
+        """
+        Validate format of many email addresses.
+
+        Same checks as validate_and_extract_many, without building results.
+
+        Args:
+            emails: Email addresses to validate
+
+        Returns:
+            List of validity flags in input order
+        """
+        match = EmailValidator.EMAIL_REGEX.match
+        flags = []
+        append = flags.append
+        for email in emails:
+            normalized = email.strip().lower() if isinstance(email, str) else ""
+            local, _, domain = normalized.partition("@")
+            # Length checks reject overlong parts before the regex runs
+            append(len(local) <= 64 and len(domain) <= 253 and match(normalized) is not None)
+        return flags
+
+    @staticmethod
+    def validate_and_extract_many(emails: Iterable[str]) -> List[ParsedEmail]:
+        """
+        Validate and split many email addresses, normalizing each only once.
+
+        Each address is stripped and lowercased once, split once, checked
+        for part lengths and then matched against the regex; the regex
+        lookups are bound once per batch rather than per address.
+
+        Args:
+            emails: Email addresses to validate
+
+        Returns:
+            List of ParsedEmail in input order
+        """
+        match = EmailValidator.EMAIL_REGEX.match
+        results = []
+        append = results.append
+        for email in emails:
+            normalized = email.strip().lower() if isinstance(email, str) else ""
+            local, _, domain = normalized.partition("@")
+            # Length checks reject overlong parts before the regex runs
+            if len(local) > 64 or len(domain) > 253 or not match(normalized):
+                append(_INVALID)
+            else:
+                append(ParsedEmail(True, local, domain))
+        return results
@@ -0,0 +1,3 @@
+"""
+Test suite (pytest), run against the local network simulator.
+"""
@@ -0,0 +1,23 @@
+"""
+Shared fixtures.
+"""
+
+import pytest
+
+from src.netsim.simulator import NetworkSimulator
+
+
+@pytest.fixture
+def simulator():
+    """Network simulator with the default scenario, config pointed at it."""
+    with NetworkSimulator() as sim:
+        sim.configure()
+        yield sim
+
+
+@pytest.fixture
+def service(simulator):
+    """EmailVerificationService over the simulator, without snapshot or result store."""
+    from src.main import EmailVerificationService
+
+    return EmailVerificationService(mx_snapshot_path=None)
@@ -0,0 +1,66 @@
+"""
+Catch-all detection and its per-domain cache.
+"""
+
+import config
+from src.main import EmailVerificationService
+from src.models.result import SMTPStatus, VerificationStatus
+from src.smtp.smtp_verifier import SMTPVerifier
+from src.storage.result_store import ResultStore
+
+
+def _sessions(simulator) -> int:
+    return sum(simulator.smtp.senders.values())
+
+
+def test_catch_all_address_is_not_valid(service):
+    result = service.verify_email("anyone@catchall.sim")
+    assert result.status == VerificationStatus.CATCH_ALL
+    assert result.smtp_status == SMTPStatus.CATCH_ALL
+    assert result.catch_all is True
+
+
+def test_regular_domain_is_verified_per_address(service):
+    result = service.verify_email("user1@ok.sim")
+    assert result.status == VerificationStatus.VALID
+    assert result.catch_all is False
+
+
+def test_catch_all_verdict_is_stored_under_its_own_status(simulator, tmp_path):
+    with ResultStore(str(tmp_path / "results.db")) as store:
+        service = EmailVerificationService(result_store=store, mx_snapshot_path=None)
+        service.verify_email("anyone@catchall.sim")
+        assert store.get("anyone@catchall.sim").status == VerificationStatus.CATCH_ALL
+
+
+def test_verdict_is_cached_per_domain(simulator):
+    verifier = SMTPVerifier()
+    assert verifier.is_catch_all("catchall.sim", ["127.0.0.1"]) is True
+    sessions = _sessions(simulator)
+    assert verifier.is_catch_all("catchall.sim", ["127.0.0.1"]) is True
+    assert _sessions(simulator) == sessions
+
+
+def test_inconclusive_probe_is_not_cached(simulator):
+    verifier = SMTPVerifier()
+    assert verifier.is_catch_all("greylist.sim", ["127.0.0.1"]) is None
+    sessions = _sessions(simulator)
+    assert verifier.is_catch_all("greylist.sim", ["127.0.0.1"]) is None
+    assert _sessions(simulator) == sessions + 1
+
+
+def test_cached_verdict_expires(simulator, monkeypatch):
+    monkeypatch.setattr(config, "CATCH_ALL_CACHE_TTL", 0)
+    verifier = SMTPVerifier()
+    verifier.is_catch_all("catchall.sim", ["127.0.0.1"])
+    sessions = _sessions(simulator)
+    verifier.is_catch_all("catchall.sim", ["127.0.0.1"])
+    assert _sessions(simulator) == sessions + 1
+
+
+def test_cache_is_bounded(simulator, monkeypatch):
+    monkeypatch.setattr(config, "CATCH_ALL_CACHE_SIZE", 2)
+    verifier = SMTPVerifier()
+    for domain in ("catchall.sim", "ok.sim", "reject.sim"):
+        verifier.is_catch_all(domain, ["127.0.0.1"])
+    assert list(verifier._catch_all_cache) == ["ok.sim", "reject.sim"]
@@ -0,0 +1,34 @@
+"""
+Columnar export round trip and bounded dictionaries.
+"""
+
+from src.models.result import SMTPStatus, VerificationResult, VerificationStatus
+from src.output.columnar_writer import ResultColumnarReader, ResultColumnarWriter
+
+
+def _results(count):
+    for i in range(count):
+        yield VerificationResult(
+            email=f"user{i}@d{i % 3}.sim",
+            status=VerificationStatus.SMTP_REJECTED if i % 2 else VerificationStatus.VALID,
+            smtp_status=SMTPStatus.REJECTED if i % 2 else SMTPStatus.VERIFIED,
+            domain=f"d{i % 3}.sim",
+            mx_records=("mx1.sim", "mx2.sim"),
+            smtp_response=f"250 2.0.0 Ok: queued as {i:08X}",
+            catch_all=False if i % 5 else None,
+        )
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "results.pzrc")
+    with ResultColumnarWriter(path, row_group_size=100) as writer:
+        writer.write_many(_results(1000))
+    assert list(ResultColumnarReader(path)) == list(_results(1000))
+    assert ResultColumnarReader(path).read_summary()["total"] == 1000
+
+
+def test_dictionaries_are_bounded_by_row_group(tmp_path):
+    with ResultColumnarWriter(str(tmp_path / "results.pzrc"), row_group_size=100) as writer:
+        for result in _results(1000):
+            writer.write(result)
+            assert all(len(entries) <= 100 for entries in writer._dicts)
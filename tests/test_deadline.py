@@ -0,0 +1,58 @@
+"""
+Per-email and per-batch deadline budgets.
+"""
+
+import time
+
+import pytest
+
+import config
+from src.main import EmailVerificationService
+from src.models.result import VerificationStatus
+from src.smtp.smtp_verifier import SMTPVerifier
+from src.utils.deadline import Deadline, DeadlineExceeded
+
+
+def test_budget_running_out_mid_session_raises(simulator):
+    # smtplib reports the read timeout during RCPT TO as SMTPServerDisconnected
+    verifier = SMTPVerifier()
+    with pytest.raises(DeadlineExceeded):
+        verifier.verify_email("a@tarpit.sim", "127.0.0.1", Deadline(0.5))
+
+
+def test_session_timeout_without_deadline_is_unavailable(simulator):
+    is_valid, response, error = SMTPVerifier(timeout=0.5).verify_email("a@tarpit.sim", "127.0.0.1")
+    assert not is_valid and response is None
+    assert "disconnected" in error
+
+
+def test_smtp_tarpit_is_deadline_exceeded(simulator, monkeypatch):
+    monkeypatch.setattr(config, "ENABLE_CATCH_ALL_DETECTION", False)
+    service = EmailVerificationService(email_deadline=1.0, mx_snapshot_path=None)
+    started_at = time.monotonic()
+    result = service.verify_email("a@tarpit.sim")
+    assert result.status == VerificationStatus.DEADLINE_EXCEEDED
+    assert time.monotonic() - started_at < 2.0
+
+
+def test_silent_dns_is_deadline_exceeded(simulator):
+    service = EmailVerificationService(email_deadline=0.5, mx_snapshot_path=None)
+    result = service.verify_email("a@dnsdrop.sim")
+    assert result.status == VerificationStatus.DEADLINE_EXCEEDED
+
+
+def test_batch_deadline_skips_remaining_emails(simulator):
+    service = EmailVerificationService(batch_deadline=0.5, mx_snapshot_path=None)
+    results = service.verify_bulk(["user1@ok.sim", "a@tarpit.sim", "user2@ok.sim", "user3@ok.sim"])
+    assert [result.status for result in results] == [
+        VerificationStatus.VALID,
+        VerificationStatus.DEADLINE_EXCEEDED,
+        VerificationStatus.DEADLINE_EXCEEDED,
+        VerificationStatus.DEADLINE_EXCEEDED,
+    ]
+    assert results[-1].error_message == "Batch deadline exceeded before verification started"
+
+
+def test_unlimited_budget_verifies_normally(service):
+    assert service.verify_email("user1@ok.sim").status == VerificationStatus.VALID
+    assert service.verify_email("nobody@ok.sim").status == VerificationStatus.SMTP_REJECTED
@@ -0,0 +1,57 @@
+"""
+EmailValidator verdicts.
+"""
+
+import random
+import string
+
+import pytest
+
+from src.validators.email_validator import EmailValidator, ParsedEmail
+
+
+@pytest.mark.parametrize(
+    "email, expected",
+    [
+        ("User@Example.COM ", ParsedEmail(True, "user", "example.com")),
+        ("first.last+tag@sub.example.org", ParsedEmail(True, "first.last+tag", "sub.example.org")),
+        ("", ParsedEmail(False, None, None)),
+        ("   ", ParsedEmail(False, None, None)),
+        ("no-at-sign", ParsedEmail(False, None, None)),
+        ("two@@at.com", ParsedEmail(False, None, None)),
+        ("@nolocal.com", ParsedEmail(False, None, None)),
+        ("trailing@dot.", ParsedEmail(False, None, None)),
+        ("x@-bad.com", ParsedEmail(False, None, None)),
+        ("a" * 65 + "@example.com", ParsedEmail(False, None, None)),
+        (None, ParsedEmail(False, None, None)),
+    ],
+)
+def test_parse(email, expected):
+    assert EmailValidator.parse(email) == expected
+
+
+def _fuzzed_emails():
+    rng = random.Random(7)
+    alphabet = string.ascii_letters + string.digits + "@.-_ +!"
+    emails = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24))) for _ in range(20_000)]
+    return emails + ["a" * 64 + "@example.com", "x@" + "a" * 254, "a@b", None]
+
+
+def test_batch_agrees_with_per_call_checks():
+    emails = _fuzzed_emails()
+    for email, parsed in zip(emails, EmailValidator.validate_and_extract_many(emails)):
+        assert parsed == EmailValidator.parse(email), email
+        assert parsed.is_valid == EmailValidator.validate_format(email), email
+        if email is not None:
+            assert (parsed.is_valid, parsed.domain) == EmailValidator.validate_and_extract(email), email
+
+
+def test_validate_many_agrees_with_validate_format():
+    emails = _fuzzed_emails()
+    assert EmailValidator.validate_many(emails) == [EmailValidator.validate_format(email) for email in emails]
+
+
+def test_quick_reject_never_rejects_a_valid_address():
+    for email in ("a@b.c", "user@example.com", "x-y@z-w.org"):
+        assert not EmailValidator.quick_reject(email)
+        assert EmailValidator.validate_format(email)
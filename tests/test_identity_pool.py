@@ -0,0 +1,72 @@
+"""
+Sending identity rotation, cooldown, rate limits and deadlines.
+"""
+
+import time
+
+import pytest
+
+from src.netsim.scenario import DEFAULT_SCENARIO, Scenario
+from src.netsim.simulator import NetworkSimulator
+from src.smtp.identity_pool import IdentityPool
+from src.smtp.smtp_verifier import SMTPVerifier
+from src.utils.deadline import Deadline, DeadlineExceeded
+
+IDENTITIES = [
+    {"source_address": "127.0.0.2", "helo": "a.sim", "from_email": "probe@a.sim"},
+    {"source_address": "127.0.0.3", "helo": "b.sim", "from_email": "probe@b.sim"},
+]
+
+
+def test_probes_rotate_over_identities(simulator):
+    verifier = SMTPVerifier(identities=IdentityPool(IDENTITIES))
+    for i in range(4):
+        assert verifier.verify_email(f"user{i}@ok.sim", "127.0.0.1")[0]
+    assert simulator.smtp.senders == {
+        ("127.0.0.2", "a.sim", "probe@a.sim"): 2,
+        ("127.0.0.3", "b.sim", "probe@b.sim"): 2,
+    }
+
+
+def test_blocked_identity_cools_down():
+    scenario = Scenario(dict(DEFAULT_SCENARIO, smtp_blocked_sources=["127.0.0.3"]))
+    with NetworkSimulator(scenario) as sim:
+        sim.configure()
+        pool = IdentityPool(IDENTITIES, max_failures=1, cooldown=60)
+        verifier = SMTPVerifier(identities=pool)
+        results = [verifier.verify_email(f"user{i}@ok.sim", "127.0.0.1")[0] for i in range(5)]
+
+    # The second probe hits the blocklist, the rest avoid the blocked source
+    assert results == [True, False, True, True, True]
+    assert pool.identities[1].cooldown_until > time.monotonic()
+    assert sim.smtp.senders == {("127.0.0.2", "a.sim", "probe@a.sim"): 4}
+
+
+def test_identity_rate_is_enforced():
+    pool = IdentityPool([{"source_address": "127.0.0.2"}], rate=20)
+    started_at = time.monotonic()
+    for _ in range(5):
+        pool.acquire()
+    # One token at once, then one every 50 ms
+    assert time.monotonic() - started_at >= 0.19
+
+
+def test_acquire_does_not_wait_past_deadline():
+    pool = IdentityPool([{"source_address": "127.0.0.2"}], rate=1)
+    pool.acquire()
+    started_at = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        pool.acquire(Deadline(0.1))
+    assert time.monotonic() - started_at < 0.05
+    # The refused wait took no token
+    assert pool.identities[0].bucket.wait_time() <= 1.0
+
+
+def test_verifier_reports_rate_wait_past_deadline(simulator):
+    pool = IdentityPool([{"source_address": "127.0.0.2"}], rate=1)
+    verifier = SMTPVerifier(identities=pool)
+    assert verifier.verify_email("user1@ok.sim", "127.0.0.1")[0]
+    started_at = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        verifier.verify_email("user2@ok.sim", "127.0.0.1", Deadline(0.1))
+    assert time.monotonic() - started_at < 0.05
@@ -0,0 +1,60 @@
+"""
+Streamed JSON document layout.
+"""
+
+import json
+import os
+import threading
+
+import pytest
+
+from src.models.result import SMTPStatus, VerificationResult, VerificationStatus
+from src.output.json_writer import ResultJSONWriter, orjson
+
+BACKENDS = ["json"] + (["orjson"] if orjson is not None else [])
+
+RESULTS = [
+    VerificationResult(
+        email="user1@ok.sim",
+        status=VerificationStatus.VALID,
+        smtp_status=SMTPStatus.VERIFIED,
+        domain="ok.sim",
+        mx_records=("mx1.ok.sim", "mx2.ok.sim"),
+        smtp_response="250 OK",
+    ),
+    VerificationResult(email="пользователь@nx.sim", status=VerificationStatus.DOMAIN_NOT_FOUND, domain="nx.sim"),
+]
+
+
+def _baseline(results):
+    """Layout written by json.dump before results were streamed."""
+    output = {"total": len(results), "results": [result.to_dict() for result in results]}
+    return json.dumps(output, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("results", [RESULTS, []])
+def test_document_matches_baseline_layout(tmp_path, backend, results):
+    path = tmp_path / "results.json"
+    with ResultJSONWriter(str(path), fmt="json", backend=backend) as writer:
+        writer.write_many(results)
+
+    text = path.read_text(encoding="utf-8")
+    assert list(json.loads(text)) == ["total", "results"]
+    # Identical apart from the padding reserved for the total
+    assert "\n".join(line.rstrip() for line in text.split("\n")) == _baseline(results)
+
+
+def test_unseekable_output_puts_total_last(tmp_path):
+    path = str(tmp_path / "pipe")
+    os.mkfifo(path)
+    chunks = []
+    reader = threading.Thread(target=lambda: chunks.append(open(path, "rb").read()))
+    reader.start()
+    with ResultJSONWriter(path, fmt="json", backend="json") as writer:
+        writer.write_many(RESULTS)
+    reader.join()
+
+    data = json.loads(chunks[0])
+    assert list(data) == ["results", "total"]
+    assert data["total"] == 2
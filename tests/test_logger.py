@@ -0,0 +1,58 @@
+"""Tests for the deferred queue log handler."""
+
+import json
+import logging
+import sys
+
+import src.utils.logger as logger_module
+from src.utils.logger import JSONFormatter, _DeferredQueueHandler, time_logging
+from src.utils.metrics import Histogram
+
+
+def _handler():
+    handler = _DeferredQueueHandler()
+    handler._started = True  # keep records on the queue
+    return handler
+
+
+def test_message_is_formatted_at_call_time():
+    handler = _handler()
+    items = ["a"]
+    record = logging.LogRecord("t", logging.INFO, __file__, 1, "items: %s", (items,), None)
+    handler.emit(record)
+    items.append("b")
+
+    queued = handler.queue.get_nowait()
+    assert queued.getMessage() == "items: ['a']"
+    assert queued.args is None
+
+
+def test_traceback_is_rendered_at_call_time():
+    handler = _handler()
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("t", logging.ERROR, __file__, 1, "failed", (), sys.exc_info())
+    handler.emit(record)
+
+    queued = handler.queue.get_nowait()
+    assert queued.exc_info is None
+    assert "ValueError: boom" in queued.exc_text
+    assert "ValueError: boom" in logging.Formatter().format(queued)
+    assert "ValueError: boom" in json.loads(JSONFormatter().format(queued))["exc_info"]
+
+
+def test_time_logging_records_handler_time(monkeypatch):
+    handler = _handler()
+    monkeypatch.setattr(logger_module, "_queue_handler", handler)
+    histogram = Histogram("test_stage_seconds", "Test stages", ("stage",))
+    time_logging(histogram, "logging")
+
+    logger = logging.getLogger("tests.time_logging")
+    logger.addHandler(handler)
+    try:
+        logger.warning("one")
+        logger.warning("two")
+    finally:
+        logger.removeHandler(handler)
+    assert histogram.totals()[("logging",)][0] == 2
@@ -0,0 +1,17 @@
+"""Tests for command-line argument handling."""
+
+import sys
+
+from src.main import main
+
+
+def test_missing_bot_token_leaves_outputs_untouched(tmp_path, monkeypatch):
+    output = tmp_path / "results.csv"
+    output.write_text("previous run\n")
+    monkeypatch.delenv("TELEGRAM_BOT_TOKEN", raising=False)
+    monkeypatch.setattr(
+        sys, "argv", ["main.py", "--emails", "user@ok.sim", "--csv", str(output), "--telegram-chat", "42"]
+    )
+
+    assert main() == 1
+    assert output.read_text() == "previous run\n"
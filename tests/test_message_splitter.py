@@ -0,0 +1,51 @@
+"""
+Message splitter invariants: the UTF-16 limit, order and balanced markup.
+"""
+
+import re
+
+from src.telegram.message_splitter import MESSAGE_LIMIT, MessageSplitter, utf16_len
+
+
+def _text() -> str:
+    lines = []
+    for i in range(200):
+        words = " ".join(f"word{j}😀" for j in range(i % 17 + 1))
+        lines.append(f"{i}: {words}\n")
+    lines.append("x" * 130 + "😀" * 70 + "\n")  # one word longer than a message
+    return "".join(lines)
+
+
+def test_messages_fit_limit_in_utf16_units():
+    messages = MessageSplitter(limit=100).split(_text())
+    assert len(messages) > 1
+    assert all(utf16_len(message) <= 100 for message in messages)
+    # Astral characters count twice, so a length in code points would pass where Telegram refuses
+    assert any(len(message) < utf16_len(message) for message in messages)
+
+
+def test_messages_keep_text_and_order():
+    text = _text()
+    assert "".join(MessageSplitter(limit=100).split(text)) == text
+
+
+def test_streamed_split_matches_whole_split():
+    text = _text()
+    pieces = [text[i:i + 37] for i in range(0, len(text), 37)]
+    assert list(MessageSplitter(limit=100).split_stream(pieces)) == MessageSplitter(limit=100).split(text)
+
+
+def test_short_text_is_one_message():
+    assert MessageSplitter().split("hello\nworld\n") == ["hello\nworld\n"]
+    assert utf16_len("😀" * (MESSAGE_LIMIT // 2)) == MESSAGE_LIMIT
+
+
+def test_html_formatting_is_reopened_in_every_message():
+    text = "<b>" + " ".join(f"bold{i}" for i in range(100)) + "</b>\n"
+    messages = MessageSplitter(limit=60, parse_mode="HTML").split(text)
+    assert len(messages) > 1
+    for message in messages:
+        assert message.startswith("<b>") and message.rstrip().endswith("</b>")
+        assert utf16_len(re.sub(r"<[^>]+>", "", message)) <= 60
+    words = re.sub(r"<[^>]+>", "", " ".join(messages)).split()
+    assert words == [f"bold{i}" for i in range(100)]
@@ -0,0 +1,20 @@
+"""Tests for the metrics file writer."""
+
+from src.utils.metrics import MetricsFileWriter, MetricsRegistry
+
+
+def test_stop_survives_write_errors(tmp_path):
+    registry = MetricsRegistry()
+    registry.counter("test_total", "Test counter").inc()
+    writer = MetricsFileWriter(registry, str(tmp_path / "missing" / "metrics.prom"), interval=0.01)
+    writer.start()
+    writer.stop()  # must not raise
+
+
+def test_stop_writes_final_values(tmp_path):
+    registry = MetricsRegistry()
+    registry.counter("test_total", "Test counter").inc()
+    path = tmp_path / "metrics.prom"
+    writer = MetricsFileWriter(registry, str(path))
+    writer.stop()
+    assert "test_total 1" in path.read_text()
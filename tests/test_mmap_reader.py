@@ -0,0 +1,59 @@
+"""
+Chunking of memory-mapped line files.
+"""
+
+import pytest
+
+from src.ingest import mmap_reader
+from src.ingest.mmap_reader import count_lines, iter_chunks, iter_line_batches, iter_lines, split_ranges
+
+LINES = ["a@ok.sim", "пользователь@ok.sim", "", "c@ok.sim", "dd@ok.sim"]
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+@pytest.mark.parametrize("chunk_size", [4, 7, 64])
+def test_chunks_are_bounded_and_end_on_lines(tmp_path, newline, chunk_size):
+    path = tmp_path / "emails.txt"
+    path.write_bytes(newline.join(LINES).encode())
+
+    chunks = list(iter_chunks(str(path), chunk_size=chunk_size))
+    assert all(len(chunk.encode()) <= chunk_size for chunk in chunks)
+    assert "".join(chunks) == "\n".join(LINES)
+
+    batches = list(iter_line_batches(str(path), chunk_size=32))
+    assert [line for batch in batches for line in batch] == [line for line in LINES if line]
+    assert count_lines(str(path)) == len(LINES)
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+@pytest.mark.parametrize("parts", [2, 3, 7, 40])
+def test_ranges_cover_each_line_once(tmp_path, newline, parts):
+    path = tmp_path / "emails.txt"
+    path.write_bytes((newline.join(LINES) + newline).encode())
+
+    lines = []
+    for start, end in split_ranges(str(path), parts):
+        lines.extend(iter_lines(str(path), start, end))
+    assert lines == [line for line in LINES if line]
+    assert sum(count_lines(str(path), start, end) for start, end in split_ranges(str(path), parts)) == len(LINES)
+
+
+def test_overlong_line_is_skipped_without_reading_it_whole(tmp_path, monkeypatch):
+    path = tmp_path / "emails.txt"
+    path.write_bytes(b"a@ok.sim\r" + "я".encode() * 50 + b"\rb@ok.sim\r")
+
+    decoded = []
+    decode = mmap_reader._decode
+
+    def recording_decode(mm, start, end, errors):
+        decoded.append(end - start)
+        return decode(mm, start, end, errors)
+
+    monkeypatch.setattr(mmap_reader, "_decode", recording_decode)
+
+    batches = list(iter_line_batches(str(path), chunk_size=16))
+    assert [line for batch in batches for line in batch] == ["a@ok.sim", "b@ok.sim"]
+    assert max(decoded) <= 16
+
+    chunks = list(iter_chunks(str(path), chunk_size=16, errors="strict"))
+    assert "".join(chunks) == "a@ok.sim\n" + "я" * 50 + "\nb@ok.sim\n"
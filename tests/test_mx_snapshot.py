@@ -0,0 +1,30 @@
+"""
+Background MX snapshot refresh next to transcript recording and replay.
+"""
+
+import time
+
+from src.dns.mx_checker import MXChecker
+from src.dns.mx_snapshot import MXSnapshot
+from src.transport.dns_transport import LiveDNSTransport, RecordingDNSTransport, ReplayDNSTransport
+from src.transport.transcript import Transcript, TranscriptWriter
+
+
+def _snapshot():
+    return MXSnapshot({"ok.sim": (("stale.ok.sim",), time.time() + 3600)}, refresh_ttl=3600)
+
+
+def test_refresh_is_not_recorded(simulator, tmp_path):
+    path = str(tmp_path / "dns.jsonl")
+    with TranscriptWriter(path) as writer:
+        checker = MXChecker(snapshot=_snapshot(), transport=RecordingDNSTransport(LiveDNSTransport(), writer))
+        assert checker.refresh_snapshot() == 1
+    assert checker.snapshot.get("ok.sim") == ("127.0.0.1",)
+    assert len(Transcript.load(path)) == 0
+
+
+def test_refresh_does_not_run_during_replay():
+    checker = MXChecker(snapshot=_snapshot(), transport=ReplayDNSTransport(Transcript(), speed=0))
+    checker.start_snapshot_refresh(60)
+    assert checker._refresh_thread is None
+    assert checker.snapshot.get("ok.sim") == ("stale.ok.sim",)
@@ -0,0 +1,123 @@
+"""
+Outbox delivery: deduplication, coalescing, per-chat order, backoff and failures.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.netsim.scenario import DEFAULT_SCENARIO, Scenario
+from src.netsim.simulator import NetworkSimulator
+from src.telegram.message_splitter import MESSAGE_LIMIT, utf16_len
+from src.telegram.outbox import Outbox
+from src.telegram.telegram_client import TelegramClient
+
+
+class RecordingClient:
+    """Client stand-in that records sends and fails chosen chats."""
+
+    def __init__(self, failing=None):
+        self.sent = []
+        self.failing = failing or {}  # chat_id -> retryable
+        self._lock = threading.Lock()
+
+    def try_send_message(self, chat_id, text, parse_mode=None):
+        with self._lock:
+            self.sent.append((chat_id, text))
+        if chat_id in self.failing:
+            return False, "failed", self.failing[chat_id]
+        return True, None, False
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    with Outbox(str(tmp_path / "outbox.db")) as outbox:
+        yield outbox
+
+
+def test_same_key_is_queued_once(outbox):
+    assert outbox.enqueue("1", ["a", "b"], key="report-1") == 2
+    assert outbox.enqueue("1", ["a", "b"], key="report-1") == 0
+    assert outbox.counts()["pending"] == 2
+
+
+def test_sent_key_is_not_queued_again(simulator, outbox):
+    outbox.enqueue("1", ["a"], key="report-1")
+    outbox.drain(TelegramClient("token"))
+    assert outbox.enqueue("1", ["a"], key="report-1") == 0
+    assert outbox.counts() == {"pending": 0, "sent": 1, "failed": 0}
+
+
+def test_small_messages_are_coalesced(simulator, outbox):
+    outbox.enqueue("1", [f"line {i}" for i in range(50)])
+    stats = outbox.drain(TelegramClient("token"))
+    assert stats == {"sent": 50, "requests": 1, "retried": 0, "failed": 0}
+    assert simulator.bot_api.stats["sendMessage"] == 1
+
+
+def test_sends_keep_order_and_limit(outbox):
+    texts = [f"{i}:" + "x" * (i * 97 % 1500) for i in range(40)]
+    outbox.enqueue("1", texts)
+    outbox.enqueue("2", ["other chat"])
+    client = RecordingClient()
+    outbox.drain(client)
+
+    chat_texts = [text for chat_id, text in client.sent if chat_id == "1"]
+    assert all(utf16_len(text) <= MESSAGE_LIMIT for text in chat_texts)
+    assert Outbox.SEPARATOR.join(chat_texts) == Outbox.SEPARATOR.join(texts)
+    assert ("2", "other chat") in client.sent
+
+
+def test_long_message_is_split(simulator, outbox):
+    assert outbox.enqueue("1", ["word " * 2000]) == 3
+    assert outbox.drain(TelegramClient("token"))["sent"] == 3
+
+
+def test_server_errors_back_off_and_hold_the_chat():
+    scenario = Scenario(dict(DEFAULT_SCENARIO, bot_api={"error_rate": 1}))
+    with NetworkSimulator(scenario) as sim, Outbox(":memory:") as outbox:
+        sim.configure()
+        outbox.enqueue("1", ["first"])
+        outbox.enqueue("1", ["x" * MESSAGE_LIMIT])  # cannot be coalesced with "first"
+        client = TelegramClient("token")
+
+        started_at = time.time()
+        stats = outbox.drain(client)
+        assert stats == {"sent": 0, "requests": 1, "retried": 1, "failed": 0}
+        # The message after the failed one waits for the retry as well
+        assert sim.bot_api.stats["sendMessage"] == 1
+
+        attempts, next_attempt_at = outbox._conn.execute(
+            "SELECT attempts, next_attempt_at FROM outbox ORDER BY id LIMIT 1"
+        ).fetchone()
+        assert attempts == 1
+        assert next_attempt_at >= started_at + Outbox.RETRY_BASE
+
+        # Nothing is due before the backoff ends
+        assert outbox.drain(client)["requests"] == 0
+
+
+def test_failing_chat_does_not_block_others(outbox):
+    outbox.enqueue("a", ["to a"])
+    outbox.enqueue("b", ["to b"])
+    client = RecordingClient(failing={"a": True})
+    stats = outbox.drain(client)
+    assert stats["sent"] == 1 and stats["retried"] == 1
+
+
+def test_rejected_message_fails_at_once(simulator, outbox):
+    outbox.enqueue("1", [" "])  # the API refuses empty text
+    stats = outbox.drain(TelegramClient("token"))
+    assert stats["failed"] == 1
+    assert outbox.counts()["failed"] == 1
+
+
+def test_retries_end_after_max_attempts(outbox, monkeypatch):
+    monkeypatch.setattr(Outbox, "RETRY_BASE", 0)
+    outbox.enqueue("1", ["text"])
+    client = RecordingClient(failing={"1": True})
+    # Without backoff every retry is due at once, within the same drain
+    outbox.drain(client)
+    assert len(client.sent) == Outbox.MAX_ATTEMPTS
+    assert outbox.counts()["failed"] == 1
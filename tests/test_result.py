@@ -0,0 +1,50 @@
+"""
+VerificationResult texts shown on the console.
+"""
+
+import pytest
+
+from src.models.result import VerificationResult, VerificationStatus
+
+
+@pytest.mark.parametrize(
+    "status, mx_records, text",
+    [
+        (VerificationStatus.VALID, ["mx.ok.sim"], "домен валиден"),
+        (VerificationStatus.CATCH_ALL, ["mx.ok.sim"], "домен валиден"),
+        (VerificationStatus.SMTP_REJECTED, ["mx.ok.sim"], "домен валиден"),
+        (VerificationStatus.INVALID_FORMAT, None, "домен отсутствует"),
+        (VerificationStatus.DOMAIN_NOT_FOUND, None, "домен отсутствует"),
+        (VerificationStatus.NO_MX_RECORDS, None, "MX-записи отсутствуют или некорректны"),
+        (VerificationStatus.BLOCKED_DOMAIN, None, "домен в списке одноразовых/заблокированных"),
+        (VerificationStatus.DEADLINE_EXCEEDED, None, "домен не проверен (истёк бюджет времени)"),
+        (VerificationStatus.DEADLINE_EXCEEDED, ["mx.ok.sim"], "домен валиден"),
+    ],
+)
+def test_domain_status(status, mx_records, text):
+    result = VerificationResult(email="a@ok.sim", status=status, mx_records=mx_records)
+    assert result.get_domain_status() == text
+
+
+def test_every_status_has_a_readable_text():
+    for status in VerificationStatus:
+        text = VerificationResult(email="a@ok.sim", status=status).get_human_readable_status()
+        assert text != "неизвестный статус"
+
+
+def test_results_of_a_domain_share_the_cached_mx_tuple(simulator):
+    from src.dns.mx_checker import MXChecker
+
+    checker = MXChecker()
+    first, second = (
+        VerificationResult(email=email, status=VerificationStatus.VALID, mx_records=checker.get_mx_records("ok.sim"))
+        for email in ("a@ok.sim", "b@ok.sim")
+    )
+    assert first.mx_records == ("127.0.0.1",)
+    assert first.mx_records is second.mx_records
+
+
+def test_mx_list_is_stored_as_tuple():
+    result = VerificationResult(email="a@ok.sim", status=VerificationStatus.VALID, mx_records=["mx1", "mx2"])
+    assert result.mx_records == ("mx1", "mx2")
+    assert result.to_dict()["mx_records"] == ["mx1", "mx2"]
@@ -0,0 +1,46 @@
+"""Record/replay fidelity of the SMTP transport."""
+
+import smtplib
+
+import pytest
+
+from src.smtp.smtp_verifier import SMTPVerifier
+from src.transport.smtp_transport import LiveSMTPTransport, RecordingSMTPTransport, ReplaySMTPTransport
+from src.transport.transcript import Transcript, TranscriptWriter
+
+EMAILS = ["user1@ok.sim", "nobody@ok.sim", "a@reject.sim", "a@drop.sim", "a@tarpit.sim"]
+
+
+@pytest.fixture
+def recorded(simulator, tmp_path):
+    """Live results for EMAILS and the transcript they were recorded to."""
+    path = str(tmp_path / "smtp.jsonl")
+    with TranscriptWriter(path) as writer:
+        verifier = SMTPVerifier(timeout=0.5, transport=RecordingSMTPTransport(LiveSMTPTransport(), writer))
+        results = {email: verifier.verify_email(email, "127.0.0.1") for email in EMAILS}
+    return results, path
+
+
+@pytest.mark.parametrize("email", EMAILS)
+def test_replay_matches_live(recorded, email):
+    results, path = recorded
+    verifier = SMTPVerifier(timeout=0.5, transport=ReplaySMTPTransport(Transcript.load(path), speed=0))
+    assert verifier.verify_email(email, "127.0.0.1") == results[email]
+
+
+def test_step_slower_than_timeout_replays_as_smtplib_read_timeout():
+    session = {
+        "t": "smtp",
+        "q": ["mx.example", "a@example"],
+        "c": [
+            {"cmd": "connect", "s": 0.01},
+            {"cmd": "ehlo", "s": 0.01},
+            {"cmd": "mail", "s": 0.01, "r": [250, "OK"]},
+            {"cmd": "rcpt", "s": 2.0, "r": [250, "OK"]},
+        ],
+    }
+    smtp = ReplaySMTPTransport(Transcript([session]), speed=0).connect("mx.example", 25, 0.5, "a@example")
+    smtp.ehlo_or_helo_if_needed()
+    smtp.mail("probe@example")
+    with pytest.raises(smtplib.SMTPServerDisconnected, match="timed out"):
+        smtp.rcpt("a@example")